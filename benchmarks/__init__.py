@@ -0,0 +1,24 @@
+"""
+Abjad IDE benchmarks.
+
+Times the Python hot paths of the IDE on the bundled red, blue and green
+scores. Each ``bench_*`` module defines classes with optional ``setup()`` and
+``teardown()`` methods and any number of ``time_*()`` methods (the layout
+``asv`` uses). Run all benchmarks from the repository root:
+
+    python -m benchmarks
+
+Save medians and fail on regressions against saved medians:
+
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --compare baseline.json
+
+``bench_scaling`` times the same paths on a large synthetic score written by
+``benchmarks.synthetic.make_score()``; the generator also runs from the
+command line to write scores for stress tests:
+
+    python -m benchmarks.synthetic DIRECTORY --segments 64 --staves 12
+
+Benchmarks that would run LilyPond or LaTeX run them through
+``benchmarks.stubs.stub_executables()``.
+"""
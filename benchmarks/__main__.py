@@ -0,0 +1,102 @@
+"""
+Runs benchmarks.
+"""
+import argparse
+import importlib
+import inspect
+import json
+import pkgutil
+import statistics
+import sys
+import time
+import typing
+
+import benchmarks
+
+
+def _get_benchmarks(pattern=None) -> typing.List[typing.Tuple[str, type, str]]:
+    triples = []
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for class_name, class_ in inspect.getmembers(module, inspect.isclass):
+            if class_.__module__ != module.__name__ or class_name.startswith("_"):
+                continue
+            for name in sorted(dir(class_)):
+                if not name.startswith("time_"):
+                    continue
+                label = f"{module_info.name}.{class_name}.{name}"
+                if pattern is None or pattern in label:
+                    triples.append((label, class_, name))
+    return triples
+
+
+def _run_benchmark(class_, name, repeat) -> typing.List[float]:
+    instance = class_()
+    try:
+        if hasattr(instance, "setup"):
+            instance.setup()
+        method = getattr(instance, name)
+        number = getattr(instance, "number", 1)
+        repeat = getattr(instance, "repeat", repeat)
+        method()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                method()
+            times.append((time.perf_counter() - start) / number)
+    finally:
+        if hasattr(instance, "teardown"):
+            instance.teardown()
+    return times
+
+
+def main(arguments=None) -> int:
+    """
+    Runs benchmarks; compares medians to baseline.
+
+    Returns 1 when any benchmark regressed; otherwise 0.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="pattern", help="run benchmarks matching pattern")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--repeat", default=5, type=int, help="timings per benchmark")
+    parser.add_argument("--save", help="JSON file to write medians to")
+    parser.add_argument(
+        "--threshold",
+        default=0.25,
+        type=float,
+        help="fraction slower than baseline that counts as regression",
+    )
+    arguments = parser.parse_args(arguments)
+    baseline: typing.Dict[str, float] = {}
+    if arguments.compare:
+        with open(arguments.compare) as pointer:
+            baseline = json.load(pointer)
+    medians, regressions = {}, []
+    for label, class_, name in _get_benchmarks(arguments.pattern):
+        times = _run_benchmark(class_, name, arguments.repeat)
+        median = statistics.median(times)
+        medians[label] = median
+        line = f"{label:<64} median {1000 * median:9.2f} ms"
+        line += f"  min {1000 * min(times):9.2f} ms"
+        if label in baseline and baseline[label]:
+            change = median / baseline[label] - 1
+            line += f"  {100 * change:+6.1f}%"
+            if arguments.threshold < change:
+                line += "  REGRESSION"
+                regressions.append(label)
+        print(line, flush=True)
+    if arguments.save:
+        with open(arguments.save, "w") as pointer:
+            json.dump(medians, pointer, indent=4, sort_keys=True)
+    if regressions:
+        print(f"{len(regressions)} regressed: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Build benchmarks.
+"""
+import ide
+
+from .stubs import stub_executables
+
+scores = ide.configuration.test_scores_directory
+
+
+class _Build:
+    """
+    Works in red score letter build; restores scores afterwards.
+    """
+
+    def setup(self):
+        self.test = ide.Test()
+        self.test.__enter__()
+        self.abjad_ide = ide.AbjadIDE(test=True)
+        self.build = ide.Path(
+            scores, "red_score", "red_score", "builds", "letter-score"
+        )
+
+    def teardown(self):
+        self.test.__exit__(None, None, None)
+
+
+class BuildScorePdf(_Build):
+    """
+    Builds score PDF from scratch with LilyPond and LaTeX stubbed.
+    """
+
+    def setup(self):
+        super().setup()
+        self.stubs = stub_executables()
+        self.stubs.__enter__()
+
+    def teardown(self):
+        self.stubs.__exit__(None, None, None)
+        super().teardown()
+
+    def time_build_score_pdf(self):
+        (self.build / ".stamps").remove()
+        for pdf in self.build.glob("*.pdf"):
+            pdf.remove()
+        self.abjad_ide.build_score_pdf(self.build)
+
+
+class CollectSegmentLys(_Build):
+    """
+    Collects segment lys.
+    """
+
+    def time_collect_segment_lys(self):
+        self.abjad_ide.collect_segment_lys(self.build)
+
+
+class HandleBuildTags(_Build):
+    """
+    Handles build tags in collected segment lys.
+    """
+
+    def setup(self):
+        super().setup()
+        self.abjad_ide.collect_segment_lys(self.build)
+
+    def time_handle_build_tags(self):
+        self.abjad_ide.handle_build_tags(self.build)
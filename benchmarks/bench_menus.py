@@ -0,0 +1,28 @@
+"""
+Menu benchmarks.
+"""
+import ide
+
+from .bench_paths import _get_directories
+
+
+class FromDirectory:
+    """
+    Makes menu of every directory in bundled scores.
+    """
+
+    def setup(self):
+        self.abjad_ide = ide.AbjadIDE(test=True)
+        self.directories = _get_directories()
+
+    def time_from_directory(self):
+        for directory in self.directories:
+            sections = self.abjad_ide._make_command_sections(directory)
+            ide.Menu.from_directory(
+                directory,
+                directory.name,
+                aliases=self.abjad_ide.aliases,
+                io=self.abjad_ide.io,
+                navigations=self.abjad_ide.navigations,
+                sections=sections,
+            )
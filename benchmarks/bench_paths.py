@@ -0,0 +1,106 @@
+"""
+Path benchmarks.
+"""
+import shutil
+import tempfile
+
+import abjad
+import ide
+
+from . import synthetic
+
+scores = ide.configuration.test_scores_directory
+
+
+def _clear_caches():
+    for name, value in vars(ide.Path).items():
+        if name.endswith("_cache") and isinstance(value, dict):
+            value.clear()
+
+
+def _get_directories():
+    directories = [ide.Path(scores)]
+    for score in ("blue_score", "green_score", "red_score"):
+        contents = ide.Path(scores, score, score)
+        directories.extend([contents, contents.builds, contents.segments])
+        directories.extend(contents.builds.list_paths())
+        directories.extend(contents.segments.list_paths())
+    return [_ for _ in directories if _.is_dir()]
+
+
+class Activate:
+    """
+    Activates and deactivates tags in red score ``_segments``.
+    """
+
+    tags = (abjad.Tag("DEFAULT_INSTRUMENT_ALERT"), abjad.Tag("LOCAL_MEASURE_INDEX"))
+
+    def setup(self):
+        self.test = ide.Test()
+        self.test.__enter__()
+        build = ide.Path(scores, "red_score", "red_score", "builds", "letter-score")
+        ide.AbjadIDE(test=True).collect_segment_lys(build)
+        self._segments = build / "_segments"
+
+    def teardown(self):
+        self.test.__exit__(None, None, None)
+
+    def time_activate(self):
+        for tag in self.tags:
+            self._segments.deactivate(tag)
+            self._segments.activate(tag)
+
+
+class Extern:
+    """
+    Externalizes (synthetic) segment ``illustration.ly``.
+    """
+
+    def setup(self):
+        self.directory = ide.Path(tempfile.mkdtemp())
+        self.source = self.directory / "source.ly"
+        text = synthetic.make_illustration_ly(1, staff_count=4, measure_count=64)
+        self.source.write_text(text)
+        self.ly = self.directory / "illustration.ly"
+
+    def teardown(self):
+        shutil.rmtree(str(self.directory))
+
+    def time_extern(self):
+        self.source.extern(realign=79, score_path=self.ly)
+
+
+class GetMetadata:
+    """
+    Gets metadata of every directory in bundled scores.
+    """
+
+    def setup(self):
+        self.directories = _get_directories()
+
+    def time_get_metadata(self):
+        for directory in self.directories:
+            directory.get_metadata()
+
+    def time_get_metadata_cold(self):
+        _clear_caches()
+        for directory in self.directories:
+            directory.get_metadata()
+
+
+class ListPaths:
+    """
+    Lists every directory in bundled scores.
+    """
+
+    def setup(self):
+        self.directories = _get_directories()
+
+    def time_list_paths(self):
+        for directory in self.directories:
+            directory.list_paths()
+
+    def time_list_paths_cold(self):
+        _clear_caches()
+        for directory in self.directories:
+            directory.list_paths()
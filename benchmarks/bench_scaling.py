@@ -0,0 +1,75 @@
+"""
+Synthetic large-score benchmarks.
+"""
+import ide
+
+from . import synthetic
+from .bench_paths import _clear_caches
+
+scores = ide.configuration.test_scores_directory
+
+
+class _SyntheticScore:
+    """
+    Works in synthetic score; restores scores afterwards.
+    """
+
+    measure_count = 16
+
+    segment_count = 48
+
+    staff_count = 12
+
+    def setup(self):
+        self.test = ide.Test()
+        self.test.__enter__()
+        self.abjad_ide = ide.AbjadIDE(test=True)
+        self.contents = ide.Path(
+            synthetic.make_score(
+                scores,
+                measure_count=self.measure_count,
+                segment_count=self.segment_count,
+                staff_count=self.staff_count,
+            )
+        )
+        self.build = self.contents.builds / "letter-score"
+
+    def teardown(self):
+        self.test.__exit__(None, None, None)
+
+
+class CollectSegmentLys(_SyntheticScore):
+    """
+    Collects segment lys of synthetic score.
+    """
+
+    def time_collect_segment_lys(self):
+        self.abjad_ide.collect_segment_lys(self.build)
+
+
+class HandleBuildTags(_SyntheticScore):
+    """
+    Handles build tags in collected segment lys of synthetic score.
+    """
+
+    def setup(self):
+        super().setup()
+        self.abjad_ide.collect_segment_lys(self.build)
+
+    def time_handle_build_tags(self):
+        self.abjad_ide.handle_build_tags(self.build)
+
+
+class Segments(_SyntheticScore):
+    """
+    Lists segments of synthetic score and gets their metadata.
+    """
+
+    def time_get_metadata_cold(self):
+        _clear_caches()
+        for segment in self.contents.segments.list_paths():
+            segment.get_metadata()
+
+    def time_list_paths_cold(self):
+        _clear_caches()
+        self.contents.segments.list_paths()
@@ -0,0 +1,74 @@
+"""
+LilyPond and LaTeX stubs.
+"""
+import contextlib
+import os
+import stat
+import sys
+import tempfile
+import typing
+import unittest.mock
+
+import abjad
+
+_pdf = b"""%PDF-1.4
+1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj
+2 0 obj << /Type /Pages /Kids [] /Count 0 >> endobj
+trailer << /Root 1 0 R >>
+%%EOF
+"""
+
+_script = """#! {executable}
+import os
+import sys
+
+arguments = sys.argv[1:]
+if os.path.basename(sys.argv[0]) == "lilypond":
+    base = arguments[arguments.index("-o") + 1]
+    paths = [base + ".pdf"]
+else:
+    job = [_ for _ in arguments if _.startswith("--jobname=")][0]
+    job = job.split("=", 1)[1]
+    directory = [_ for _ in arguments if _.startswith("-output-directory=")][0]
+    directory = directory.split("=", 1)[1]
+    base = os.path.join(directory, job)
+    paths = [base + ".pdf", base + ".aux", base + ".log"]
+for path in paths:
+    with open(path, "wb") as pointer:
+        if path.endswith(".pdf"):
+            pointer.write({pdf!r})
+print("stub " + os.path.basename(sys.argv[0]) + " " + " ".join(arguments))
+"""
+
+
+@contextlib.contextmanager
+def stub_executables(
+    names: typing.Sequence[str] = ("lilypond", "pdflatex", "xelatex")
+) -> typing.Iterator[str]:
+    """
+    Puts stub executables first on ``PATH``.
+
+    Stubs write an empty PDF (and, for LaTeX, an empty log) where the real
+    program would write its output and exit successfully. Ignores the
+    ``lilypond_path`` setting of the Abjad configuration while active.
+
+    Yields directory of stubs.
+    """
+    get = abjad.Configuration.get
+
+    def get_(self, key, *arguments, **keywords):
+        if key == "lilypond_path":
+            return None
+        return get(self, key, *arguments, **keywords)
+
+    with tempfile.TemporaryDirectory() as directory:
+        text = _script.format(executable=sys.executable, pdf=_pdf)
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, "w") as pointer:
+                pointer.write(text)
+            os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+        path = directory + os.pathsep + os.environ.get("PATH", "")
+        with unittest.mock.patch.dict(os.environ, {"PATH": path}):
+            with unittest.mock.patch.object(abjad.Configuration, "get", get_):
+                yield directory
@@ -0,0 +1,287 @@
+"""
+Synthetic score generator.
+
+Writes score packages of any size for benchmarks and stress tests: N segments
+of M staves with realistic tagged ``illustration.ly`` and ``.ily`` files
+(active and deactivated tags, persistent indicator tags, ``%*%`` extern
+markers) and ``__metadata__.py`` files with time signatures.
+
+    python -m benchmarks.synthetic ~/Scores --segments 64 --staves 12
+
+Segment file size grows linearly with staff count and measure count: about
+800 bytes and six tagged lines per staff per measure.
+"""
+import argparse
+import json
+import os
+import typing
+
+_column = 79
+
+_persist = "import abjad\n\npersist = abjad.OrderedDict()\n"
+
+
+def _deactivate(line: str) -> str:
+    count = len(line) - len(line.lstrip())
+    assert 4 <= count, repr(line)
+    return line[: count - 4] + "%@% " + line[count:]
+
+
+def _tag(line: str, tag: str, deactivate: bool = False) -> str:
+    if deactivate:
+        line = _deactivate(line)
+    return f"{line.ljust(_column)} %! {tag}"
+
+
+def _write_metadata(path, items) -> None:
+    lines = ["import abjad", "", "metadata = abjad.OrderedDict("]
+    if items:
+        lines.append("    [")
+        for key, value in items:
+            lines.append(f"        ({json.dumps(key)}, {json.dumps(value)}),")
+        lines.append("    ]")
+    lines.append(")")
+    with open(path, "w") as pointer:
+        pointer.write("\n".join(lines) + "\n")
+
+
+def _write_text(path, text="") -> None:
+    with open(path, "w") as pointer:
+        pointer.write(text)
+
+
+def make_global_context_lines(
+    measure_count: int, segment_number: int, *, indent: int = 12
+) -> typing.List[str]:
+    """
+    Makes global context lines.
+    """
+    space = indent * " "
+    lines = [
+        space + '\\context GlobalContext = "Global_Context" %*% Global_Context',
+        space + "<<",
+        space + '    \\context GlobalSkips = "Global_Skips"',
+        space + "    {",
+    ]
+    for measure in range(1, measure_count + 1):
+        number = (segment_number - 1) * measure_count + measure
+        inner = space + 8 * " "
+        lines.append("")
+        lines.append(_tag(f"{inner}% [Global_Skips measure {measure}]", "SM4"))
+        lines.append(_tag(f"{inner}\\time 4/4", "EXPLICIT_TIME_SIGNATURE:SM8"))
+        color = "\\once \\override Score.TimeSignature.color = #(x11-color 'blue)"
+        lines.append(_tag(f"{inner}{color}", "EXPLICIT_TIME_SIGNATURE_COLOR:SM6", True))
+        if measure == 1:
+            lines.append(_tag(f'{inner}\\bar ""', "SM2:+SEGMENT:EMPTY_START_BAR"))
+            mark = "\\once \\override TextSpanner.bound-details.left.text ="
+            lines.append(_tag(f"{inner}{mark}", "EXPLICIT_METRONOME_MARK:SM27", True))
+            lines.append(
+                _tag(
+                    f"{inner}\\markup {{ = 60 }}", "EXPLICIT_METRONOME_MARK:SM27", True
+                )
+            )
+        lines.append(f"{inner}s1 * 1")
+        markup = f"^ \\markup {{ \\fontsize #3 {number} }}"
+        lines.append(_tag(f"{inner}{markup}", "MEASURE_NUMBER:SM31", True))
+        markup = f"^ \\markup {{ \\fontsize #3 {measure - 1} }}"
+        lines.append(_tag(f"{inner}{markup}", "LOCAL_MEASURE_INDEX:SM28", True))
+        markup = f"^ \\markup {{ \\fontsize #3 {60 * (number - 1) // 15}'' }}"
+        lines.append(_tag(f"{inner}{markup}", "CLOCK_TIME:SM28", True))
+        if measure == measure_count:
+            line = f"{inner}\\override Score.BarLine.transparent = ##f"
+            lines.append(_tag(line, "SEGMENT_FINAL_BAR_LINE:SM5"))
+    lines.extend(["", space + "    }", space + ">> %*% Global_Context"])
+    return lines
+
+
+def make_illustration_ly(
+    segment_number: int, staff_count: int, measure_count: int
+) -> str:
+    """
+    Makes (unexternalized) segment ``illustration.ly``.
+    """
+    lines = [
+        _tag('\\version "2.19.84"', "LilyPondFile"),
+        _tag('\\language "english"', "LilyPondFile"),
+        "",
+        "#(ly:set-option 'relative-includes #t)",
+        "",
+        _tag('\\include "../../stylesheets/stylesheet.ily"', "LilyPondFile"),
+        "",
+        _tag("\\score {", "LilyPondFile"),
+        "    <<",
+        "        {",
+        '            \\include "layout.ly"',
+        "        }",
+        '        \\context Score = "Score" %*% Score',
+        "        <<",
+    ]
+    lines.extend(make_global_context_lines(measure_count, segment_number))
+    for staff in range(1, staff_count + 1):
+        lines.extend(make_staff_lines(staff, measure_count, first=segment_number == 1))
+    lines.extend(["        >> %*% Score", "    >>", _tag("}", "LilyPondFile"), ""])
+    return "\n".join(lines)
+
+
+def make_score(
+    scores_directory,
+    *,
+    measure_count: int = 16,
+    name: str = "synthetic_score",
+    segment_count: int = 32,
+    staff_count: int = 8,
+    externalize: bool = True,
+) -> str:
+    """
+    Makes synthetic score package ``name`` in ``scores_directory``.
+
+    Writes ``segment_count`` segments of ``staff_count`` staves and
+    ``measure_count`` measures of 4/4 each; one build (``letter-score``).
+    Externalizes each ``illustration.ly`` into ``.ly`` and ``.ily`` like the
+    segment PDF maker does when ``externalize`` is true; otherwise leaves
+    ``%*%`` extern markers in ``illustration.ly``.
+
+    Returns path of contents directory.
+    """
+    wrapper = os.path.join(str(scores_directory), name)
+    contents = os.path.join(wrapper, name)
+    assert not os.path.exists(wrapper), repr(wrapper)
+    for directory in (
+        "builds/_assets",
+        "builds/letter-score/_assets",
+        "builds/letter-score/_segments",
+        "distribution",
+        "etc",
+        "segments",
+        "stylesheets",
+    ):
+        os.makedirs(os.path.join(contents, directory))
+    title = name.replace("_", " ").title()
+    _write_text(os.path.join(wrapper, "README.md"), f"{title}\n")
+    _write_text(os.path.join(contents, "__init__.py"))
+    width = max(2, len(str(segment_count)))
+    names = [str(_).zfill(width) for _ in range(1, segment_count + 1)]
+    time_signatures = [(_, measure_count * ["4/4"]) for _ in names]
+    _write_metadata(
+        os.path.join(contents, "__metadata__.py"),
+        [("title", title), ("year", 2020)],
+    )
+    _write_metadata(os.path.join(contents, "builds", "__metadata__.py"), [])
+    build = os.path.join(contents, "builds", "letter-score")
+    _write_metadata(os.path.join(build, "__metadata__.py"), [])
+    _write_text(os.path.join(build, "layout.py"))
+    _write_text(os.path.join(build, "stylesheet.ily"))
+    _write_text(os.path.join(contents, "stylesheets", "stylesheet.ily"))
+    for number, segment_name in enumerate(names, start=1):
+        segment = os.path.join(contents, "segments", segment_name)
+        os.mkdir(segment)
+        _write_text(os.path.join(segment, "__init__.py"))
+        _write_metadata(
+            os.path.join(segment, "__metadata__.py"),
+            [
+                ("first_measure_number", (number - 1) * measure_count + 1),
+                ("segment_count", segment_count),
+                ("segment_number", number),
+                ("time_signatures", time_signatures[number - 1][1]),
+            ],
+        )
+        _write_text(os.path.join(segment, "__persist__.py"), _persist)
+        _write_text(os.path.join(segment, "definition.py"), "maker = None\n")
+        _write_text(os.path.join(segment, "layout.ly"))
+        _write_text(os.path.join(segment, "layout.py"))
+        text = make_illustration_ly(number, staff_count, measure_count)
+        ly = os.path.join(segment, "illustration.ly")
+        _write_text(ly, text)
+        if externalize:
+            import ide
+
+            ide.Path(ly).extern(realign=_column)
+    return contents
+
+
+def make_staff_lines(
+    staff: int, measure_count: int, *, first: bool = False, indent: int = 12
+) -> typing.List[str]:
+    """
+    Makes lines of ``staff`` (with one voice).
+    """
+    space = indent * " "
+    inner = space + 8 * " "
+    name = f"Staff_{staff}"
+    voice = f"Voice_{staff}"
+    lines = [
+        f'{space}\\context Staff = "{name}" %*% {name}',
+        space + "{",
+        f'{space}    \\context Voice = "{voice}" %*% {voice}',
+        space + "    {",
+    ]
+    for measure in range(1, measure_count + 1):
+        lines.append("")
+        lines.append(_tag(f"{inner}% [{voice} measure {measure}]", "SM4"))
+        if measure == 1:
+            tag = "DEFAULT_CLEF:SM8" if first else "REAPPLIED_CLEF:SM8"
+            lines.append(_tag(f'{inner}\\clef "treble"', tag))
+            color = "\\once \\override Staff.Clef.color = #(x11-color 'DarkViolet)"
+            lines.append(_tag(f"{inner}{color}", "DEFAULT_CLEF_COLOR:SM6"))
+            lines.append(
+                _tag(
+                    f"{inner}\\override Staff.Clef.color = ##f",
+                    "DEFAULT_CLEF_COLOR_CANCELLATION:SM7",
+                    True,
+                )
+            )
+            instrument = f"\\set Staff.instrumentName = \\markup {{ Flute {staff} }}"
+            tag = (
+                "DEFAULT_INSTRUMENT:SM8" if first else "REDRAWN_DEFAULT_INSTRUMENT:SM8"
+            )
+            lines.append(_tag(f"{inner}{instrument}", tag))
+            lines.append(
+                _tag(f'{inner}\\clef "treble"', "DEFAULT_CLEF_REDRAW_COLOR:SM6", True)
+            )
+        lines.append(f"{inner}c'4")
+        if measure == 1:
+            alert = '^ \\markup { \\with-color #(x11-color \'DarkCyan) "(Flute)" }'
+            lines.append(_tag(f"{inner}{alert}", "DEFAULT_INSTRUMENT_ALERT:SM11"))
+        lines.append(_tag(f"{inner}\\p", "EXPLICIT_DYNAMIC:SM8"))
+        color = "- \\tweak color #(x11-color 'blue)"
+        lines.append(_tag(f"{inner}{color}", "EXPLICIT_DYNAMIC_COLOR:SM6", True))
+        lines.append(f"{inner}d'4")
+        lines.append(_tag(f"{inner}- \\staccato", "IC"))
+        lines.append(f"{inner}e'4")
+        shift = "\\once \\override Staff.Clef.X-extent = ##f"
+        lines.append(_tag(f"{inner}{shift}", "SHIFTED_CLEF:SM21", True))
+        lines.append(f"{inner}f'4")
+        line = f"{inner}\\override Staff.BarLine.bar-extent = #'(-2 . 2)"
+        lines.append(_tag(line, "EXPLICIT_BAR_EXTENT:SM30"))
+    lines.extend(["", f"{space}    }} %*% {voice}", f"{space}}} %*% {name}"])
+    return lines
+
+
+def main(arguments=None) -> int:
+    """
+    Makes synthetic score from command line.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.synthetic")
+    parser.add_argument("scores_directory", help="directory to write score to")
+    parser.add_argument("--measures", default=16, type=int, help="measures per segment")
+    parser.add_argument("--name", default="synthetic_score", help="score name")
+    parser.add_argument("--segments", default=32, type=int, help="segment count")
+    parser.add_argument("--staves", default=8, type=int, help="staff count")
+    parser.add_argument(
+        "--no-extern", action="store_true", help="leave %%*%% extern markers"
+    )
+    arguments = parser.parse_args(arguments)
+    contents = make_score(
+        arguments.scores_directory,
+        externalize=not arguments.no_extern,
+        measure_count=arguments.measures,
+        name=arguments.name,
+        segment_count=arguments.segments,
+        staff_count=arguments.staves,
+    )
+    print(contents)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -51,12 +51,18 @@ if __name__ == "__main__":
     try:
         segment = ide.Path(__file__).parent
         midi = segment / "segment.midi"
-        with abjad.Timer() as timer:
-            abjad.persist.as_midi(lilypond_file, midi, remove_ly=True)
-        count = int(timer.elapsed_time)
-        counter = abjad.String("second").pluralize(count)
-        message = f"LilyPond runtime {{count}} {{counter}} ..."
-        print(message)
+        if {defer_lilypond}:
+            print("Deferring LilyPond ...")
+            block = abjad.Block(name="midi")
+            lilypond_file.score_block.items.append(block)
+            abjad.persist.as_ly(lilypond_file, midi.with_suffix(".ly"))
+        else:
+            with abjad.Timer() as timer:
+                abjad.persist.as_midi(lilypond_file, midi, remove_ly=True)
+            count = int(timer.elapsed_time)
+            counter = abjad.String("second").pluralize(count)
+            message = f"LilyPond runtime {{count}} {{counter}} ..."
+            print(message)
     except Exception:
         traceback.print_exc()
         sys.exit(1)
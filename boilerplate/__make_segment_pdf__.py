@@ -1,7 +1,6 @@
 #! /usr/bin/env python
 import os
 import sys
-import time
 import traceback
 
 import abjad
@@ -57,15 +56,13 @@ if __name__ == "__main__":
                 previous_persist=previous_persist,
                 segment_directory=segment_directory,
             )
-        segment_maker_runtime = int(timer.elapsed_time)
-        count = segment_maker_runtime
+        segment_maker_runtime = timer.elapsed_time
+        count = int(segment_maker_runtime)
         counter = abjad.String("second").pluralize(count)
         message = f" Segment-maker runtime {{count}} {{counter}} ..."
         print(message)
-        segment_maker_runtime = (count, counter)
         print(" Writing __metadata__.py ...")
         segment_directory.write_metadata_py(maker.metadata)
-        os.system("black --target-version=py38 __metadata__.py")
         print(" Writing __persist__.py ...")
         segment_directory.write_metadata_py(
             maker.persist,
@@ -73,7 +70,6 @@ if __name__ == "__main__":
             import_statements=["import abjad", "import ide"],
             variable_name="persist",
         )
-        os.system("black --target-version=py38 __persist__.py")
         first_segment = segment_directory.segments.get_next_package()
         if segment_directory.name != first_segment.name:
             layout_ly = segment_directory / "layout.ly"
@@ -89,12 +85,11 @@ if __name__ == "__main__":
                 line = abjad.tag.tag([line], tag="__make_segment_pdf__")[0]
                 lilypond_file.items.insert(0, line)
         result = abjad.persist.as_ly(lilypond_file, illustration_ly, align_tags=79)
-        abjad_format_time = int(result[1])
-        count = abjad_format_time
+        abjad_format_time = result[1]
+        count = int(abjad_format_time)
         counter = abjad.String("second").pluralize(count)
         message = f" Abjad format time {{count}} {{counter}} ..."
         print(message)
-        abjad_format_time = (count, counter)
     except Exception:
         traceback.print_exc()
         sys.exit(1)
@@ -127,13 +122,14 @@ if __name__ == "__main__":
         text = illustration_ly.read_text()
         text = abjad.LilyPondFormatManager.left_shift_tags(text, realign=79)
         illustration_ly.write_text(text)
-        for job in [
+        jobs = [
             ide.jobs.handle_edition_tags(illustration_ly),
             ide.jobs.handle_fermata_bar_lines(segment_directory),
             ide.jobs.handle_shifted_clefs(segment_directory),
             ide.jobs.handle_mol_tags(segment_directory),
-        ]:
-            for message in job():
+        ]
+        for messages in ide.segments.run_jobs(jobs):
+            for message in messages:
                 print(" " + message)
     except Exception:
         traceback.print_exc()
@@ -213,45 +209,30 @@ if __name__ == "__main__":
             )
             for message in not_topmost():
                 print(" " + message)
-        lilypond_log_file_path = illustration_ily.parent / ".log"
-        with abjad.Timer() as timer:
-            print(" Running LilyPond ...")
-            abjad.iox.run_lilypond(
-                illustration_ly, lilypond_log_file_path=lilypond_log_file_path
-            )
-        ide.segments.remove_lilypond_warnings(
-            lilypond_log_file_path,
-            crescendo_too_small=True,
-            decrescendo_too_small=True,
-            overwriting_glissando=True,
-        )
-        lilypond_runtime = int(timer.elapsed_time)
-        count = lilypond_runtime
-        counter = abjad.String("second").pluralize(count)
-        message = f" LilyPond runtime {{count}} {{counter}} ..."
-        print(message)
-        lilypond_runtime = (count, counter)
+        if {defer_lilypond}:
+            print(" Deferring LilyPond ...")
+            lilypond_runtime = None
+        else:
+            lilypond_log_file_path = illustration_ly.parent / ".log"
+            with abjad.Timer() as timer:
+                print(" Running LilyPond ...")
+                ide.segments.run_lilypond(illustration_ly, lilypond_log_file_path)
+            lilypond_runtime = timer.elapsed_time
+            count = int(lilypond_runtime)
+            counter = abjad.String("second").pluralize(count)
+            message = f" LilyPond runtime {{count}} {{counter}} ..."
+            print(message)
     except Exception:
         traceback.print_exc()
         sys.exit(1)
 
     try:
-        optimization = segment_directory / ".optimization"
-        with optimization.open(mode="a") as pointer:
-            pointer.write("\n")
-            line = time.strftime("%Y-%m-%d %H:%M:%S") + "\n"
-            pointer.write(line)
-            count, counter = segment_maker_runtime
-            line = f" Segment-maker runtime: {{count}} {{counter}}\n"
-            pointer.write(line)
-            count, counter = abjad_format_time
-            line = f" Abjad format time: {{count}} {{counter}}\n"
-            pointer.write(line)
-            count, counter = lilypond_runtime
-            line = f" LilyPond runtime: {{count}} {{counter}}\n"
-            pointer.write(line)
-    except Exception:
+        stages = {{"maker": segment_maker_runtime, "format": abjad_format_time}}
+        if lilypond_runtime is not None:
+            stages["lilypond"] = lilypond_runtime
+        store = ide.TimingStore(segment_directory.etc)
+        store.record(segment_directory.name, stages, build="{build}")
+    except OSError:
         traceback.print_exc()
-        sys.exit(1)
 
     sys.exit(0)
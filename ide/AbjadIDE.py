@@ -1,9 +1,14 @@
 import collections
+import concurrent.futures
+import datetime
 import difflib
 import inspect
 import io
+import multiprocessing
 import os
 import platform
+import queue
+import re
 import shutil
 import subprocess
 import sys
@@ -15,12 +20,17 @@ from . import jobs as _jobs
 from . import pathx
 from . import segments as _segments
 from . import tags as _tags
+from .BuildPlanner import BuildPlanner
 from .Command import Command
 from .Configuration import Configuration
 from .IO import IO
+from .LilyPondLog import LilyPondLog
 from .Menu import Menu
 from .MenuSection import MenuSection
+from .Profiler import Profiler
 from .Response import Response
+from .TimingStore import TimingStore
+from .Transcript import Transcript
 from .segments import Job, Part
 
 
@@ -134,6 +144,65 @@ def _part_subtitle(part_name, parentheses=False):
     return part_subtitle
 
 
+def _part_tag_operations(parts_directory, part_identifier):
+    operations = [("+PARTS", False), ("-PARTS", True), ("HIDE_IN_PARTS", True)]
+    if part_identifier is None:
+        return operations
+    parts_directory_name = abjad.String(parts_directory.name)
+    parts_directory_name = parts_directory_name.to_shout_case()
+    name = f"{parts_directory_name}_{part_identifier}"
+    operations.extend(
+        [
+            (f"+{name}", False),
+            (f"-{name}", True),
+            (str(_tags.METRIC_MODULATION_IS_SCALED), True),
+            (str(_tags.METRIC_MODULATION_IS_NOT_SCALED), True),
+            (str(_tags.METRIC_MODULATION_IS_STRIPPED), False),
+            # HACK TO HIDE ALL POST-FERMATA-MEASURE TRANSPARENT BAR LINES;
+            # this only works if parts contain no EOL fermata measure:
+            (str(_tags.FERMATA_MEASURE), True),
+            ("NOT_TOPMOST", False),
+            ("FERMATA_MEASURE_EMPTY_BAR_EXTENT", True),
+            ("FERMATA_MEASURE_NEXT_BAR_EXTENT", True),
+            ("FERMATA_MEASURE_RESUME_BAR_EXTENT", True),
+            (str(_tags.EXPLICIT_BAR_EXTENT), True),
+        ]
+    )
+    return operations
+
+
+def _tex_inputs(tex):
+    pattern = (
+        r"\\(input|include|includepdf|includegraphics)\s*(?:\[[^\]]*\])?\s*{([^}]*)}"
+    )
+    paths = []
+    with tex.open(errors="ignore") as pointer:
+        for line in pointer:
+            line = re.sub(r"(?<!\\)%.*", "", line)
+            for command, name in re.findall(pattern, line):
+                path = tex.parent / name.strip()
+                if not path.suffix and command in ("input", "include"):
+                    path = path.with_suffix(".tex")
+                paths.append(path)
+    return paths
+
+
+def _tex_needs_rerun(log):
+    if not log.is_file():
+        return False
+    with log.open(errors="ignore") as pointer:
+        for line in pointer:
+            if (
+                "Rerun to get" in line
+                or "Rerun LaTeX" in line
+                or "rerun LaTeX" in line
+                or "Label(s) may have changed" in line
+                or re.match(r"No file .*\.(toc|lof|lot)\.", line)
+            ):
+                return True
+    return False
+
+
 def _to_paper_dimensions(paper_size, orientation="portrait"):
     orientations = ("landscape", "portrait", None)
     assert orientation in orientations, repr(orientation)
@@ -198,6 +267,10 @@ class AbjadIDE:
         "_test",
     )
 
+    _maker_output: typing.Any = None
+
+    _maker_worker: typing.Optional[concurrent.futures.ProcessPoolExecutor] = None
+
     abjad_configuration = abjad.Configuration()
     configuration = Configuration()
 
@@ -246,7 +319,16 @@ class AbjadIDE:
         self._previous_directory = None
         self._redraw: typing.Optional[bool] = None
         self._test = test
-        self._io = IO()
+        if test:
+            size = None
+        else:
+            size = int(self.configuration.get("transcript_size") or 10000)
+        spill_path = self.configuration.get("transcript_path")
+        if spill_path and not test:
+            spill_path = os.path.expanduser(spill_path)
+        else:
+            spill_path = None
+        self._io = IO(transcript=Transcript(size=size, spill_path=spill_path))
         self._check_test_scores_directory(example or test)
         self._cache_commands()
 
@@ -390,17 +472,94 @@ class AbjadIDE:
     def _display_lilypond_log_errors(self, log=None):
         if log is None:
             log = self.abjad_configuration.lilypond_log_file_path
-        log = pathx.Path(log)
-        with log.open() as file_pointer:
-            lines = file_pointer.readlines()
-        for line in lines:
-            if (
-                "fatal" in line
-                or ("error" in line and "programming error" not in line)
-                or "failed" in line
-            ):
-                self.io.display("ERROR IN LILYPOND LOG FILE ...")
-                break
+        if not isinstance(log, LilyPondLog):
+            log = LilyPondLog.read(log)
+        if log.error_count or log.failure_count:
+            self.io.display("ERROR IN LILYPOND LOG FILE ...")
+
+    def _display_profile(self, profiler):
+        summary = profiler.summary
+        message = f"profiled {profiler.command_name}:"
+        message += f" wall {summary['wall']:.2f} s, CPU {summary['cpu']:.2f} s"
+        if summary["makers"]:
+            message += f", makers {summary['makers']:.2f} s"
+        if summary["subprocess"] is not None:
+            message += f", subprocesses {summary['subprocess']:.2f} s"
+        if summary["read_bytes"] is not None:
+            message += f", read {summary['read_bytes']:,} bytes"
+            message += f", wrote {summary['written_bytes']:,} bytes"
+        self.io.display(message + " ...")
+        paths = profiler.write(self.configuration.profiles_directory)
+        for path in paths[1:]:
+            self.io.display(f"writing {path} ...")
+
+    def _display_skipped_segments(self, paths, skipped):
+        count = len(paths)
+        segments = abjad.String("segment").pluralize(count)
+        message = f"skipped {len(skipped)} of {count} {segments}"
+        if skipped:
+            message += f" ({', '.join(skipped)})"
+        self.io.display(message + " ...")
+
+    def _finish_part_lilypond(self, music_ly, future):
+        pdf = music_ly.with_suffix(".pdf")
+        self.io.display(f"running LilyPond on {music_ly.trim()} ...")
+        try:
+            success, runtime = future.result()
+        except Exception as e:
+            message = f"can not run LilyPond on {music_ly.trim()} ({e}) ..."
+            self.io.display(message, indent=1)
+            return False
+        self._display_lilypond_log_errors(log=music_ly.parent / ".log")
+        counter = abjad.String("second").pluralize(runtime)
+        self.io.display(f"LilyPond runtime {runtime} {counter} ...", indent=1)
+        if not success or not pdf.is_file():
+            self.io.display(f"can not produce {pdf.trim()} ...", indent=1)
+            return False
+        self.io.display(f"found {pdf.trim()} ...", indent=1)
+        return True
+
+    def _finish_segment_lilypond(self, directory, future, build=None):
+        ly = directory / "illustration.ly"
+        pdf = directory / "illustration.pdf"
+        self.io.display(f"running LilyPond on {ly.trim()} ...")
+        try:
+            success, runtime = future.result()
+        except Exception as e:
+            self.io.display(f"can not run LilyPond on {ly.trim()} ({e}) ...", indent=1)
+            return False
+        self._display_lilypond_log_errors(log=directory / ".log")
+        if directory.etc is not None:
+            store = TimingStore(directory.etc)
+            store.record(directory.name, {"lilypond": runtime}, build=build)
+        count = int(runtime)
+        counter = abjad.String("second").pluralize(count)
+        self.io.display(f"LilyPond runtime {count} {counter} ...", indent=1)
+        if not success or not pdf.is_file():
+            self.io.display(f"can not produce {pdf.trim()} ...", indent=1)
+            return False
+        self.io.display(f"found {pdf.trim()} ...", indent=1)
+        _segments.write_segment_fingerprint(directory)
+        return True
+
+    def _finish_segment_midi_lilypond(self, directory, future):
+        ly = directory / "segment.ly"
+        midi = directory / "segment.midi"
+        self.io.display(f"running LilyPond on {ly.trim()} ...")
+        try:
+            success, runtime = future.result()
+        except Exception as e:
+            self.io.display(f"can not run LilyPond on {ly.trim()} ({e}) ...", indent=1)
+            return False
+        self._display_lilypond_log_errors(log=directory / ".log")
+        count = int(runtime)
+        counter = abjad.String("second").pluralize(count)
+        self.io.display(f"LilyPond runtime {count} {counter} ...", indent=1)
+        if not success or not midi.is_file():
+            self.io.display(f"can not produce {midi.trim()} ...", indent=1)
+            return False
+        self.io.display(f"found {midi.trim()} ...", indent=1)
+        return True
 
     def _generate_back_cover_tex(self, path, price=None):
         assert path.build.exists(), repr((path, path.build))
@@ -767,6 +926,16 @@ class AbjadIDE:
             dimensions = eval(self.test.strip("dimensions="))
         return dimensions
 
+    def _get_maker_worker(self):
+        if AbjadIDE._maker_worker is None:
+            AbjadIDE._maker_output = multiprocessing.Queue()
+            AbjadIDE._maker_worker = concurrent.futures.ProcessPoolExecutor(
+                max_workers=1,
+                initializer=_segments._import_maker_libraries,
+                initargs=(AbjadIDE._maker_output,),
+            )
+        return AbjadIDE._maker_worker
+
     def _get_score_names(self):
         scores = self._get_scores_directory()
         names = [_.name for _ in scores.list_paths()]
@@ -813,6 +982,27 @@ class AbjadIDE:
         else:
             message = f"can not interpret {path}."
             raise Exception(message)
+        if path.suffix == ".py" and multiprocessing.parent_process() is None:
+            worker = self._get_maker_worker()
+            future = worker.submit(_segments.run_segment_maker, str(path))
+            while True:
+                try:
+                    line = AbjadIDE._maker_output.get(timeout=0.1)
+                except queue.Empty:
+                    if future.done() and future.exception() is not None:
+                        break
+                    continue
+                if line is None:
+                    break
+                print(line)
+            try:
+                stdout_lines, stderr_lines, exit_code, times = future.result()
+            except concurrent.futures.BrokenExecutor:
+                AbjadIDE._maker_output = None
+                AbjadIDE._maker_worker = None
+                return [], [f"maker worker exited while running {path} ..."], 1
+            Profiler.add_maker_times(**times)
+            return stdout_lines, stderr_lines, exit_code
         directory = path.parent
         directory = abjad.TemporaryDirectoryChange(directory)
         string_buffer = io.StringIO()
@@ -839,44 +1029,7 @@ class AbjadIDE:
         return stdout_lines, stderr_lines, exit_code
 
     def _interpret_tex_file(self, tex):
-        if not tex.is_file():
-            self.io.display(f"can not find {tex.trim()} ...")
-            return
-        pdf = tex.with_suffix(".pdf")
-        if pdf.exists():
-            self.io.display(f"removing {pdf.trim()} ...")
-            pdf.remove()
-        self.io.display(f"interpreting {tex.trim()} ...")
-        if not tex.is_file():
-            return
-        executables = abjad.iox.find_executable("xelatex")
-        executables = [pathx.Path(_) for _ in executables]
-        if not executables:
-            executable_name = "pdflatex"
-        else:
-            executable_name = "xelatex"
-        log = self.configuration.latex_log_file_path
-        command = f"date > {log};"
-        command += f" {executable_name} -halt-on-error"
-        command += " -interaction=nonstopmode"
-        command += f" --jobname={tex.stem}"
-        command += f" -output-directory={tex.parent} {tex}"
-        command += f" >> {log} 2>&1"
-        command_called_twice = f"{command}; {command}"
-        with self.change(tex.parent):
-            abjad.iox.spawn_subprocess(command_called_twice)
-            for path in sorted(tex.parent.glob("*.aux")):
-                path.remove()
-            for path in sorted(tex.parent.glob("*.log")):
-                path.remove()
-        if pdf.is_file():
-            self.io.display(f"found {pdf.trim()} ...")
-        else:
-            self.io.display("ERROR IN LATEX LOG FILE ...")
-            log_file = self.configuration.latex_log_file_path
-            with log_file.open() as file_pointer:
-                lines = [_.strip("\n") for _ in file_pointer.readlines()]
-            self.io.display(lines)
+        self.io.display(self._render_tex_file(tex))
 
     def _interpret_tex_files_ending_with(self, directory, name):
         paths = directory.get_files_ending_with(name)
@@ -1027,13 +1180,14 @@ class AbjadIDE:
             return
         assert not parts_directory.exists()
         parts_directory.mkdir()
-        parts_directory.add_metadatum("parts_directory", True)
-        if bool(paper_size):
-            parts_directory.add_metadatum("paper_size", paper_size)
-        if not orientation == "portrait":
-            parts_directory.add_metadatum("orientation", orientation)
-        if bool(suffix):
-            parts_directory.add_metadatum("catalog_number_suffix", suffix)
+        with parts_directory.metadata_transaction():
+            parts_directory.add_metadatum("parts_directory", True)
+            if bool(paper_size):
+                parts_directory.add_metadatum("paper_size", paper_size)
+            if not orientation == "portrait":
+                parts_directory.add_metadatum("orientation", orientation)
+            if bool(suffix):
+                parts_directory.add_metadatum("catalog_number_suffix", suffix)
         self.collect_segment_lys(parts_directory)
         stub = parts_directory.builds._assets / "preface-body.tex"
         if not stub.is_file():
@@ -1188,7 +1342,7 @@ class AbjadIDE:
         if exit_code:
             self.io.display(stderr_lines, raw=True)
 
-    def _make_segment_midi(self, directory, open_after=True):
+    def _make_segment_midi(self, directory, open_after=True, defer_lilypond=False):
         assert directory.is_segment()
         definition = directory / "definition.py"
         if not definition.is_file():
@@ -1224,6 +1378,7 @@ class AbjadIDE:
                 persist_statement += "\n        previous_persist = persist"
             template = maker.read_text()
             template = template.format(
+                defer_lilypond=defer_lilypond,
                 previous_segment_metadata_import_statement=statement,
                 previous_segment_persist_import_statement=persist_statement,
             )
@@ -1241,7 +1396,34 @@ class AbjadIDE:
             self._open_files([midi])
         return 0
 
-    def _make_segment_pdf(self, directory, layout=True, open_after=True):
+    def _make_segment_midis_in_parallel(self, paths):
+        exit, runs = 0, []
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            for path in paths:
+                exit_ = self._make_segment_midi(
+                    path, open_after=False, defer_lilypond=True
+                )
+                if exit_ != 0:
+                    exit = -1
+                elif (path / "segment.ly").is_file():
+                    future = executor.submit(
+                        _segments.run_segment_midi_lilypond, str(path)
+                    )
+                    runs.append((path, future))
+                self.io.display("")
+                while runs and runs[0][1].done():
+                    path_, future = runs.pop(0)
+                    if not self._finish_segment_midi_lilypond(path_, future):
+                        exit = -1
+            for path_, future in runs:
+                if not self._finish_segment_midi_lilypond(path_, future):
+                    exit = -1
+        abjad.iox.spawn_subprocess('say "done"')
+        return exit
+
+    def _make_segment_pdf(
+        self, directory, layout=True, open_after=True, defer_lilypond=False, build=None
+    ):
         assert directory.is_segment()
         if layout is True:
             self._make_layout_ly(directory / "layout.py")
@@ -1279,6 +1461,8 @@ class AbjadIDE:
                 persist_statement += "\n        previous_persist = persist"
             template = maker.read_text()
             completed_template = template.format(
+                build=build or TimingStore.get_build_id(),
+                defer_lilypond=defer_lilypond,
                 previous_segment_metadata_import_statement=statement,
                 previous_segment_persist_import_statement=persist_statement,
             )
@@ -1294,10 +1478,45 @@ class AbjadIDE:
         if exit_code:
             self.io.display(stderr_lines, raw=True)
             return exit_code
+        if pdf.is_file():
+            _segments.write_segment_fingerprint(directory)
         if pdf.is_file() and open_after:
             self._open_files([pdf])
         return 0
 
+    def _make_segment_pdfs_in_parallel(self, paths, layout=True, incremental=False):
+        exit, runs, skipped = 0, [], []
+        build = TimingStore.get_build_id()
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            for path in paths:
+                if incremental and self._skip_segment_pdf(path):
+                    skipped.append(path.name)
+                    continue
+                exit_ = self._make_segment_pdf(
+                    path,
+                    layout=layout,
+                    open_after=False,
+                    defer_lilypond=True,
+                    build=build,
+                )
+                if exit_ != 0:
+                    exit = -1
+                elif (path / "illustration.ly").is_file():
+                    future = executor.submit(_segments.run_segment_lilypond, str(path))
+                    runs.append((path, future))
+                self.io.display("")
+                while runs and runs[0][1].done():
+                    path_, future = runs.pop(0)
+                    if not self._finish_segment_lilypond(path_, future, build):
+                        exit = -1
+            for path_, future in runs:
+                if not self._finish_segment_lilypond(path_, future, build):
+                    exit = -1
+        abjad.iox.spawn_subprocess('say "done"')
+        if incremental:
+            self._display_skipped_segments(paths, skipped)
+        return exit
+
     def _make_selector(
         self,
         aliases=None,
@@ -1479,6 +1698,61 @@ class AbjadIDE:
                     abjad.iox.spawn_subprocess(str(target))
         abjad.iox.spawn_subprocess(command)
 
+    def _render_tex_file(self, tex):
+        messages = []
+        if not tex.is_file():
+            messages.append(f"can not find {tex.trim()} ...")
+            return messages
+        pdf = tex.with_suffix(".pdf")
+        if pdf.is_file():
+            inputs = [tex] + [_ for _ in _tex_inputs(tex) if _.exists()]
+            if all(_.stat().st_mtime <= pdf.stat().st_mtime for _ in inputs):
+                messages.append(f"using up-to-date {pdf.trim()} ...")
+                return messages
+        if pdf.exists():
+            messages.append(f"removing {pdf.trim()} ...")
+            pdf.remove()
+        messages.append(f"interpreting {tex.trim()} ...")
+        executables = abjad.iox.find_executable("xelatex")
+        executables = [pathx.Path(_) for _ in executables]
+        if not executables:
+            executable_name = "pdflatex"
+        else:
+            executable_name = "xelatex"
+        command = [
+            executable_name,
+            "-halt-on-error",
+            "-interaction=nonstopmode",
+            f"--jobname={tex.stem}",
+            f"-output-directory={tex.parent}",
+            str(tex),
+        ]
+        log = self.configuration.latex_log_file_path
+        log = log.with_name(f"{log.stem}-{tex.parent.name}-{tex.stem}{log.suffix}")
+        tex_log = tex.with_suffix(".log")
+        with log.open("w") as pointer:
+            pointer.write(datetime.datetime.now().strftime("%c") + "\n")
+            pointer.flush()
+            for _ in range(3):
+                subprocess.run(
+                    command,
+                    cwd=str(tex.parent),
+                    stdout=pointer,
+                    stderr=subprocess.STDOUT,
+                )
+                if not _tex_needs_rerun(tex_log):
+                    break
+        for path in (tex.with_suffix(".aux"), tex_log):
+            if path.exists():
+                path.remove()
+        if pdf.is_file():
+            messages.append(f"found {pdf.trim()} ...")
+        else:
+            messages.append("ERROR IN LATEX LOG FILE ...")
+            with log.open() as file_pointer:
+                messages.extend(_.strip("\n") for _ in file_pointer.readlines())
+        return messages
+
     def _replace_in_tree(
         self, directory, search_string, replace_string, complete_words=False
     ):
@@ -1507,14 +1781,8 @@ class AbjadIDE:
         assert not pdf.exists()
         with self.change(directory):
             self.io.display(f"interpreting {ly.trim()} ...", indent=indent + 1)
-            abjad.iox.run_lilypond(str(ly), lilypond_log_file_path=str(log))
-            _segments.remove_lilypond_warnings(
-                log,
-                crescendo_too_small=True,
-                decrescendo_too_small=True,
-                overwriting_glissando=True,
-            )
-            self._display_lilypond_log_errors(log=log)
+            _, lilypond_log = _segments.run_lilypond(ly, log)
+            self._display_lilypond_log_errors(log=lilypond_log)
             if pdf.is_file():
                 self.io.display(f"found {pdf.trim()} ...", indent=indent + 1)
             else:
@@ -1816,6 +2084,15 @@ class AbjadIDE:
             return
         return paths
 
+    def _skip_segment_pdf(self, directory):
+        reason = _segments.get_segment_rebuild_reason(directory)
+        if reason is None:
+            message = f"skipping segment {directory.name} (inputs unchanged) ..."
+            self.io.display(message)
+            return True
+        self.io.display(f"rebuilding segment {directory.name} ({reason}) ...")
+        return False
+
     @staticmethod
     def _test_segment_illustration(directory):
         # only run on Travis because segment illustration usually takes a while
@@ -2020,6 +2297,24 @@ class AbjadIDE:
         messages: typing.List[abjad.String] = job()
         self.io.display(messages, indent=indent)
 
+    def run_jobs(
+        self,
+        jobs: typing.Sequence[Job],
+        *,
+        indent: int = 0,
+        quiet: bool = False,
+    ) -> None:
+        """
+        Runs ``jobs`` together in one pass over each LilyPond file.
+
+        Displays the same messages as running each job in turn.
+        """
+        message_zero = not bool(quiet)
+        jobs = [abjad.new(_, message_zero=message_zero) for _ in jobs]
+        with self.io.buffered():
+            for messages in _segments.run_jobs(jobs):
+                self.io.display(messages, indent=indent)
+
     ### USER METHODS ###
 
     @Command(
@@ -2031,6 +2326,8 @@ class AbjadIDE:
     def build_part_pdf(self, directory: pathx.Path) -> None:
         """
         Builds ``part.pdf`` from the ground up.
+
+        Renders each part's covers and preface in parallel with LilyPond.
         """
         assert directory.is_parts() or directory.is_part()
         name, verb = "part.pdf", "build"
@@ -2045,44 +2342,116 @@ class AbjadIDE:
             return
         assert directory.build is not None
         path_count = len(paths)
-        for i, path in enumerate(paths):
-            part = _segments.path_to_part(path)
-            dashed_part_name = abjad.String(part.name).to_dash_case()
-            part_directory = directory / dashed_part_name
-            part_pdf_path = part_directory / dashed_part_name
-            part_pdf_path = part_pdf_path.with_suffix(".pdf")
-            self.io.display(f"building {part_pdf_path.trim()} ...")
-            snake_part_name = abjad.String(part.name).to_snake_case()
-            file_name = f"{snake_part_name}_layout.py"
-            path = part_directory / file_name
-            self._make_layout_ly(path)
-            self.io.display("")
-            file_name = f"{dashed_part_name}-front-cover.tex"
-            path = part_directory / file_name
-            self._interpret_tex_file(path)
-            self.io.display("")
-            file_name = f"{dashed_part_name}-preface.tex"
-            path = part_directory / file_name
-            self._interpret_tex_file(path)
-            self.io.display("")
-            file_name = f"{dashed_part_name}-music.ly"
-            path = part_directory / file_name
-            self._run_lilypond(path)
-            self.io.display("")
-            file_name = f"{dashed_part_name}-back-cover.tex"
-            path = part_directory / file_name
-            self._interpret_tex_file(path)
-            self.io.display("")
-            file_name = f"{dashed_part_name}-part.tex"
-            path = part_directory / file_name
-            self._interpret_tex_file(path)
-            if 1 < path_count and i < path_count - 1:
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            for i, path in enumerate(paths):
+                part = _segments.path_to_part(path)
+                dashed_part_name = abjad.String(part.name).to_dash_case()
+                part_directory = directory / dashed_part_name
+                renders = {}
+                for stem in ("front-cover", "preface", "back-cover"):
+                    tex = part_directory / f"{dashed_part_name}-{stem}.tex"
+                    renders[stem] = executor.submit(self._render_tex_file, tex)
+                part_pdf_path = part_directory / dashed_part_name
+                part_pdf_path = part_pdf_path.with_suffix(".pdf")
+                self.io.display(f"building {part_pdf_path.trim()} ...")
+                snake_part_name = abjad.String(part.name).to_snake_case()
+                file_name = f"{snake_part_name}_layout.py"
+                path = part_directory / file_name
+                self._make_layout_ly(path)
+                self.io.display("")
+                self.io.display(renders["front-cover"].result())
+                self.io.display("")
+                self.io.display(renders["preface"].result())
+                self.io.display("")
+                file_name = f"{dashed_part_name}-music.ly"
+                path = part_directory / file_name
+                self._run_lilypond(path)
                 self.io.display("")
+                self.io.display(renders["back-cover"].result())
+                self.io.display("")
+                file_name = f"{dashed_part_name}-part.tex"
+                path = part_directory / file_name
+                self._interpret_tex_file(path)
+                if 1 < path_count and i < path_count - 1:
+                    self.io.display("")
         if path_count == 1:
             file_name = f"{dashed_part_name}-part.pdf"
             path = part_directory / file_name
             self._open_files([path])
 
+    @Command(
+        "ppp",
+        description="part.pdf - parallel build",
+        menu_section="parts",
+        score_package_paths=("parts",),
+    )
+    def build_part_pdfs_in_parallel(self, directory: pathx.Path) -> int:
+        """
+        Builds ``part.pdf`` for each selected part, running LilyPond on all
+        parts at once.
+
+        Prepares each part in a scratch copy of ``_segments`` with the part's
+        tags activated; leaves the tags in the parts directory untouched.
+        Renders covers and prefaces on a thread pool at the same time.
+        """
+        assert directory.is_parts()
+        name, verb = "part.pdf", "build"
+        paths = self._select_paths_in_buildspace(
+            directory, name, verb, supply_missing=True
+        )
+        if self.is_navigation(paths):
+            return 0
+        if not paths:
+            return 0
+        exit, runs = 0, []
+        with concurrent.futures.ThreadPoolExecutor() as renderer:
+            with concurrent.futures.ProcessPoolExecutor() as executor:
+                for path in paths:
+                    part = _segments.path_to_part(path)
+                    dashed_part_name = abjad.String(part.name).to_dash_case()
+                    part_directory = directory / dashed_part_name
+                    part_pdf_path = part_directory / f"{dashed_part_name}.pdf"
+                    self.io.display(f"building {part_pdf_path.trim()} ...")
+                    snake_part_name = abjad.String(part.name).to_snake_case()
+                    self._make_layout_ly(
+                        part_directory / f"{snake_part_name}_layout.py"
+                    )
+                    self.io.display("")
+                    music_ly = part_directory / f"{dashed_part_name}-music.ly"
+                    if not music_ly.is_file():
+                        self.io.display(f"can not find {music_ly.trim()} ...")
+                        self.io.display("")
+                        exit = -1
+                        continue
+                    pdf = music_ly.with_suffix(".pdf")
+                    if pdf.exists():
+                        self.io.display(f"removing {pdf.trim()} ...")
+                        pdf.remove()
+                    part_identifier = _parse_part_identifier(music_ly)
+                    operations = _part_tag_operations(directory, part_identifier)
+                    future = executor.submit(
+                        _segments.run_part_lilypond, str(music_ly), operations
+                    )
+                    renders = []
+                    for stem in ("front-cover", "preface", "back-cover"):
+                        tex = part_directory / f"{dashed_part_name}-{stem}.tex"
+                        renders.append(renderer.submit(self._render_tex_file, tex))
+                    runs.append((part_directory, music_ly, future, renders))
+                for part_directory, music_ly, future, renders in runs:
+                    for render in renders:
+                        self.io.display(render.result())
+                        self.io.display("")
+                    if not self._finish_part_lilypond(music_ly, future):
+                        exit = -1
+                        self.io.display("")
+                        continue
+                    dashed_part_name = part_directory.name
+                    tex = part_directory / f"{dashed_part_name}-part.tex"
+                    self._interpret_tex_file(tex)
+                    self.io.display("")
+        abjad.iox.spawn_subprocess('say "done"')
+        return exit
+
     @Command(
         "spb",
         description="score.pdf - build",
@@ -2092,50 +2461,110 @@ class AbjadIDE:
     )
     def build_score_pdf(self, directory: pathx.Path) -> None:
         """
-        Builds ``score.pdf`` from the ground up.
+        Builds ``score.pdf``.
+
+        Plans the build as a graph: segment lys, ``music.pdf``, covers,
+        preface and ``score.pdf``. Rebuilds only stale artifacts. Renders
+        covers and preface in parallel with each other and with LilyPond;
+        joins them before assembling ``score.tex``.
         """
         assert directory.is_build() or directory.is__segments()
-        assert directory.build is not None
+        build = directory.build
+        assert build is not None
         self.io.display("building score ...")
-        self.interpret_music_ly(directory.build, open_after=False)
-        self.io.display("")
-        tex = directory.build / "front-cover.tex"
-        pdf = directory.build / "front-cover.pdf"
-        if tex.is_file():
-            self._interpret_tex_file(directory.build / "front-cover.tex")
-        elif pdf.is_file():
-            self.io.display(f"using existing {pdf.trim()} ...")
-        else:
-            self.io.display("missing front cover ...")
-            return
-        self.io.display("")
-        tex = directory.build / "preface.tex"
-        pdf = directory.build / "preface.pdf"
-        if tex.is_file():
-            self._interpret_tex_file(directory.build / "preface.tex")
-        elif pdf:
-            self.io.display(f"using existing {pdf.trim()} ...")
-        else:
-            self.io.display("missing preface ...")
-            return
-        self.io.display("")
-        tex = directory.build / "back-cover.tex"
-        pdf = directory.build / "back-cover.pdf"
-        if tex.is_file():
-            self._interpret_tex_file(directory.build / "back-cover.tex")
-        elif pdf.is_file():
-            self.io.display(f"using existing {pdf.trim()} ...")
-        else:
-            self.io.display("missing back cover ...")
-            return
-        self.io.display("")
-        self.io.display("generating score ...")
-        path = directory.build / "score.tex"
-        self._generate_document(path)
-        self.io.display("")
-        self._interpret_tex_file(path)
-        score_pdf = directory.build / "score.pdf"
-        self._open_files([score_pdf])
+        planner = BuildPlanner(build)
+        pairs = list(self._collect_segment_lys(build))
+        sources, targets = [], []
+        for source, target in pairs:
+            sources.append(source)
+            sources.append(source.with_suffix(".ily"))
+            sources.append(source.parent / "__metadata__.py")
+            targets.append(target)
+            if source.with_suffix(".ily").is_file():
+                targets.append(target.with_suffix(".ily"))
+        planner.add(
+            "_segments",
+            lambda: self.collect_segment_lys(build),
+            inputs=sources,
+            outputs=targets,
+        )
+
+        def interpret_music_ly():
+            self.interpret_music_ly(
+                build, open_after=False, skip_segment_ly_collection=True
+            )
+            self.io.display("")
+
+        inputs = sorted(build.glob("*.ly")) + sorted(build.glob("*.ily"))
+        if build.contents.stylesheets is not None:
+            inputs.extend(sorted(build.contents.stylesheets.glob("*.ily")))
+        planner.add(
+            "music.pdf",
+            interpret_music_ly,
+            inputs=inputs + targets,
+            outputs=[build / "music.pdf"],
+            requires=["_segments"],
+        )
+
+        pdfs = [build / "music.pdf"]
+        for stem, name in (
+            ("front-cover", "front cover"),
+            ("preface", "preface"),
+            ("back-cover", "back cover"),
+        ):
+            tex = build / f"{stem}.tex"
+            pdf = build / f"{stem}.pdf"
+            pdfs.append(pdf)
+            if tex.is_file():
+                planner.add(
+                    pdf.name,
+                    lambda tex=tex: self._render_tex_file(tex),
+                    concurrent=True,
+                    inputs=[tex] + _tex_inputs(tex),
+                    outputs=[pdf],
+                )
+            elif pdf.is_file():
+                self.io.display(f"using existing {pdf.trim()} ...")
+            else:
+                self.io.display(f"missing {name} ...")
+                return
+
+        def interpret_score_tex():
+            self.io.display("generating score ...")
+            path = build / "score.tex"
+            self._generate_document(path)
+            self.io.display("")
+            self._interpret_tex_file(path)
+
+        score_pdf = build / "score.pdf"
+        planner.add(
+            score_pdf.name,
+            interpret_score_tex,
+            inputs=pdfs
+            + [
+                build / "__metadata__.py",
+                build.contents / "__metadata__.py",
+                pathx.Path(self.configuration.boilerplate_directory) / "score.tex",
+            ],
+            outputs=[score_pdf],
+            requires=[_ for _ in planner.names if _.endswith(".pdf")],
+        )
+        stale = planner.get_stale_names()
+        for name in planner.names:
+            if name not in stale:
+                self.io.display(f"skipping {name} (up to date) ...")
+
+        def finish(name, messages):
+            if name in rendered:
+                self.io.display(messages)
+                self.io.display("")
+
+        rendered = [_.name for _ in pdfs[1:]]
+        failed = planner.run(finish=finish)
+        if failed:
+            self.io.display(f"could not build {', '.join(failed)} ...")
+        if score_pdf.is_file():
+            self._open_files([score_pdf])
 
     @Command(
         "ggc",
@@ -2176,53 +2605,57 @@ class AbjadIDE:
         _make__segments_directory(directory.build)
         fermata_measure_numbers = abjad.OrderedDict()
         time_signatures = abjad.OrderedDict()
-        for source, target in pairs:
-            source_ily = source.with_suffix(".ily")
-            target_ily = target.with_suffix(".ily")
-            if target_ily.exists():
-                self.io.display(f"Removing {target_ily.trim()} ...", indent=indent + 1)
-            if source_ily.is_file():
-                self.io.display(
-                    f"Writing {target_ily.trim()} ...",
-                    indent=indent + 1,
-                )
-                shutil.copyfile(str(source_ily), target_ily)
-            if target.exists():
+        with self.io.buffered():
+            for source, target in pairs:
+                source_ily = source.with_suffix(".ily")
+                target_ily = target.with_suffix(".ily")
+                if target_ily.exists():
+                    self.io.display(
+                        f"Removing {target_ily.trim()} ...", indent=indent + 1
+                    )
+                if source_ily.is_file():
+                    self.io.display(
+                        f"Writing {target_ily.trim()} ...",
+                        indent=indent + 1,
+                    )
+                    shutil.copyfile(str(source_ily), target_ily)
+                if target.exists():
+                    self.io.display(
+                        f"Removing {target.trim()} ...",
+                        indent=indent + 1,
+                    )
                 self.io.display(
-                    f"Removing {target.trim()} ...",
+                    f"Writing {target.trim()} ...",
                     indent=indent + 1,
                 )
-            self.io.display(
-                f"Writing {target.trim()} ...",
-                indent=indent + 1,
-            )
-            text = _trim_illustration_ly(source)
-            target.write_text(text)
-            segment = source.parent
-            value = segment.get_metadatum("fermata_measure_numbers")
-            if value:
-                fermata_measure_numbers[segment.name] = value
-            value = segment.get_metadatum("time_signatures")
-            if value:
-                time_signatures[segment.name] = value
-        key = "fermata_measure_numbers"
-        if bool(fermata_measure_numbers):
-            message = "writing fermata measure numbers to metadata ..."
-            self.io.display(message, indent=indent + 1)
-            directory.contents.add_metadatum(key, fermata_measure_numbers)
-        else:
-            message = "removing fermata measure numbers from metadata ..."
-            self.io.display(message, indent=indent + 1)
-            directory.contents.remove_metadatum(key)
-        key = "time_signatures"
-        if bool(time_signatures):
-            message = "writing time signatures to metadata ..."
-            self.io.display(message, indent=indent + 1)
-            directory.contents.add_metadatum(key, time_signatures)
-        else:
-            message = "removing time signatures from metadata ..."
-            self.io.display(message, indent=indent + 1)
-            directory.contents.remove_metadatum(key)
+                text = _trim_illustration_ly(source)
+                target.write_text(text)
+                segment = source.parent
+                value = segment.get_metadatum("fermata_measure_numbers")
+                if value:
+                    fermata_measure_numbers[segment.name] = value
+                value = segment.get_metadatum("time_signatures")
+                if value:
+                    time_signatures[segment.name] = value
+        with directory.contents.metadata_transaction():
+            key = "fermata_measure_numbers"
+            if bool(fermata_measure_numbers):
+                message = "writing fermata measure numbers to metadata ..."
+                self.io.display(message, indent=indent + 1)
+                directory.contents.add_metadatum(key, fermata_measure_numbers)
+            else:
+                message = "removing fermata measure numbers from metadata ..."
+                self.io.display(message, indent=indent + 1)
+                directory.contents.remove_metadatum(key)
+            key = "time_signatures"
+            if bool(time_signatures):
+                message = "writing time signatures to metadata ..."
+                self.io.display(message, indent=indent + 1)
+                directory.contents.add_metadatum(key, time_signatures)
+            else:
+                message = "removing time signatures from metadata ..."
+                self.io.display(message, indent=indent + 1)
+                directory.contents.remove_metadatum(key)
         self.handle_build_tags(directory, indent=indent)
 
     @Command(
@@ -2513,7 +2946,7 @@ class AbjadIDE:
             return False
 
         _segments = directory._segments
-        for job in [
+        jobs = [
             _jobs.handle_edition_tags(_segments),
             _jobs.handle_fermata_bar_lines(directory),
             _jobs.handle_shifted_clefs(_segments),
@@ -2563,8 +2996,8 @@ class AbjadIDE:
                 _tags.METRIC_MODULATION_IS_SCALED,
                 undo=True,
             ),
-        ]:
-            self.run(job, indent=1, quiet=False)
+        ]
+        self.run_jobs(jobs, indent=1, quiet=False)
 
     @Command(
         "ptags",
@@ -2595,100 +3028,17 @@ class AbjadIDE:
             message = "can not find {directory.trim()} music.ly file ..."
             self.io.display(message, indent=indent + 1)
         music_ly = paths[0]
-        self.activate(
-            parts_directory,
-            "+PARTS",
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.deactivate(
-            parts_directory,
-            "-PARTS",
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.deactivate(
-            parts_directory,
-            "HIDE_IN_PARTS",
-            indent=indent + 1,
-            message_zero=True,
-        )
         part_identifier = _parse_part_identifier(music_ly)
+        operations = _part_tag_operations(parts_directory, part_identifier)
+        operations = [(abjad.Tag(_), deactivate) for _, deactivate in operations]
+        result = parts_directory.activate_tags(
+            operations, indent=indent + 1, message_zero=True
+        )
+        for count, skipped, messages in result:
+            self.io.display(messages)
         if part_identifier is None:
             message = f"no part identifier found in {music_ly.trim()} ..."
             self.io.display(message, indent=indent + 1)
-            return
-        parts_directory_name = abjad.String(parts_directory.name)
-        parts_directory_name = parts_directory_name.to_shout_case()
-        name = f"{parts_directory_name}_{part_identifier}"
-        self.activate(
-            parts_directory,
-            f"+{name}",
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.deactivate(
-            parts_directory,
-            f"-{name}",
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.deactivate(
-            parts_directory,
-            str(_tags.METRIC_MODULATION_IS_SCALED),
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.deactivate(
-            parts_directory,
-            str(_tags.METRIC_MODULATION_IS_NOT_SCALED),
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.activate(
-            parts_directory,
-            str(_tags.METRIC_MODULATION_IS_STRIPPED),
-            indent=indent + 1,
-            message_zero=True,
-        )
-        # HACK TO HIDE ALL POST-FERMATA-MEASURE TRANSPARENT BAR LINES;
-        # this only works if parts contain no EOL fermata measure:
-        self.deactivate(
-            parts_directory,
-            str(_tags.FERMATA_MEASURE),
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.activate(
-            parts_directory,
-            "NOT_TOPMOST",
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.deactivate(
-            parts_directory,
-            "FERMATA_MEASURE_EMPTY_BAR_EXTENT",
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.deactivate(
-            parts_directory,
-            "FERMATA_MEASURE_NEXT_BAR_EXTENT",
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.deactivate(
-            parts_directory,
-            "FERMATA_MEASURE_RESUME_BAR_EXTENT",
-            indent=indent + 1,
-            message_zero=True,
-        )
-        self.deactivate(
-            parts_directory,
-            str(_tags.EXPLICIT_BAR_EXTENT),
-            indent=indent + 1,
-            message_zero=True,
-        )
 
     @Command(
         "hide",
@@ -2867,34 +3217,83 @@ class AbjadIDE:
         score_package_paths=("segment", "segments"),
     )
     def make_illustration_pdf(
-        self, directory: pathx.Path, layout: bool = True, open_after: bool = True
+        self,
+        directory: pathx.Path,
+        layout: bool = True,
+        open_after: bool = True,
+        *,
+        build: str = None,
+        incremental: bool = False,
+        parallel: bool = False,
     ) -> int:
         """
         Makes ``illustration.pdf``.
 
+        Records stage timings of each segment under ``build`` (or under a new
+        build identifier) in the score's timing store.
+
+        Skips segments whose inputs are unchanged since the last successful
+        build when ``incremental`` is true.
+
+        Runs segment-makers in order and LilyPond on a process pool when
+        ``parallel`` is true: segment-maker N starts once segment N-1 has
+        written its metadata and persist files.
+
         Returns integer exit code for Travis tests.
         """
         assert directory.is_segment() or directory.is_segments()
         if directory.is_segment():
+            if incremental and self._skip_segment_pdf(directory):
+                return 0
             return self._make_segment_pdf(
-                directory, layout=layout, open_after=open_after
+                directory, layout=layout, open_after=open_after, build=build
             )
         else:
             assert directory.is_segments()
             exit = 0
             paths = directory.list_paths()
             paths = [_ for _ in paths if _.is_dir()]
+            if parallel:
+                return self._make_segment_pdfs_in_parallel(
+                    paths, layout=layout, incremental=incremental
+                )
+            build = build or TimingStore.get_build_id()
+            skipped = []
             for i, path in enumerate(paths):
-                exit_ = self.make_illustration_pdf(path, open_after=False)
+                if incremental and self._skip_segment_pdf(path):
+                    skipped.append(path.name)
+                    exit_ = 0
+                else:
+                    exit_ = self.make_illustration_pdf(
+                        path, open_after=False, build=build
+                    )
                 if i + 1 < len(paths):
                     self.io.display("")
                 else:
                     abjad.iox.spawn_subprocess('say "done"')
                 if exit_ != 0:
                     exit = -1
+            if incremental:
+                self._display_skipped_segments(paths, skipped)
             return exit
         return 0
 
+    @Command(
+        "ipp",
+        description="illustration.pdf - parallel",
+        menu_section="illustration",
+        score_package_paths=("segments",),
+    )
+    def make_illustration_pdfs_in_parallel(self, directory: pathx.Path) -> int:
+        """
+        Makes ``illustration.pdf`` in every segment; runs LilyPond in parallel;
+        does not open after.
+
+        Returns integer exit code for Travis tests.
+        """
+        assert directory.is_segments(), repr(directory)
+        return self.make_illustration_pdf(directory, open_after=False, parallel=True)
+
     @Command(
         "ctm",
         description="clicktrack - make",
@@ -2934,10 +3333,15 @@ class AbjadIDE:
         menu_section="segment.midi",
         score_package_paths=("segment", "segments"),
     )
-    def make_segment_midi(self, directory: pathx.Path, open_after: bool = True) -> int:
+    def make_segment_midi(
+        self, directory: pathx.Path, open_after: bool = True, *, parallel: bool = False
+    ) -> int:
         """
         Makes segment MIDI file.
 
+        Runs segment-makers in order and LilyPond on a process pool when
+        ``parallel`` is true.
+
         Returns integer exit code for Travis tests.
         """
         assert directory.is_segment() or directory.is_segments()
@@ -2948,6 +3352,8 @@ class AbjadIDE:
             exit = 0
             paths = directory.list_paths()
             paths = [_ for _ in paths if _.is_dir()]
+            if parallel:
+                return self._make_segment_midis_in_parallel(paths)
             for i, path in enumerate(paths):
                 exit_ = self._make_segment_midi(path, open_after=False)
                 if i + 1 < len(paths):
@@ -2959,6 +3365,22 @@ class AbjadIDE:
             return exit
         return 0
 
+    @Command(
+        "midp",
+        description="segment.midi - parallel",
+        menu_section="segment.midi",
+        score_package_paths=("segments",),
+    )
+    def make_segment_midis_in_parallel(self, directory: pathx.Path) -> int:
+        """
+        Makes ``segment.midi`` in every segment; runs LilyPond in parallel;
+        does not open after.
+
+        Returns integer exit code for Travis tests.
+        """
+        assert directory.is_segments(), repr(directory)
+        return self.make_segment_midi(directory, open_after=False, parallel=True)
+
     @Command(
         "ipn",
         description="illustration.pdf - nake",
@@ -3100,6 +3522,50 @@ class AbjadIDE:
         tag = abjad.Tag(tag_)
         self.run(_jobs.show_tag(directory, tag))
 
+    @Command(
+        "tms",
+        description="timings - show",
+        menu_section="segments",
+        score_package_paths=True,
+    )
+    def show_timings(self, directory: pathx.Path) -> None:
+        """
+        Shows segment build timings: total time of recent builds, slowest
+        segments and segments that regressed in the latest build.
+        """
+        assert directory.etc is not None
+        store = TimingStore(directory.etc)
+        trends = store.get_trends()
+        if not trends:
+            self.io.display(f"no timings in {directory.etc.trim()} ...")
+            return
+        self.io.display("builds ...")
+        previous = None
+        for trend in trends:
+            message = f"{trend['build']} {trend['revision'] or '-'}"
+            message += f" {trend['host']} {trend['segment_count']} segments"
+            message += f" {trend['total']:.1f} s"
+            if previous:
+                change = round(100 * (trend["total"] - previous) / previous)
+                message += f" ({change:+d}%)"
+            self.io.display(message, indent=1)
+            previous = trend["total"]
+        self.io.display("")
+        self.io.display("slowest segments ...")
+        for segment, seconds in store.get_slowest(count=5):
+            self.io.display(f"{segment} {seconds:.1f} s", indent=1)
+        regressions = store.get_regressions()
+        if not regressions:
+            return
+        self.io.display("")
+        self.io.display("regressions ...")
+        for regression in regressions:
+            message = f"{regression['segment']} {regression['seconds']:.1f} s"
+            message += f" (median {regression['baseline']:.1f} s)"
+            message += f" in {regression['build']}"
+            message += f" at {regression['revision'] or '-'}"
+            self.io.display(message, indent=1)
+
     @Command(
         "uncolor",
         description="uncolor",
@@ -3119,6 +3585,22 @@ class AbjadIDE:
             job_ = job(directory, undo=True)
             self.run(job_)
 
+    @Command(
+        "ipu",
+        description="illustration.pdf - update",
+        menu_section="illustration",
+        score_package_paths=("segment", "segments"),
+    )
+    def update_illustration_pdf(self, directory: pathx.Path) -> int:
+        """
+        Makes ``illustration.pdf`` only for segments whose inputs changed; does
+        not open after.
+
+        Returns integer exit code for Travis tests.
+        """
+        assert directory.is_segment() or directory.is_segments()
+        return self.make_illustration_pdf(directory, open_after=False, incremental=True)
+
     @Command(
         "mlx",
         description="music.ly - xinterpret",
@@ -0,0 +1,226 @@
+import concurrent.futures
+import json
+import os
+import typing
+
+
+class BuildPlanner:
+    """
+    Build planner.
+
+    Models build artifacts as a dependency graph of named nodes. Each node
+    has an action, input files, output files and the names of the nodes it
+    requires. Records a stamp (modification time and size) of each node's
+    inputs in the directory's ``.stamps`` file after the node builds and
+    reruns only stale nodes: nodes with missing outputs, changed inputs or a
+    stale requirement.
+
+    Runs nodes in the order they were added, as soon as their requirements
+    finish. Nodes added with ``concurrent=True`` run on a thread pool alongside
+    other ready nodes; their actions must not change directory or write to
+    shared files.
+
+    ..  container:: example
+
+        >>> planner = ide.BuildPlanner("/path/to/scores/my_score/my_score/builds/letter")
+        >>> planner
+        BuildPlanner('/path/to/scores/my_score/my_score/builds/letter')
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_directory", "_nodes", "_stamps")
+
+    _file_name = ".stamps"
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory) -> None:
+        self._directory = str(directory)
+        self._nodes: typing.Dict[str, typing.Dict] = {}
+        self._stamps: typing.Dict[str, typing.Dict] = {}
+        self._read()
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return f"BuildPlanner('{self._directory}')"
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_stamp(paths) -> typing.Dict[str, typing.Optional[typing.List[int]]]:
+        stamp: typing.Dict[str, typing.Optional[typing.List[int]]] = {}
+        for path in paths:
+            try:
+                stat = os.stat(str(path))
+            except OSError:
+                stamp[str(path)] = None
+            else:
+                stamp[str(path)] = [stat.st_mtime_ns, stat.st_size]
+        return stamp
+
+    def _read(self) -> None:
+        path = os.path.join(self._directory, self._file_name)
+        try:
+            with open(path) as pointer:
+                stamps = json.load(pointer)
+        except (OSError, ValueError):
+            return
+        if isinstance(stamps, dict):
+            self._stamps = stamps
+
+    def _run_node(self, name) -> typing.Tuple[bool, typing.Any]:
+        node = self._nodes[name]
+        result = node["action"]()
+        if all(os.path.exists(_) for _ in node["outputs"]):
+            self._stamps[name] = self._get_stamp(node["inputs"])
+            return True, result
+        self._stamps.pop(name, None)
+        return False, result
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory(self) -> str:
+        """
+        Gets directory.
+
+        ..  container:: example
+
+            >>> planner = ide.BuildPlanner("/path/to/scores/my_score/my_score/builds/letter")
+            >>> planner.directory
+            '/path/to/scores/my_score/my_score/builds/letter'
+
+        """
+        return self._directory
+
+    @property
+    def names(self) -> typing.List[str]:
+        """
+        Gets node names in the order nodes were added.
+
+        ..  container:: example
+
+            >>> planner = ide.BuildPlanner("/path/to/scores/my_score/my_score/builds/letter")
+            >>> planner.add("music.pdf", print)
+            >>> planner.add("score.pdf", print, requires=["music.pdf"])
+            >>> planner.names
+            ['music.pdf', 'score.pdf']
+
+        """
+        return list(self._nodes)
+
+    ### PUBLIC METHODS ###
+
+    def add(
+        self,
+        name: str,
+        action: typing.Callable,
+        *,
+        concurrent: bool = False,
+        inputs: typing.Sequence = (),
+        outputs: typing.Sequence = (),
+        requires: typing.Sequence[str] = (),
+    ) -> None:
+        """
+        Adds node ``name`` built by calling ``action``.
+
+        Requires every node in ``requires`` to be added first; the graph is
+        acyclic by construction.
+        """
+        assert name not in self._nodes, repr(name)
+        for name_ in requires:
+            assert name_ in self._nodes, repr(name_)
+        self._nodes[name] = {
+            "action": action,
+            "concurrent": concurrent,
+            "inputs": [str(_) for _ in inputs],
+            "outputs": [str(_) for _ in outputs],
+            "requires": list(requires),
+        }
+
+    def get_stale_names(self) -> typing.List[str]:
+        """
+        Gets names of stale nodes in the order nodes were added.
+        """
+        stale: typing.List[str] = []
+        for name, node in self._nodes.items():
+            if (
+                any(_ in stale for _ in node["requires"])
+                or not all(os.path.exists(_) for _ in node["outputs"])
+                or self._stamps.get(name) != self._get_stamp(node["inputs"])
+            ):
+                stale.append(name)
+        return stale
+
+    def run(
+        self, finish: typing.Callable[[str, typing.Any], None] = None
+    ) -> typing.List[str]:
+        """
+        Runs stale nodes.
+
+        Skips nodes whose requirements fail. Calls ``finish`` with name and
+        action result of each node that runs, on the calling thread and, for
+        concurrent nodes, in the order nodes were added. Writes stamps when
+        done.
+
+        Returns names of nodes that failed or were skipped.
+        """
+        stale = self.get_stale_names()
+        pending = list(stale)
+        finished = set(self._nodes) - set(stale)
+        failed: typing.Set[str] = set()
+        futures: typing.Dict[str, concurrent.futures.Future] = {}
+
+        def complete(name, success, result):
+            if finish is not None:
+                finish(name, result)
+            if success:
+                finished.add(name)
+            else:
+                failed.add(name)
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                while pending or futures:
+                    for name in list(pending):
+                        if any(_ in failed for _ in self._nodes[name]["requires"]):
+                            pending.remove(name)
+                            failed.add(name)
+                    ready = [
+                        _
+                        for _ in pending
+                        if all(name in finished for name in self._nodes[_]["requires"])
+                    ]
+                    for name in ready:
+                        if self._nodes[name]["concurrent"]:
+                            pending.remove(name)
+                            futures[name] = executor.submit(self._run_node, name)
+                    serial = [_ for _ in ready if not self._nodes[_]["concurrent"]]
+                    if serial:
+                        name = serial[0]
+                        pending.remove(name)
+                        complete(name, *self._run_node(name))
+                        continue
+                    if not futures:
+                        break
+                    name = next(iter(futures))
+                    complete(name, *futures.pop(name).result())
+        finally:
+            self.write()
+        return [_ for _ in stale if _ in failed]
+
+    def write(self) -> None:
+        """
+        Writes stamps to ``.stamps``.
+        """
+        path = os.path.join(self._directory, self._file_name)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as pointer:
+            json.dump(self._stamps, pointer, sort_keys=True)
+        os.replace(temporary_path, path)
@@ -1,6 +1,9 @@
+import functools
 import string
 import typing
 
+from .Profiler import Profiler
+
 
 def _is_valid_command_name(argument):
     if not isinstance(argument, str):
@@ -90,18 +93,34 @@ class Command:
         """
         Calls command decorator on ``method``.
 
+        Wraps ``method`` in a profiler when profiling is on; profiles only the
+        outermost command when commands call other commands.
+
         Returns ``method`` with metadata attached.
         """
-        method.score_package_path_blacklist = self.score_package_path_blacklist
-        method.command_name = self.command_name
+        command_name = self.command_name
+
+        @functools.wraps(method)
+        def wrapper(abjad_ide, *arguments, **keywords):
+            modes = Profiler.get_modes() if not Profiler.is_active() else ()
+            if not modes:
+                return method(abjad_ide, *arguments, **keywords)
+            profiler = Profiler(command_name, modes=modes)
+            with profiler:
+                result = method(abjad_ide, *arguments, **keywords)
+            abjad_ide._display_profile(profiler)
+            return result
+
+        wrapper.score_package_path_blacklist = self.score_package_path_blacklist
+        wrapper.command_name = self.command_name
         if self.description is not None:
-            method.description = self.description
+            wrapper.description = self.description
         else:
-            method.description = method.__name__.replace("_", " ")
-        method.external_directories = self.external_directories
-        method.menu_section = self.menu_section
-        method.score_package_paths = self.score_package_paths
-        method.scores_directory = self.scores_directory
-        return method
+            wrapper.description = method.__name__.replace("_", " ")
+        wrapper.external_directories = self.external_directories
+        wrapper.menu_section = self.menu_section
+        wrapper.score_package_paths = self.score_package_paths
+        wrapper.scores_directory = self.scores_directory
+        return wrapper
 
     ### PRIVATE METHODS ###
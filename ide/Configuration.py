@@ -64,7 +64,33 @@ class Configuration(abjad.Configuration):
         ]
 
     def _get_option_definitions(self):
-        return {}
+        return {
+            "profile": {
+                "comment": [
+                    "Set to profile IDE commands: any of times, cprofile, stacks",
+                    "(comma-separated). Overridden by IDE_PROFILE environment",
+                    "variable. Defaults to no profiling.",
+                ],
+                "default": "",
+                "validator": str,
+            },
+            "transcript_path": {
+                "comment": [
+                    "Set to path of file to append every displayed line to.",
+                    "Defaults to none.",
+                ],
+                "default": "",
+                "validator": str,
+            },
+            "transcript_size": {
+                "comment": [
+                    "Set to number of most recent displayed lines to keep in",
+                    "memory. Defaults to 10000.",
+                ],
+                "default": "10000",
+                "validator": lambda _: str(_).isdigit() and 0 < int(_),
+            },
+        }
 
     def _make_missing_directories(self):
         directory = self.abjad_configuration.composer_scores_directory
@@ -162,6 +188,19 @@ class Configuration(abjad.Configuration):
         """
         return pathx.Path(self.configuration_directory / "latex.log")
 
+    @property
+    def profiles_directory(self) -> pathx.Path:
+        """
+        Gets profiles directory path.
+
+        ..  container:: example
+
+            >>> ide.Configuration().profiles_directory
+            Path('.../.abjad/profiles')
+
+        """
+        return pathx.Path(self.configuration_directory / "profiles")
+
     @property
     def test_scores_directory(self) -> pathx.Path:
         """
@@ -1,4 +1,8 @@
+import contextlib
 import os
+import signal
+import sys
+import threading
 import typing
 
 import abjad
@@ -19,7 +23,15 @@ class IO:
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_pending_input", "_transcript")
+    __slots__ = ("_buffer", "_pending_input", "_transcript")
+
+    _buffer_size = 64
+
+    _terminal_width: typing.Optional[int] = None
+
+    _terminal_width_known = False
+
+    _watching_terminal = False
 
     ### SPECIAL METHODS ###
 
@@ -31,9 +43,52 @@ class IO:
 
     ### INITIALIZER ###
 
-    def __init__(self) -> None:
+    def __init__(self, transcript: Transcript = None) -> None:
+        self._buffer: typing.Optional[typing.List[str]] = None
         self._pending_input: typing.Optional[str] = None
-        self._transcript = Transcript()
+        if transcript is None:
+            transcript = Transcript()
+        assert isinstance(transcript, Transcript), repr(transcript)
+        self._transcript = transcript
+
+    ### PRIVATE METHODS ###
+
+    def _get_format_specification(self):
+        return abjad.FormatSpecification(client=self, repr_keyword_names=[])
+
+    @staticmethod
+    def _get_terminal_width() -> typing.Optional[int]:
+        if not IO._watching_terminal:
+            IO._watch_terminal()
+        if not IO._terminal_width_known:
+            try:
+                IO._terminal_width = os.get_terminal_size(0).columns or None
+            except OSError:
+                IO._terminal_width = None
+            IO._terminal_width_known = True
+        return IO._terminal_width
+
+    @staticmethod
+    def _watch_terminal() -> None:
+        IO._watching_terminal = True
+        if not hasattr(signal, "SIGWINCH"):
+            return
+        if threading.current_thread() is not threading.main_thread():
+            IO._watching_terminal = False
+            return
+        previous = signal.getsignal(signal.SIGWINCH)
+
+        def handler(number, frame):
+            IO._terminal_width_known = False
+            if callable(previous):
+                previous(number, frame)
+
+        signal.signal(signal.SIGWINCH, handler)
+
+    def _write(self, lines) -> None:
+        if not lines:
+            return
+        sys.stdout.write("\n".join(lines) + "\n")
 
     ### PUBLIC PROPERTIES ###
 
@@ -46,6 +101,24 @@ class IO:
 
     ### PUBLIC METHODS ###
 
+    @contextlib.contextmanager
+    def buffered(self) -> typing.Iterator[None]:
+        """
+        Buffers displayed lines; writes them in batches.
+
+        Writes buffer every ``64`` lines, before prompting for input and on
+        exit. Nests.
+        """
+        if self._buffer is not None:
+            yield
+            return
+        self._buffer = []
+        try:
+            yield
+        finally:
+            self.flush()
+            self._buffer = None
+
     def display(
         self,
         lines: typing.Union[
@@ -58,6 +131,9 @@ class IO:
     ) -> None:
         """
         Displays lines.
+
+        Truncates lines to terminal width unless ``wrap`` is true. Gets
+        terminal width once and again only after terminal resizes.
         """
         assert isinstance(lines, (str, list)), repr(lines)
         if isinstance(lines, str):
@@ -70,12 +146,24 @@ class IO:
         if lines:
             self.transcript.append(lines, is_menu=is_menu)
         if wrap is not True:
-            result = os.popen("stty size", "r").read().split()
-            if result:
-                width = int(result[1])
+            width = self._get_terminal_width()
+            if width is not None:
                 lines = [_[:width] for _ in lines]
-        for line in lines:
-            print(line)
+        if self._buffer is None:
+            self._write(lines)
+            return
+        self._buffer.extend(lines)
+        if self._buffer_size <= len(self._buffer):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes buffered lines.
+        """
+        if self._buffer:
+            self._write(self._buffer)
+            self._buffer.clear()
+        sys.stdout.flush()
 
     def get(self, prompt: str = None) -> typing.Optional[str]:
         """
@@ -85,6 +173,7 @@ class IO:
 
         Returns string when user types input and then hits return.
         """
+        self.flush()
         prompt = prompt or ""
         prompt = abjad.String(prompt).capitalize_start() + "> "
         if self._pending_input:
@@ -0,0 +1,212 @@
+import re
+import typing
+
+
+class LilyPondLog:
+    r"""
+    LilyPond log.
+
+    Classifies LilyPond output one line at a time. Parses each diagnostic
+    into a record with file, line, column, severity, category and text; drops
+    diagnostics in suppressed categories (together with the source-context
+    lines LilyPond prints after them) as they arrive; and writes every other
+    line to an optional file pointer. Also counts other lines that mention
+    failure (like Guile errors). Keeps counts and the first few errors, never
+    the whole log.
+
+    ..  container:: example
+
+        >>> log = ide.LilyPondLog(suppress=ide.LilyPondLog.noisy_categories)
+        >>> log.feed("music.ly:12:5: warning: crescendo too small\n")
+        >>> log.feed("    c'4 \\<\n")
+        >>> log.feed("        d'4 \\!\n")
+        >>> record = log.feed("music.ly:14:3: error: syntax error, unexpected }\n")
+        >>> record["severity"], record["category"], record["line"]
+        ('error', 'syntax error', 14)
+        >>> log.counts
+        {'error': 1}
+        >>> log.suppressed_count
+        1
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_counts",
+        "_errors",
+        "_failure_count",
+        "_pointer",
+        "_skip",
+        "_suppress",
+        "_suppressed_count",
+    )
+
+    _error_severities = ("error", "fatal error")
+
+    _located_pattern = re.compile(
+        r"^(?P<file>[^:\n]+):(?P<line>\d+):(?P<column>\d+): "
+        r"(?P<severity>warning|error|fatal error|programming error): "
+        r"(?P<text>.*)$"
+    )
+
+    _maximum_error_count = 20
+
+    _unlocated_pattern = re.compile(
+        r"^(?P<severity>warning|error|fatal error|programming error): (?P<text>.*)$"
+    )
+
+    noisy_categories = (
+        "crescendo too small",
+        "decrescendo too small",
+        "overwriting glissando",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, pointer=None, suppress: typing.Sequence[str] = ()) -> None:
+        self._counts: typing.Dict[str, int] = {}
+        self._errors: typing.List[typing.Dict] = []
+        self._failure_count = 0
+        self._pointer = pointer
+        self._skip = 0
+        self._suppress = tuple(suppress)
+        self._suppressed_count = 0
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return f"LilyPondLog(counts={self._counts!r})"
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def counts(self) -> typing.Dict[str, int]:
+        """
+        Gets count of (unsuppressed) diagnostics by severity.
+        """
+        return dict(self._counts)
+
+    @property
+    def error_count(self) -> int:
+        """
+        Gets count of errors and fatal errors.
+        """
+        return sum(self._counts.get(_, 0) for _ in self._error_severities)
+
+    @property
+    def errors(self) -> typing.List[typing.Dict]:
+        """
+        Gets first (twenty) error records.
+        """
+        return list(self._errors)
+
+    @property
+    def failure_count(self) -> int:
+        """
+        Gets count of lines that are not diagnostics but mention ``fatal``,
+        ``error`` (other than ``programming error``) or ``failed``.
+        """
+        return self._failure_count
+
+    @property
+    def suppressed_count(self) -> int:
+        """
+        Gets count of suppressed diagnostics.
+        """
+        return self._suppressed_count
+
+    ### PUBLIC METHODS ###
+
+    def feed(self, line: str) -> typing.Optional[typing.Dict]:
+        """
+        Feeds one ``line`` of LilyPond output to log.
+
+        Returns record when ``line`` is an unsuppressed diagnostic.
+        """
+        if 0 < self._skip:
+            self._skip -= 1
+            return None
+        record = self.parse_line(line)
+        if record is not None and record["category"] in self._suppress:
+            self._suppressed_count += 1
+            if record["line"] is not None:
+                self._skip = 2
+            elif record["severity"] == "programming error":
+                self._skip = 1
+            return None
+        if self._pointer is not None:
+            self._pointer.write(line)
+        if record is None:
+            if (
+                "fatal" in line
+                or ("error" in line and "programming error" not in line)
+                or "failed" in line
+            ):
+                self._failure_count += 1
+            return None
+        severity = record["severity"]
+        self._counts[severity] = self._counts.get(severity, 0) + 1
+        if severity in self._error_severities:
+            if len(self._errors) < self._maximum_error_count:
+                self._errors.append(record)
+        return record
+
+    @staticmethod
+    def parse_line(line: str) -> typing.Optional[typing.Dict]:
+        """
+        Parses LilyPond diagnostic ``line``.
+
+        Category is diagnostic text up to the first colon or comma.
+
+        ..  container:: example
+
+            >>> record = ide.LilyPondLog.parse_line(
+            ...     "programming error: overwriting glissando"
+            ... )
+            >>> for key, value in record.items():
+            ...     print(f"{key}: {value!r}")
+            file: None
+            line: None
+            column: None
+            severity: 'programming error'
+            category: 'overwriting glissando'
+            text: 'overwriting glissando'
+
+        Returns none when ``line`` is not a diagnostic.
+        """
+        line = line.rstrip("\n")
+        match = LilyPondLog._located_pattern.match(line)
+        if match is not None:
+            file_ = match.group("file")
+            number = int(match.group("line"))
+            column = int(match.group("column"))
+        else:
+            match = LilyPondLog._unlocated_pattern.match(line)
+            if match is None:
+                return None
+            file_, number, column = None, None, None
+        text = match.group("text").strip()
+        category = re.split(r"[:,]", text, maxsplit=1)[0].strip()
+        return {
+            "file": file_,
+            "line": number,
+            "column": column,
+            "severity": match.group("severity"),
+            "category": category,
+            "text": text,
+        }
+
+    @staticmethod
+    def read(path, suppress: typing.Sequence[str] = ()) -> "LilyPondLog":
+        """
+        Reads LilyPond log file at ``path`` one line at a time.
+        """
+        log = LilyPondLog(suppress=suppress)
+        with open(str(path), errors="ignore") as pointer:
+            for line in pointer:
+                log.feed(line)
+        return log
@@ -0,0 +1,281 @@
+import cProfile
+import collections
+import json
+import os
+import sys
+import threading
+import time
+import typing
+
+try:
+    import resource
+except ImportError:
+    resource = None  # type: ignore
+
+
+class Profiler:
+    """
+    Profiler.
+
+    Profiles one IDE command. Measures wall time, CPU time of the IDE process,
+    CPU time of makers, CPU time of finished subprocesses (LilyPond, LaTeX)
+    and bytes the IDE process read and wrote. Makers run in a long-lived
+    worker process, which reports their CPU time after each maker (see
+    ``Profiler.add_maker_times()``). Optionally runs cProfile (``cprofile``
+    mode) or samples the calling thread's stack every few milliseconds and
+    counts collapsed stacks for flame graphs (``stacks`` mode).
+
+    Enabled by the ``IDE_PROFILE`` environment variable or the ``profile``
+    configuration option; see ``Profiler.get_modes()``.
+
+    ..  container:: example
+
+        >>> profiler = ide.Profiler("mli", modes=("times",))
+        >>> profiler
+        Profiler('mli')
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_command_name",
+        "_end",
+        "_modes",
+        "_profile",
+        "_sampler",
+        "_stacks",
+        "_start",
+        "_stopped",
+        "_thread_id",
+    )
+
+    _active = False
+
+    _configuration = None
+
+    _interval = 0.005
+
+    # CPU time makers and their subprocesses spent in the maker worker, as
+    # reported by the worker:
+    _maker_cpu = 0.0
+
+    _maker_subprocess = 0.0
+
+    known_modes = ("times", "cprofile", "stacks")
+
+    ### INITIALIZER ###
+
+    def __init__(self, command_name: str, modes: typing.Sequence[str] = ("times",)):
+        for mode in modes:
+            assert mode in self.known_modes, repr(mode)
+        self._command_name = command_name
+        self._end: typing.Dict[str, typing.Optional[float]] = {}
+        self._modes = tuple(modes)
+        self._profile: typing.Optional[cProfile.Profile] = None
+        self._sampler: typing.Optional[threading.Thread] = None
+        self._stacks: typing.Counter[str] = collections.Counter()
+        self._start: typing.Dict[str, typing.Optional[float]] = {}
+        self._stopped = threading.Event()
+        self._thread_id = threading.get_ident()
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "Profiler":
+        """
+        Starts profiling.
+        """
+        Profiler._active = True
+        self._thread_id = threading.get_ident()
+        if "stacks" in self._modes:
+            self._sampler = threading.Thread(target=self._sample, daemon=True)
+            self._sampler.start()
+        self._start = self._get_counters()
+        if "cprofile" in self._modes:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Stops profiling.
+        """
+        if self._profile is not None:
+            self._profile.disable()
+        self._end = self._get_counters()
+        if self._sampler is not None:
+            self._stopped.set()
+            self._sampler.join()
+        Profiler._active = False
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return f"Profiler('{self._command_name}')"
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_counters() -> typing.Dict[str, typing.Optional[float]]:
+        counters: typing.Dict[str, typing.Optional[float]] = {
+            "cpu": time.process_time(),
+            "makers": Profiler._maker_cpu,
+            "read_bytes": None,
+            "subprocess": None,
+            "wall": time.perf_counter(),
+            "written_bytes": None,
+        }
+        if resource is not None:
+            usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+            subprocess = usage.ru_utime + usage.ru_stime
+            counters["subprocess"] = subprocess + Profiler._maker_subprocess
+        try:
+            with open("/proc/self/io") as pointer:
+                for line in pointer:
+                    key, _, value = line.partition(":")
+                    if key == "rchar":
+                        counters["read_bytes"] = int(value)
+                    elif key == "wchar":
+                        counters["written_bytes"] = int(value)
+        except OSError:
+            pass
+        return counters
+
+    @staticmethod
+    def _get_label(frame) -> str:
+        code = frame.f_code
+        file_name = os.path.basename(code.co_filename)
+        return f"{code.co_name} ({file_name}:{code.co_firstlineno})"
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(self._get_label(frame))
+                frame = frame.f_back
+            if labels:
+                self._stacks[";".join(reversed(labels))] += 1
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def command_name(self) -> str:
+        """
+        Gets command name.
+        """
+        return self._command_name
+
+    @property
+    def modes(self) -> typing.Tuple[str, ...]:
+        """
+        Gets modes.
+        """
+        return self._modes
+
+    @property
+    def summary(self) -> typing.Dict[str, typing.Any]:
+        """
+        Gets summary of command: wall, CPU, maker CPU and subprocess CPU time
+        in seconds; bytes read and written.
+
+        Sets unmeasurable counters to none.
+        """
+        summary: typing.Dict[str, typing.Any] = {"command": self._command_name}
+        keys = ("wall", "cpu", "makers", "subprocess", "read_bytes", "written_bytes")
+        for key in keys:
+            start, end = self._start.get(key), self._end.get(key)
+            if start is None or end is None:
+                summary[key] = None
+            elif key.endswith("_bytes"):
+                summary[key] = int(end - start)
+            else:
+                summary[key] = round(end - start, 3)
+        return summary
+
+    ### PUBLIC METHODS ###
+
+    @staticmethod
+    def add_maker_times(cpu: float, subprocess: float = None) -> None:
+        """
+        Adds CPU time ``cpu`` of one maker and CPU time ``subprocess`` of
+        the subprocesses it ran, both measured in the maker worker.
+        """
+        Profiler._maker_cpu += cpu
+        if subprocess is not None:
+            Profiler._maker_subprocess += subprocess
+
+    @staticmethod
+    def get_maker_times() -> typing.Dict[str, typing.Optional[float]]:
+        """
+        Gets CPU time and subprocess CPU time of this process so far, as
+        ``add_maker_times()`` keywords.
+
+        Makers take the difference of two calls.
+        """
+        counters = Profiler._get_counters()
+        return {"cpu": counters["cpu"], "subprocess": counters["subprocess"]}
+
+    @staticmethod
+    def get_modes() -> typing.Tuple[str, ...]:
+        """
+        Gets profiling modes from ``IDE_PROFILE`` environment variable or
+        (when unset) from ``profile`` configuration option.
+
+        Reads comma-separated modes; any other nonempty value (like ``1``)
+        means ``times``. Measures times in every mode.
+
+        Returns empty tuple when profiling is off.
+        """
+        string = os.environ.get("IDE_PROFILE")
+        if string is None:
+            if Profiler._configuration is None:
+                from .Configuration import Configuration
+
+                Profiler._configuration = Configuration()
+            string = Profiler._configuration.get("profile") or ""
+        words = [_.strip().lower() for _ in string.split(",")]
+        words = [_ for _ in words if _ and _ not in ("0", "false", "no", "off")]
+        if not words:
+            return ()
+        modes = ["times"]
+        for word in words:
+            if word in Profiler.known_modes and word not in modes:
+                modes.append(word)
+        return tuple(modes)
+
+    @staticmethod
+    def is_active() -> bool:
+        """
+        Is true while a profiler runs.
+        """
+        return Profiler._active
+
+    def write(self, directory) -> typing.List[str]:
+        """
+        Writes profile to ``directory``.
+
+        Appends summary to ``profiles.jsonl``; writes ``.pstats`` file in
+        ``cprofile`` mode and collapsed ``.stacks`` file in ``stacks`` mode.
+
+        Returns paths written.
+        """
+        directory = str(directory)
+        os.makedirs(directory, exist_ok=True)
+        summary = self.summary
+        summary["time"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        paths = [os.path.join(directory, "profiles.jsonl")]
+        with open(paths[0], "a") as pointer:
+            pointer.write(json.dumps(summary, sort_keys=True) + "\n")
+        stem = time.strftime("%Y%m%d-%H%M%S") + f"-{self._command_name}"
+        stem = os.path.join(directory, stem)
+        if self._profile is not None:
+            paths.append(stem + ".pstats")
+            self._profile.dump_stats(paths[-1])
+        if "stacks" in self._modes:
+            paths.append(stem + ".stacks")
+            with open(paths[-1], "w") as pointer:
+                for stack, count in sorted(self._stacks.items()):
+                    pointer.write(f"{stack} {count}\n")
+        return paths
@@ -0,0 +1,287 @@
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import time
+import typing
+
+import abjad
+
+
+class TagIndex:
+    """
+    Tag index.
+
+    Indexes the tagged lines of the LilyPond files in one directory: maps each
+    file to the numbers, byte ranges, activation state and tags of its tagged
+    lines. Stores the index in the directory's ``.tags`` file and reindexes
+    only files whose modification time or size changed, or that were modified
+    within the last second.
+
+    Reads and rewrites tagged lines through memory maps: same-length edits are
+    patched in place; other edits stream the file once to a temporary copy.
+    Also writes edited copies of files without touching the originals.
+
+    ..  container:: example
+
+        >>> index = ide.TagIndex("/path/to/scores/my_score/my_score/segments/01")
+        >>> index
+        TagIndex('/path/to/scores/my_score/my_score/segments/01')
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_changed", "_directory", "_files")
+
+    _file_name = ".tags"
+
+    _indices: typing.Dict[str, "TagIndex"] = {}
+
+    # entries of files modified less than this many nanoseconds before use
+    # are not trusted: another process may rewrite a file within the same
+    # filesystem timestamp without changing its size:
+    _margin = 1_000_000_000
+
+    _version = 2
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory) -> None:
+        self._changed = False
+        self._directory = str(directory)
+        self._files: typing.Dict[str, typing.Dict] = {}
+        self._read()
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return f"TagIndex('{self._directory}')"
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _copy(path, changes, target) -> None:
+        with open(str(path), "rb") as source, open(str(target), "wb") as target_:
+            if os.fstat(source.fileno()).st_size == 0:
+                return
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as map_:
+                with memoryview(map_) as view:
+                    position = 0
+                    for line, bytes_ in changes:
+                        offset, length = line[1], line[2]
+                        target_.write(view[position:offset])
+                        target_.write(bytes_)
+                        position = offset + length
+                    target_.write(view[position:])
+
+    @staticmethod
+    def _get_changes(path, entry, lines) -> typing.List[typing.Tuple]:
+        changes: typing.List[typing.Tuple] = []
+        if not lines:
+            return changes
+        with open(str(path), "rb") as pointer:
+            with mmap.mmap(pointer.fileno(), 0, access=mmap.ACCESS_READ) as map_:
+                for line in entry["lines"]:
+                    number, offset, length = line[:3]
+                    if number not in lines:
+                        continue
+                    bytes_ = lines[number].encode("utf-8")
+                    if bytes_ != map_[offset : offset + length]:
+                        changes.append((line, bytes_))
+        return changes
+
+    def _get_entry(self, path) -> typing.Dict:
+        name = os.path.basename(str(path))
+        stat = os.stat(str(path))
+        key = [stat.st_mtime_ns, stat.st_size]
+        entry = self._files.get(name)
+        recent = time.time_ns() - stat.st_mtime_ns < TagIndex._margin
+        if entry is None or entry["key"] != key or recent:
+            entry = {"key": key, "lines": self._index_file(path)}
+            self._files[name] = entry
+            self._changed = True
+        return entry
+
+    @staticmethod
+    def _index_file(path) -> typing.List[typing.List]:
+        lines = []
+        offset = 0
+        with open(str(path), "rb") as pointer:
+            for number, bytes_ in enumerate(pointer):
+                length = len(bytes_)
+                if b" %! " in bytes_:
+                    line = bytes_.decode("utf-8")
+                    tags = TagIndex._get_tags(line)
+                    if tags:
+                        active = TagIndex._is_active(line)
+                        lines.append([number, offset, length, active, tags])
+                offset += length
+        return lines
+
+    @staticmethod
+    def _get_tags(line) -> str:
+        tags = []
+        for chunk in line.split(" %! ")[1:]:
+            words = chunk.split()
+            if words:
+                tags.append(words[0])
+        return ":".join(tags)
+
+    @staticmethod
+    def _is_active(line) -> bool:
+        return not line.lstrip().startswith(("%@%", "%%%"))
+
+    def _read(self) -> None:
+        path = os.path.join(self._directory, self._file_name)
+        try:
+            with open(path) as pointer:
+                index = json.load(pointer)
+        except (OSError, ValueError):
+            return
+        if not isinstance(index, dict) or index.get("version") != self._version:
+            return
+        self._files = index.get("files", {})
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory(self) -> str:
+        """
+        Gets directory.
+
+        ..  container:: example
+
+            >>> index = ide.TagIndex("/path/to/scores/my_score/my_score/segments/01")
+            >>> index.directory
+            '/path/to/scores/my_score/my_score/segments/01'
+
+        """
+        return self._directory
+
+    ### PUBLIC METHODS ###
+
+    def copy_lines(self, path, lines: typing.Dict[int, str], target) -> None:
+        """
+        Writes copy of ``path`` to ``target`` with tagged ``lines`` replaced.
+
+        Streams ``path`` once; leaves ``path`` and its index entry untouched.
+        """
+        entry = self._get_entry(path)
+        changes = self._get_changes(path, entry, lines)
+        self._copy(path, changes, target)
+
+    @staticmethod
+    def for_directory(directory) -> "TagIndex":
+        """
+        Gets (process-wide) tag index for ``directory``.
+        """
+        directory = str(directory)
+        if directory not in TagIndex._indices:
+            TagIndex._indices[directory] = TagIndex(directory)
+        return TagIndex._indices[directory]
+
+    def get_lines(
+        self, path, tag: typing.Union[abjad.Tag, typing.Callable]
+    ) -> typing.List[typing.Tuple[int, bool]]:
+        """
+        Gets (zero-based) number and activation state of each line in
+        ``path`` that matches ``tag``.
+
+        Matches ``tag`` once per distinct combination of tags in file.
+        """
+        entry = self._get_entry(path)
+        matches: typing.Dict[str, bool] = {}
+        lines = []
+        for number, _, _, active, tags in entry["lines"]:
+            if tags not in matches:
+                matches[tags] = abjad.Line(f" %! {tags}").match(tag)
+            if matches[tags]:
+                lines.append((number, active))
+        return lines
+
+    def read_lines(self, path, numbers) -> typing.Dict[int, str]:
+        """
+        Reads tagged lines with (zero-based) ``numbers`` from ``path``.
+
+        Returns dictionary of line numbers to lines (with newlines).
+        """
+        entry = self._get_entry(path)
+        numbers = set(numbers)
+        lines: typing.Dict[int, str] = {}
+        if not numbers:
+            return lines
+        with open(str(path), "rb") as pointer:
+            with mmap.mmap(pointer.fileno(), 0, access=mmap.ACCESS_READ) as map_:
+                for number, offset, length, _, _ in entry["lines"]:
+                    if number in numbers:
+                        bytes_ = map_[offset : offset + length]
+                        lines[number] = bytes_.decode("utf-8")
+        assert len(lines) == len(numbers), repr((path, numbers))
+        return lines
+
+    def write(self) -> None:
+        """
+        Writes index to ``.tags`` when index changed.
+        """
+        if not self._changed:
+            return
+        for name in list(self._files):
+            if not os.path.isfile(os.path.join(self._directory, name)):
+                del self._files[name]
+        path = os.path.join(self._directory, self._file_name)
+        index = {"files": self._files, "version": self._version}
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=self._directory, prefix=".", suffix=".tmp"
+        )
+        with os.fdopen(descriptor, "w") as pointer:
+            json.dump(index, pointer, sort_keys=True)
+        os.replace(temporary_path, path)
+        self._changed = False
+
+    def write_lines(self, path, lines: typing.Dict[int, str]) -> bool:
+        """
+        Writes tagged ``lines`` to ``path``.
+
+        Patches ``path`` in place when every changed line keeps its length in
+        bytes; otherwise streams ``path`` once to a temporary file and renames
+        it. Leaves ``path`` untouched when no line changed.
+
+        Returns true when ``path`` changed.
+        """
+        entry = self._get_entry(path)
+        changes = self._get_changes(path, entry, lines)
+        if not changes:
+            return False
+        if all(len(_) == line[2] for line, _ in changes):
+            with open(str(path), "r+b") as pointer:
+                with mmap.mmap(pointer.fileno(), 0) as map_:
+                    for line, bytes_ in changes:
+                        offset = line[1]
+                        map_[offset : offset + len(bytes_)] = bytes_
+                    map_.flush()
+        else:
+            descriptor, temporary_path = tempfile.mkstemp(
+                dir=os.path.dirname(str(path)), prefix=".", suffix=".tmp"
+            )
+            os.close(descriptor)
+            shutil.copymode(str(path), temporary_path)
+            self._copy(path, changes, temporary_path)
+            os.replace(temporary_path, str(path))
+        changed = {id(line): bytes_ for line, bytes_ in changes}
+        delta = 0
+        for line in entry["lines"]:
+            line[1] += delta
+            if id(line) in changed:
+                bytes_ = changed[id(line)]
+                delta += len(bytes_) - line[2]
+                line[2] = len(bytes_)
+                line[3] = self._is_active(bytes_.decode("utf-8"))
+        stat = os.stat(str(path))
+        entry["key"] = [stat.st_mtime_ns, stat.st_size]
+        self._changed = True
+        return True
@@ -0,0 +1,293 @@
+import json
+import os
+import socket
+import statistics
+import subprocess
+import time
+import typing
+
+
+class TimingStore:
+    """
+    Timing store.
+
+    Records stage timings (segment-maker, Abjad format, LilyPond) of each
+    segment build as one JSON line in the score's ``etc/.timings.jsonl``.
+    Stamps each record with time, build, git revision and host. Records of one
+    segment in one build merge; builds compare by total time.
+
+    ..  container:: example
+
+        >>> store = ide.TimingStore("/path/to/scores/my_score/my_score/etc")
+        >>> store
+        TimingStore('/path/to/scores/my_score/my_score/etc')
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_directory",)
+
+    _file_name = ".timings.jsonl"
+
+    # git revision per directory, valid while .git/HEAD and the ref it
+    # points to keep their modification times:
+    _revisions: typing.Dict[str, typing.Tuple] = {}
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory) -> None:
+        self._directory = str(directory)
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Gets interpreter representation.
+        """
+        return f"TimingStore('{self._directory}')"
+
+    ### PRIVATE METHODS ###
+
+    def _get_builds(self) -> typing.List[typing.Dict]:
+        builds: typing.Dict[str, typing.Dict] = {}
+        for record in self.read():
+            build = record.get("build") or record.get("time")
+            if build not in builds:
+                builds[build] = {
+                    "build": build,
+                    "host": record.get("host"),
+                    "revision": record.get("revision"),
+                    "segments": {},
+                    "time": record.get("time"),
+                }
+            segments = builds[build]["segments"]
+            stages = segments.setdefault(record["segment"], {})
+            for stage, seconds in record["stages"].items():
+                stages[stage] = stages.get(stage, 0.0) + seconds
+        return list(builds.values())
+
+    @staticmethod
+    def _get_head_stamp(
+        git_directory, common_directory
+    ) -> typing.Optional[typing.Tuple]:
+        paths = [os.path.join(git_directory, "HEAD")]
+        try:
+            with open(paths[0]) as pointer:
+                head = pointer.read().strip()
+        except OSError:
+            return None
+        if head.startswith("ref:"):
+            ref = head[4:].strip()
+            paths.append(os.path.join(common_directory, ref))
+            paths.append(os.path.join(common_directory, "packed-refs"))
+        stamp = [head]
+        for path in paths:
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        # a change within the same timestamp tick would go unseen:
+        now = time.time_ns()
+        if any(_ is not None and now - _ < 1_000_000_000 for _ in stamp[1:]):
+            return None
+        return tuple(stamp)
+
+    @staticmethod
+    def _get_revision(directory) -> typing.Optional[str]:
+        directory = str(directory)
+        cached = TimingStore._revisions.get(directory)
+        if cached is not None:
+            directories, stamp, revision = cached
+            if stamp is not None and TimingStore._get_head_stamp(*directories) == stamp:
+                return revision
+        try:
+            result = subprocess.run(
+                [
+                    "git",
+                    "rev-parse",
+                    "--absolute-git-dir",
+                    "--git-common-dir",
+                    "--short",
+                    "HEAD",
+                ],
+                cwd=directory,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                universal_newlines=True,
+            )
+        except OSError:
+            return None
+        lines = result.stdout.split()
+        if result.returncode != 0 or len(lines) != 3:
+            TimingStore._revisions.pop(directory, None)
+            return None
+        git_directory, common_directory, revision = lines
+        directories = (git_directory, os.path.join(directory, common_directory))
+        stamp = TimingStore._get_head_stamp(*directories)
+        TimingStore._revisions[directory] = (directories, stamp, revision)
+        return revision
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory(self) -> str:
+        """
+        Gets directory.
+
+        ..  container:: example
+
+            >>> store = ide.TimingStore("/path/to/scores/my_score/my_score/etc")
+            >>> store.directory
+            '/path/to/scores/my_score/my_score/etc'
+
+        """
+        return self._directory
+
+    @property
+    def path(self) -> str:
+        """
+        Gets path of ``.timings.jsonl``.
+
+        ..  container:: example
+
+            >>> store = ide.TimingStore("/path/to/scores/my_score/my_score/etc")
+            >>> store.path
+            '/path/to/scores/my_score/my_score/etc/.timings.jsonl'
+
+        """
+        return os.path.join(self._directory, self._file_name)
+
+    ### PUBLIC METHODS ###
+
+    @staticmethod
+    def get_build_id() -> str:
+        """
+        Gets new build identifier: local time and process ID.
+        """
+        return time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+
+    def get_regressions(
+        self, threshold: float = 0.2, window: int = 5
+    ) -> typing.List[typing.Dict]:
+        """
+        Gets segments whose latest total time exceeds the median of their
+        previous ``window`` builds by more than ``threshold``.
+
+        Returns records of segment, build, revision, baseline and seconds,
+        worst first.
+        """
+        history: typing.Dict[str, typing.List[typing.Tuple]] = {}
+        for build in self._get_builds():
+            for segment, stages in build["segments"].items():
+                item = (build["build"], build["revision"], sum(stages.values()))
+                history.setdefault(segment, []).append(item)
+        regressions = []
+        for segment, items in history.items():
+            if len(items) < 2:
+                continue
+            build, revision, seconds = items[-1]
+            baseline = statistics.median(_[2] for _ in items[-window - 1 : -1])
+            if baseline and (1 + threshold) * baseline < seconds:
+                regressions.append(
+                    {
+                        "baseline": baseline,
+                        "build": build,
+                        "revision": revision,
+                        "seconds": seconds,
+                        "segment": segment,
+                    }
+                )
+        regressions.sort(key=lambda _: _["seconds"] / _["baseline"], reverse=True)
+        return regressions
+
+    def get_slowest(
+        self, count: int = 10, stage: str = None
+    ) -> typing.List[typing.Tuple[str, float]]:
+        """
+        Gets ``count`` slowest segments by latest time of ``stage`` (or of
+        all stages).
+
+        Returns pairs of segment name and seconds, slowest first.
+        """
+        latest: typing.Dict[str, float] = {}
+        for build in self._get_builds():
+            for segment, stages in build["segments"].items():
+                if stage is None:
+                    latest[segment] = sum(stages.values())
+                elif stage in stages:
+                    latest[segment] = stages[stage]
+        pairs = sorted(latest.items(), key=lambda _: _[1], reverse=True)
+        return pairs[:count]
+
+    def get_trends(self, count: int = 10) -> typing.List[typing.Dict]:
+        """
+        Gets last ``count`` builds with total time per stage.
+
+        Returns records of build, time, revision, host, segment count, stage
+        totals and total, oldest first.
+        """
+        trends = []
+        for build in self._get_builds()[-count:]:
+            totals: typing.Dict[str, float] = {}
+            for stages in build["segments"].values():
+                for stage, seconds in stages.items():
+                    totals[stage] = totals.get(stage, 0.0) + seconds
+            trends.append(
+                {
+                    "build": build["build"],
+                    "host": build["host"],
+                    "revision": build["revision"],
+                    "segment_count": len(build["segments"]),
+                    "stages": totals,
+                    "time": build["time"],
+                    "total": sum(totals.values()),
+                }
+            )
+        return trends
+
+    def read(self) -> typing.List[typing.Dict]:
+        """
+        Reads records in the order they were written.
+
+        Skips malformed lines.
+        """
+        records = []
+        try:
+            pointer = open(self.path)
+        except OSError:
+            return records
+        with pointer:
+            for line in pointer:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                if "segment" not in record or "stages" not in record:
+                    continue
+                records.append(record)
+        return records
+
+    def record(
+        self, segment: str, stages: typing.Dict[str, float], *, build: str = None
+    ) -> None:
+        """
+        Records ``stages`` (stage names to seconds) of ``segment``.
+
+        Appends one line in a single write, so concurrent builds do not
+        interleave records.
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        record = {
+            "build": build,
+            "host": socket.gethostname(),
+            "revision": self._get_revision(self._directory),
+            "segment": segment,
+            "stages": {_: round(float(seconds), 3) for _, seconds in stages.items()},
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        line = json.dumps(record, sort_keys=True) + "\n"
+        with open(self.path, "a") as pointer:
+            pointer.write(line)
@@ -4,27 +4,95 @@ import typing
 class Transcript:
     """
     Transcript.
+
+    Keeps the most recent lines, blocks, menus and titles in memory: drops the
+    oldest once there are more than ``size`` (by an eighth, to drop in
+    batches); keeps everything when ``size`` is none. Also appends every line
+    to ``spill_path`` when ``spill_path`` is set.
+
+    ..  container:: example
+
+        >>> transcript = ide.Transcript(size=2)
+        >>> for i in range(4):
+        ...     transcript.append([f"line {i}"])
+        ...
+        >>> transcript.lines
+        ['line 2', 'line 3']
+
+        >>> "line 3" in transcript
+        True
+
     """
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_blocks", "_lines", "_menus", "_titles")
+    __slots__ = (
+        "_blocks",
+        "_lines",
+        "_menus",
+        "_searches",
+        "_size",
+        "_spill_path",
+        "_titles",
+    )
 
     ### INITIALIZER ###
 
-    def __init__(self):
-        self._blocks = []
-        self._lines = []
-        self._menus = []
-        self._titles = []
+    def __init__(self, size: int = None, spill_path=None) -> None:
+        if size is not None:
+            assert 0 < size, repr(size)
+        self._blocks: typing.List = []
+        self._lines: typing.List[str] = []
+        self._menus: typing.List = []
+        self._searches: typing.Dict[str, typing.Tuple[int, bool]] = {}
+        self._size = size
+        self._spill_path = spill_path
+        self._titles: typing.List[str] = []
 
     ### SPECIAL METHODS ###
 
     def __contains__(self, argument) -> bool:
         """
-        Is true when ``argument`` appears in transcript.
+        Is true when ``argument`` appears in lines of transcript.
+
+        Remembers how many lines were searched for ``argument``; searches
+        only lines appended since then, together with the tail of earlier
+        lines a match could span. Searches from end, where lines just
+        displayed are.
         """
-        return argument in "\n".join(self.lines)
+        lines = self._lines
+        count, found = self._searches.get(argument, (0, False))
+        if not found and count < len(lines):
+            span = argument.count("\n")
+            start = max(count - span, 0)
+            if span:
+                found = argument in "\n".join(lines[start:])
+            else:
+                found = any(
+                    argument in lines[i] for i in range(len(lines) - 1, start - 1, -1)
+                )
+            self._searches[argument] = (len(lines), found)
+        return found
+
+    ### PRIVATE METHODS ###
+
+    def _drop(self) -> None:
+        size = self._size
+        if size is None:
+            return
+        limit = size + size // 8
+        for list_ in (self._blocks, self._menus, self._titles):
+            if limit < len(list_):
+                del list_[:-size]
+        if limit < len(self._lines):
+            del self._lines[:-size]
+            self._searches.clear()
+
+    def _spill(self, block) -> None:
+        if self._spill_path is None or not block:
+            return
+        with open(self._spill_path, "a") as pointer:
+            pointer.write("\n".join(block) + "\n")
 
     ### PUBLIC PROPERTIES ###
 
@@ -49,6 +117,20 @@ class Transcript:
         """
         return self._menus
 
+    @property
+    def size(self) -> typing.Optional[int]:
+        """
+        Gets size.
+        """
+        return self._size
+
+    @property
+    def spill_path(self):
+        """
+        Gets spill path.
+        """
+        return self._spill_path
+
     @property
     def titles(self) -> typing.List[str]:
         """
@@ -67,6 +149,8 @@ class Transcript:
         if is_menu:
             self._menus.append(block)
             self._titles.append(block[0])
+        self._spill(block)
+        self._drop()
 
     def trim(self) -> None:
         """
@@ -78,3 +162,4 @@ class Transcript:
             else:
                 break
         self.lines.append("")
+        self._searches.clear()
@@ -59,15 +59,20 @@ import platform
 
 from . import jobs, pathx, segments, tags
 from .AbjadIDE import AbjadIDE
+from .BuildPlanner import BuildPlanner
 from .Command import Command
 from .Configuration import Configuration
 from .IO import IO
 from .Interaction import Interaction
+from .LilyPondLog import LilyPondLog
 from .Menu import Menu
 from .MenuEntry import MenuEntry
 from .MenuSection import MenuSection
+from .Profiler import Profiler
 from .Response import Response
+from .TagIndex import TagIndex
 from .Test import Test
+from .TimingStore import TimingStore
 from .Transcript import Transcript
 from .pathx import Path
 from .segments import (
@@ -84,11 +89,13 @@ configuration = Configuration()
 
 __all__ = [
     "AbjadIDE",
+    "BuildPlanner",
     "Command",
     "Configuration",
     "IO",
     "Job",
     "Interaction",
+    "LilyPondLog",
     "Menu",
     "MenuEntry",
     "MenuSection",
@@ -98,9 +105,12 @@ __all__ = [
     "PartManifest",
     "Path",
     "PersistentOverride",
+    "Profiler",
     "Response",
     "Section",
+    "TagIndex",
     "Test",
+    "TimingStore",
     "Transcript",
     "configuration",
     "jobs",
@@ -1,13 +1,57 @@
+import ast
+import contextlib
+import copy
+import functools
+import importlib
 import os
 import pathlib
 import shutil
+import threading
+import time
 import typing
 
 import abjad
+import black
+
+from .TagIndex import TagIndex
 
 configuration = abjad.Configuration()
 
 
+def _memoize(method=None, *, metadata=False):
+    """
+    Memoizes path-role ``method`` on path and mock scores directory.
+
+    Keys ``metadata`` methods also on modification time and size of each
+    ``__metadata__.py`` file from builds directory down to path; does not
+    cache them while one of those files is recent. Keeps the most recent
+    ``Path._classification_cache_size`` results.
+    """
+    if method is None:
+        return functools.partial(_memoize, metadata=metadata)
+
+    @functools.wraps(method)
+    def wrapper(self):
+        key = (method.__name__, str(self), Path._mock_scores)
+        if metadata:
+            stamp = self._get_metadata_stamp()
+            if stamp is None:
+                return method(self)
+            key += stamp
+        try:
+            return Path._classification_cache[key]
+        except KeyError:
+            pass
+        result = method(self)
+        cache = Path._classification_cache
+        if Path._classification_cache_size <= len(cache):
+            del cache[next(iter(cache))]
+        cache[key] = result
+        return result
+
+    return wrapper
+
+
 class Path(pathlib.PosixPath):
     """
     Path in an Abjad score package.
@@ -30,6 +74,12 @@ class Path(pathlib.PosixPath):
 
     __documentation_section__ = "Segment-makers"
 
+    _classification_cache: typing.Dict[typing.Tuple, typing.Any] = {}
+
+    _classification_cache_size = 10_000
+
+    _black_mode = black.FileMode(target_versions={black.TargetVersion.PY38})
+
     _known_directories = (
         "_assets",
         "_segments",
@@ -40,12 +90,30 @@ class Path(pathlib.PosixPath):
         "stylesheets",
     )
 
+    _listing_cache: typing.Dict[typing.Tuple, typing.Tuple] = {}
+
+    # directories and metadata files modified less than this many nanoseconds
+    # before reading are not cached: a later change within the same
+    # filesystem timestamp tick would leave the mtime unchanged
+    _listing_margin = 1_000_000_000
+
+    _metadata_cache: typing.Dict[str, typing.Tuple] = {}
+
     _mock_scores = None
 
+    # metadata writes of each thread's open transaction:
+    _metadata_transaction = threading.local()
+
+    _segment_key_cache: typing.Dict[str, typing.Tuple] = {}
+
     _secondary_names = (
+        ".fingerprint",
         ".gitignore",
         ".log",
         ".optimization",
+        ".stamps",
+        ".tags",
+        ".timings.jsonl",
         "__init__.py",
         "__make_pdf__.py",
         "__make_midi__.py",
@@ -84,6 +152,7 @@ class Path(pathlib.PosixPath):
         return None
 
     @property
+    @_memoize(metadata=True)
     def _segments(self) -> typing.Optional["Path"]:
         """
         Gets _segments directory.
@@ -146,6 +215,156 @@ class Path(pathlib.PosixPath):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _activate_lines(lines, numbers, tag, prepend_empty_chord=None, undo=False):
+        runs: typing.List[typing.List[int]] = []
+        for number in numbers:
+            if runs and runs[-1][-1] == number - 1:
+                runs[-1].append(number)
+            else:
+                runs.append([number])
+        if not runs:
+            return 0, 0
+        strings = ["".join(lines[_] for _ in run) for run in runs]
+        text = "\n".join(strings)
+        text, count, skipped = Path._activate_text(
+            text, tag, prepend_empty_chord=prepend_empty_chord, undo=undo
+        )
+        lines_ = text.split("\n")
+        lines_ = [_ + "\n" for _ in lines_[:-1]] + lines_[-1:]
+        index = 0
+        for run in runs:
+            for number in run:
+                lines[number] = lines_[index]
+                index += 1
+            index += 1
+        return count, skipped
+
+    @staticmethod
+    def _activate_text(text, tag, prepend_empty_chord=None, undo=False):
+        if undo:
+            return abjad.deactivate(
+                text,
+                tag,
+                prepend_empty_chord=prepend_empty_chord,
+                skipped=True,
+            )
+        return abjad.activate(text, tag, skipped=True)
+
+    def _apply_tag_operations(self, operations, target=None):
+        totals = [[0, 0] for _ in operations]
+        indices = []
+        for path in self._list_activation_paths():
+            index = TagIndex.for_directory(path.parent)
+            if index not in indices:
+                indices.append(index)
+            numbers = [
+                [_[0] for _ in index.get_lines(path, tag)] for tag, _ in operations
+            ]
+            lines = index.read_lines(path, set().union(*numbers))
+            for total, (tag, deactivate), numbers_ in zip(totals, operations, numbers):
+                count, skipped = self._activate_lines(
+                    lines, numbers_, tag, undo=deactivate
+                )
+                total[0] += count
+                total[1] += skipped
+            if target is None:
+                index.write_lines(path, lines)
+            else:
+                if path == self:
+                    target_path = target
+                else:
+                    target_path = target / path.relative_to(self)
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                index.copy_lines(path, lines, target_path)
+        for index in indices:
+            index.write()
+        return [tuple(_) for _ in totals]
+
+    @staticmethod
+    def _evaluate_metadata_node(node, modules):
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.List):
+            return [Path._evaluate_metadata_node(_, modules) for _ in node.elts]
+        if isinstance(node, ast.Tuple):
+            return tuple(Path._evaluate_metadata_node(_, modules) for _ in node.elts)
+        if isinstance(node, ast.Set):
+            return {Path._evaluate_metadata_node(_, modules) for _ in node.elts}
+        if isinstance(node, ast.Dict) and None not in node.keys:
+            keys = [Path._evaluate_metadata_node(_, modules) for _ in node.keys]
+            values = [Path._evaluate_metadata_node(_, modules) for _ in node.values]
+            return dict(zip(keys, values))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return -Path._evaluate_metadata_node(node.operand, modules)
+        if isinstance(node, ast.Name) and node.id in modules:
+            return importlib.import_module(modules[node.id])
+        if isinstance(node, ast.Attribute):
+            owner = Path._evaluate_metadata_node(node.value, modules)
+            return getattr(owner, node.attr)
+        if isinstance(node, ast.Call):
+            function = Path._evaluate_metadata_node(node.func, modules)
+            arguments = []
+            for argument in node.args:
+                if isinstance(argument, ast.Starred):
+                    raise ValueError(ast.dump(argument))
+                arguments.append(Path._evaluate_metadata_node(argument, modules))
+            keywords = {}
+            for keyword in node.keywords:
+                if keyword.arg is None:
+                    raise ValueError(ast.dump(keyword))
+                value = Path._evaluate_metadata_node(keyword.value, modules)
+                keywords[keyword.arg] = value
+            return function(*arguments, **keywords)
+        raise ValueError(ast.dump(node))
+
+    @staticmethod
+    def _get_activation_messages(
+        count, skipped, name, indent=0, message_zero=False, undo=False
+    ):
+        if undo:
+            adjective = "inactive"
+            gerund = "deactivating"
+        else:
+            adjective = "active"
+            gerund = "activating"
+        messages = []
+        total = count + skipped
+        if total == 0 and message_zero:
+            messages.append(f"found no {name} tags")
+        if 0 < total:
+            tags = abjad.String("tag").pluralize(total)
+            messages.append(f"found {total} {name} {tags}")
+            if 0 < count:
+                tags = abjad.String("tag").pluralize(count)
+                message = f"{gerund} {count} {name} {tags}"
+                messages.append(message)
+            if 0 < skipped:
+                tags = abjad.String("tag").pluralize(skipped)
+                message = f"skipping {skipped} ({adjective}) {name} {tags}"
+                messages.append(message)
+        whitespace = indent * " "
+        messages_ = [
+            abjad.String(whitespace + abjad.String(_).capitalize_start() + " ...")
+            for _ in messages
+        ]
+        return messages_
+
+    @staticmethod
+    def _get_extern_preamble(lines, include_line):
+        if lines:
+            assert lines[-1].isspace(), repr(lines[-1])
+            lines.pop()
+        if lines[-1].startswith(r"\paper"):
+            lines.insert(-2, include_line)
+        else:
+            lines.append(include_line)
+        if lines[-2] == "\n":
+            del lines[-2]
+        lines.append("\n")
+        lines.append("\n")
+        return lines
+
     def _get_file_path_ending_with(self, string):
         if not self.is_dir():
             return
@@ -154,12 +373,257 @@ class Path(pathlib.PosixPath):
             if path.is_file():
                 return path
 
+    def _get_listing(self):
+        key = (str(self), Path._mock_scores)
+        stat = os.stat(self)
+        stamp = (stat.st_ino, stat.st_mtime_ns)
+        cached = Path._listing_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+        now = time.time_ns()
+        names = self._list_names()
+        paths = tuple(self / _ for _ in names)
+        positions = {name: i for i, name in enumerate(names)}
+        if Path._listing_margin < now - stat.st_mtime_ns:
+            Path._listing_cache[key] = (stamp, paths, positions)
+        else:
+            Path._listing_cache.pop(key, None)
+        return paths, positions
+
+    def _get_metadata(self, file_name):
+        metadata_py_path = self / file_name
+        pending = Path._get_pending_metadata()
+        if pending and str(metadata_py_path) in pending:
+            return pending[str(metadata_py_path)][1]
+        if not metadata_py_path.is_file():
+            return None
+        stat = metadata_py_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if time.time_ns() - stat.st_mtime_ns <= Path._listing_margin:
+            self._metadata_cache.pop(str(metadata_py_path), None)
+            return self._read_metadata(metadata_py_path)
+        cached = self._metadata_cache.get(str(metadata_py_path))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        metadata = self._read_metadata(metadata_py_path)
+        self._metadata_cache[str(metadata_py_path)] = (key, metadata)
+        return metadata
+
+    def _get_metadata_stamp(self) -> typing.Optional[typing.Tuple]:
+        if Path._get_pending_metadata():
+            return None
+        if "builds" not in self.parts:
+            return ()
+        index = len(self.parts) - self.parts[::-1].index("builds") - 1
+        directory, stamp, now = os.path.join(*self.parts[:index]), [], time.time_ns()
+        for name in self.parts[index:]:
+            directory = os.path.join(directory, name)
+            try:
+                stat = os.stat(os.path.join(directory, "__metadata__.py"))
+            except OSError:
+                stamp.append(None)
+                continue
+            if now - stat.st_mtime_ns <= Path._listing_margin:
+                return None
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(stamp)
+
+    @staticmethod
+    def _get_pending_metadata() -> typing.Optional[typing.Dict[str, typing.Tuple]]:
+        return getattr(Path._metadata_transaction, "pending", None)
+
     def _get_score_pdf(self):
         path = self.distribution._get_file_path_ending_with("score.pdf")
         if not path:
             path = self.builds._get_file_path_ending_with("score.pdf")
         return path
 
+    @staticmethod
+    def _get_segment_sort_key(string):
+        key = Path._segment_key_cache.get(string)
+        if key is None:
+            name = abjad.String(string)
+            letter = name.segment_letter()
+            key = (letter != "_", len(letter), letter, name.segment_rank())
+            Path._segment_key_cache[str(string)] = key
+        return key
+
+    @staticmethod
+    def _iterate_extern_variable(name, lines, tag):
+        first_line = lines[0]
+        count = len(first_line) - len(first_line.lstrip())
+        words = f"{name} = {first_line[count:]}".split()
+        first_line = " ".join(words[: words.index("%*%")])
+        yield abjad.tag.tag([first_line], tag=tag)[0] + "\n"
+        for line in lines[1:-1]:
+            assert line[:count].isspace(), repr(line)
+            line = line[count:]
+            if line == "":
+                line = "\n"
+            assert line.endswith("\n"), repr(line)
+            yield line
+        words = lines[-1][count:].split()
+        last_line = " ".join(words[: words.index("%*%")])
+        yield abjad.tag.tag([last_line], tag=tag)[0] + "\n"
+
+    def _list_activation_paths(self, skip_file_name=None):
+        if self.name == skip_file_name:
+            return []
+        if self.is_file():
+            if self.suffix not in (".ily", ".ly"):
+                return []
+            return [self]
+        assert self.is_dir(), repr(self)
+        paths = []
+        for path in sorted(self.glob("**/*")):
+            path = type(self)(path)
+            if path.suffix not in (".ily", ".ly"):
+                continue
+            if not (
+                path.name.startswith("illustration")
+                or path.name.startswith("layout")
+                or path.name.startswith("segment")
+            ):
+                continue
+            if path.name == skip_file_name:
+                continue
+            paths.append(path)
+        return paths
+
+    def _list_names(self):
+        predicate = self.get_name_predicate()
+        is_external = self.is_external()
+        is_segments = self.is_segments()
+        names = []
+        with os.scandir(self) as entries:
+            names_ = sorted(_.name for _ in entries)
+        for name in names_:
+            name = abjad.String(name)
+            if name.startswith("_") and not (is_external or is_segments):
+                continue
+            if name in (".DS_Store", ".cache", ".git", ".gitmodules"):
+                continue
+            if name in ("__init__.py", "__pycache__"):
+                continue
+            if (
+                predicate is not None
+                and not predicate(name)
+                and name != "_assets"
+                and name != "_segments"
+            ):
+                continue
+            if name == "stylesheet.ily" and self.is_stylesheets():
+                pass
+            elif name in self._secondary_names:
+                continue
+            names.append(name)
+        if is_segments:
+            names = [_ for _ in names if not _.endswith("backup")]
+            names = [_ for _ in names if not _.startswith(".")]
+            names = Path.sort_segment_names(names)
+        if self.is__segments():
+            prefix = "segment-"
+            names = [_ for _ in names if _.startswith(prefix)]
+            single_character_names, double_character_names = [], []
+            for name in names:
+                segment_name = name[len(prefix) :]
+                segment_name = segment_name.replace("-", "_")
+                if segment_name.endswith(".ly"):
+                    segment_name = segment_name[:-3]
+                elif segment_name.endswith(".ily"):
+                    segment_name = segment_name[:-4]
+                else:
+                    raise ValueError(segment_name)
+                if len(segment_name) == 1:
+                    single_character_names.append(name)
+                elif len(segment_name) == 2:
+                    double_character_names.append(name)
+                else:
+                    raise NotImplementedError(segment_name)
+            names = single_character_names + double_character_names
+        return names
+
+    @staticmethod
+    def _read_metadata(metadata_py_path):
+        text = metadata_py_path.read_text()
+        try:
+            module = ast.parse(text, filename=str(metadata_py_path))
+        except SyntaxError as e:
+            raise Exception(repr(metadata_py_path), e)
+        modules = {}
+        for statement in module.body:
+            if isinstance(statement, ast.Import):
+                for alias in statement.names:
+                    if alias.asname is None:
+                        name = alias.name.split(".")[0]
+                        modules[name] = name
+                    else:
+                        modules[alias.asname] = alias.name
+                continue
+            if (
+                isinstance(statement, ast.Assign)
+                and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name)
+                and statement.targets[0].id == "metadata"
+                and statement is module.body[-1]
+            ):
+                try:
+                    return Path._evaluate_metadata_node(statement.value, modules)
+                except (AttributeError, ImportError, ValueError):
+                    pass
+            break
+        try:
+            result = abjad.iox.execute_string(text, attribute_names=("metadata",))
+        except NameError as e:
+            raise Exception(repr(metadata_py_path), e)
+        if result:
+            return result[0]
+        return None
+
+    @staticmethod
+    def _write_extern_lines(pointer, lines, realign=None):
+        for line in lines:
+            if realign is not None and "%!" in line:
+                line = abjad.LilyPondFormatManager.align_tags(line, n=realign)
+            pointer.write(line)
+
+    @staticmethod
+    def _write_metadata_py(
+        metadata_py_path, metadata, import_statements, variable_name
+    ):
+        lines = []
+        for line in import_statements:
+            lines.append(line)
+        lines.append("")
+        lines.append("")
+        dictionary = abjad.OrderedDict(metadata)
+        items = list(dictionary.items())
+        items.sort()
+        dictionary = abjad.OrderedDict(items)
+        if dictionary:
+            line = abjad.storage(dictionary)
+            line = f"{variable_name} = {line}"
+            lines.append(line)
+        else:
+            lines.append(f"{variable_name} = abjad.OrderedDict()")
+        lines.append("")
+        text = "\n".join(lines)
+        try:
+            text = black.format_str(text, mode=Path._black_mode)
+        except ValueError:
+            pass
+        if metadata_py_path.is_file() and metadata_py_path.read_text() == text:
+            return
+        name = f".{metadata_py_path.name}.{os.getpid()}.tmp"
+        temporary_path = metadata_py_path.with_name(name)
+        try:
+            temporary_path.write_text(text)
+            os.replace(str(temporary_path), str(metadata_py_path))
+        except BaseException:
+            temporary_path.remove()
+            raise
+        Path._metadata_cache.pop(str(metadata_py_path), None)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -217,6 +681,7 @@ class Path(pathlib.PosixPath):
             return None
 
     @property
+    @_memoize
     def builds(self) -> typing.Optional["Path"]:
         """
         Gets builds directory.
@@ -236,6 +701,7 @@ class Path(pathlib.PosixPath):
             return None
 
     @property
+    @_memoize
     def contents(self):
         """
         Gets contents directory.
@@ -261,6 +727,7 @@ class Path(pathlib.PosixPath):
         return result
 
     @property
+    @_memoize
     def distribution(self) -> typing.Optional["Path"]:
         """
         Gets distribution directory.
@@ -280,6 +747,7 @@ class Path(pathlib.PosixPath):
             return None
 
     @property
+    @_memoize
     def etc(self) -> typing.Optional["Path"]:
         """
         Gets etc directory.
@@ -299,6 +767,7 @@ class Path(pathlib.PosixPath):
             return None
 
     @property
+    @_memoize
     def scores(self) -> typing.Optional["Path"]:
         """
         Gets scores directory.
@@ -320,6 +789,7 @@ class Path(pathlib.PosixPath):
         return Path(directory)
 
     @property
+    @_memoize
     def segments(self) -> typing.Optional["Path"]:
         """
         Gets segments directory.
@@ -339,6 +809,7 @@ class Path(pathlib.PosixPath):
             return None
 
     @property
+    @_memoize
     def stylesheets(self) -> typing.Optional["Path"]:
         """
         Gets stylesheets directory.
@@ -358,6 +829,7 @@ class Path(pathlib.PosixPath):
             return None
 
     @property
+    @_memoize
     def wrapper(self) -> typing.Optional["Path"]:
         """
         Gets wrapper directory.
@@ -416,72 +888,71 @@ class Path(pathlib.PosixPath):
         if self.name == skip_file_name:
             return None
         assert isinstance(indent, int), repr(indent)
-        if self.is_file():
-            if self.suffix not in (".ily", ".ly"):
-                count, skipped = 0, 0
-            else:
-                text = self.read_text()
-                if undo:
-                    text, count, skipped = abjad.deactivate(
-                        text,
-                        tag,
-                        prepend_empty_chord=prepend_empty_chord,
-                        skipped=True,
-                    )
-                else:
-                    text, count, skipped = abjad.activate(text, tag, skipped=True)
-                self.write_text(text)
-        else:
-            assert self.is_dir()
-            count, skipped = 0, 0
-            for path in sorted(self.glob("**/*")):
-                path = type(self)(path)
-                if path.suffix not in (".ily", ".ly"):
-                    continue
-                if not (
-                    path.name.startswith("illustration")
-                    or path.name.startswith("layout")
-                    or path.name.startswith("segment")
-                ):
-                    continue
-                if path.name == skip_file_name:
-                    continue
-                result = path.activate(
-                    tag, prepend_empty_chord=prepend_empty_chord, undo=undo
-                )
-                assert result is not None
-                count_, skipped_, _ = result
-                count += count_
-                skipped += skipped_
+        count, skipped = 0, 0
+        indices = []
+        for path in self._list_activation_paths(skip_file_name=skip_file_name):
+            index = TagIndex.for_directory(path.parent)
+            if index not in indices:
+                indices.append(index)
+            numbers = [_[0] for _ in index.get_lines(path, tag)]
+            if not numbers:
+                continue
+            lines = index.read_lines(path, numbers)
+            count_, skipped_ = self._activate_lines(
+                lines, numbers, tag, prepend_empty_chord=prepend_empty_chord, undo=undo
+            )
+            if count_:
+                index.write_lines(path, lines)
+            count += count_
+            skipped += skipped_
+        for index in indices:
+            index.write()
         if name is None:
             name = str(tag)
-        if undo:
-            adjective = "inactive"
-            gerund = "deactivating"
-        else:
-            adjective = "active"
-            gerund = "activating"
-        messages = []
-        total = count + skipped
-        if total == 0 and message_zero:
-            messages.append(f"found no {name} tags")
-        if 0 < total:
-            tags = abjad.String("tag").pluralize(total)
-            messages.append(f"found {total} {name} {tags}")
-            if 0 < count:
-                tags = abjad.String("tag").pluralize(count)
-                message = f"{gerund} {count} {name} {tags}"
-                messages.append(message)
-            if 0 < skipped:
-                tags = abjad.String("tag").pluralize(skipped)
-                message = f"skipping {skipped} ({adjective}) {name} {tags}"
-                messages.append(message)
-        whitespace = indent * " "
-        messages_ = [
-            abjad.String(whitespace + abjad.String(_).capitalize_start() + " ...")
-            for _ in messages
-        ]
-        return count, skipped, messages_
+        messages = self._get_activation_messages(
+            count,
+            skipped,
+            name,
+            indent=indent,
+            message_zero=message_zero,
+            undo=undo,
+        )
+        return count, skipped, messages
+
+    def activate_tags(
+        self,
+        operations: typing.Sequence[
+            typing.Tuple[typing.Union[abjad.Tag, typing.Callable], bool]
+        ],
+        *,
+        indent: int = 0,
+        message_zero: bool = False,
+    ) -> typing.List[typing.Tuple[int, int, typing.List[abjad.String]]]:
+        """
+        Applies tag ``operations`` to path.
+
+        Operations are pairs of tag and deactivate flag. Same result as calling
+        ``activate()`` (or ``deactivate()``) once per operation, in order, but
+        reads and rewrites each LilyPond file only once.
+
+        Returns one triple per operation, as ``activate()`` does.
+        """
+        for tag, _ in operations:
+            if isinstance(tag, str):
+                raise Exception(f"must be tag or callable: {tag!r}")
+        totals = self._apply_tag_operations(operations)
+        result = []
+        for (tag, deactivate), (count, skipped) in zip(operations, totals):
+            messages = self._get_activation_messages(
+                count,
+                skipped,
+                str(tag),
+                indent=indent,
+                message_zero=message_zero,
+                undo=deactivate,
+            )
+            result.append((count, skipped, messages))
+        return result
 
     def add_buildspace_metadatum(self, name, value, document_name: str = None) -> None:
         """
@@ -489,25 +960,31 @@ class Path(pathlib.PosixPath):
         with optional ``document_name``.
         """
         assert self.is_buildspace(), repr(self)
-        if self.is_parts():
-            if document_name is not None:
-                part_dictionary = self.get_metadatum(document_name, abjad.OrderedDict())
+        with self.metadata_transaction():
+            if self.is_parts():
+                if document_name is not None:
+                    part_dictionary = self.get_metadatum(
+                        document_name, abjad.OrderedDict()
+                    )
+                else:
+                    part_dictionary = abjad.OrderedDict()
+                part_dictionary[name] = value
+                assert abjad.String(document_name).is_shout_case()
+                self.add_metadatum(document_name, part_dictionary)
             else:
-                part_dictionary = abjad.OrderedDict()
-            part_dictionary[name] = value
-            assert abjad.String(document_name).is_shout_case()
-            self.add_metadatum(document_name, part_dictionary)
-        else:
-            self.add_metadatum(name, value)
+                self.add_metadatum(name, value)
 
     def add_metadatum(self, name, value, *, file_name="__metadata__.py") -> None:
         """
         Adds metadatum.
+
+        Reads and writes ``file_name``, like ``remove_metadatum()``; leaves
+        ``__metadata__.py`` untouched when ``file_name`` names another file.
         """
         assert " " not in name, repr(name)
         metadata = self.get_metadata(file_name=file_name)
         metadata[name] = value
-        self.write_metadata_py(metadata)
+        self.write_metadata_py(metadata, file_name=file_name)
 
     def count(
         self, tag: typing.Union[str, typing.Callable]
@@ -525,22 +1002,20 @@ class Path(pathlib.PosixPath):
         assert self.is_file(), repr(self)
         active_tags, active_lines = 0, 0
         deactivated_tags, deactivated_lines = 0, 0
-        with open(self) as pointer:
-            last_line_had_tag = False
-            for line_ in pointer.readlines():
-                line = abjad.Line(line_)
-                if line.match(tag):
-                    if line.is_active():
-                        active_lines += 1
-                        if not last_line_had_tag:
-                            active_tags += 1
-                    else:
-                        deactivated_lines += 1
-                        if not last_line_had_tag:
-                            deactivated_tags += 1
-                    last_line_had_tag = True
-                else:
-                    last_line_had_tag = False
+        index = TagIndex.for_directory(self.parent)
+        last_number = None
+        for number, active in index.get_lines(self, tag):
+            last_line_had_tag = last_number is not None and last_number == number - 1
+            if active:
+                active_lines += 1
+                if not last_line_had_tag:
+                    active_tags += 1
+            else:
+                deactivated_lines += 1
+                if not last_line_had_tag:
+                    deactivated_tags += 1
+            last_number = number
+        index.write()
         pair_1 = (active_tags, active_lines)
         pair_2 = (deactivated_tags, deactivated_lines)
         return pair_1, pair_2
@@ -589,6 +1064,10 @@ class Path(pathlib.PosixPath):
         Writes ``.ily`` to ``include_path`` when ``include_path`` is set.
         Writes ``.ily`` to this path with ``.ily` suffix when ``include_path``
         is not set.
+
+        Streams: reads this path once and writes skeleton ``.ly`` and
+        ``.ily`` as it goes, holding only the lines of variables not yet
+        closed; writes variables to ``.ily`` in the order they close.
         """
         tag = abjad.Tag("ide.Path.extern()")
         if not self.suffix == ".ly":
@@ -599,122 +1078,81 @@ class Path(pathlib.PosixPath):
         if score_path is None:
             score_path = self
         assert isinstance(score_path, type(self)), repr(score_path)
-        preamble_lines, score_lines = [], []
-        stack, finished_variables = abjad.OrderedDict(), abjad.OrderedDict()
-        found_score = False
-        with open(self) as pointer:
-            for line in pointer.readlines():
-                if (
-                    line.startswith(r"\score {")
-                    or line.startswith(r"\context Score")
-                    or line.startswith("{")
-                ):
-                    found_score = True
-                if not found_score:
-                    preamble_lines.append(line)
-                elif " %*% " in line:
-                    words = line.split()
-                    site = words.index("%*%")
-                    name = words[site + 1]
-                    # first line in expression:
-                    if name not in stack:
-                        stack[name] = []
-                        stack[name].append(line)
-                    # last line in expression
-                    else:
-                        stack[name].append(line)
-                        finished_variables[name] = stack[name]
-                        del stack[name]
-                        count = len(line) - len(line.lstrip())
-                        indent = count * " "
+        if include_path.parent == self.parent:
+            include_name = include_path.name
+        else:
+            include_name = str(include_path)
+        include_line = f'\\include "{include_name}"'
+        include_line = abjad.tag.tag([include_line], tag=tag)[0] + "\n"
+        preamble_lines: typing.List[str] = []
+        stack: typing.List[typing.Tuple[str, typing.List[str]]] = []
+        found_score, variable_count = False, 0
+        temporary_paths = []
+        for path in (score_path, include_path):
+            name = f".{path.name}.{os.getpid()}.tmp"
+            temporary_paths.append(path.with_name(name))
+        try:
+            score_path_, include_path_ = temporary_paths
+            with open(self) as source, open(score_path_, "w") as score:
+                with open(include_path_, "w") as include:
+                    for line in source:
+                        if not found_score and (
+                            line.startswith(r"\score {")
+                            or line.startswith(r"\context Score")
+                            or line.startswith("{")
+                        ):
+                            found_score = True
+                            lines = self._get_extern_preamble(
+                                preamble_lines, include_line
+                            )
+                            self._write_extern_lines(score, lines, realign)
+                            preamble_lines = []
+                        if not found_score:
+                            preamble_lines.append(line)
+                            continue
+                        if " %*% " not in line:
+                            if stack:
+                                stack[-1][1].append(line)
+                            else:
+                                self._write_extern_lines(score, [line], realign)
+                            continue
+                        words = line.split()
+                        name = words[words.index("%*%") + 1]
+                        for index in range(len(stack) - 1, -1, -1):
+                            if stack[index][0] == name:
+                                break
+                        # first line in expression:
+                        else:
+                            stack.append((name, [line]))
+                            continue
+                        # last line in expression:
+                        variable_lines = stack.pop(index)[1]
+                        variable_lines.append(line)
+                        if variable_count:
+                            include.write("\n\n")
+                        variable_count += 1
+                        lines = self._iterate_extern_variable(name, variable_lines, tag)
+                        self._write_extern_lines(include, lines, realign)
+                        indent = (len(line) - len(line.lstrip())) * " "
                         dereference = indent + fr"\{name}"
-                        first_line = finished_variables[name][0]
-                        if "NOT_TOPMOST" in first_line:
+                        if "NOT_TOPMOST" in variable_lines[0]:
                             tag_ = tag.append(abjad.Tag("NOT_TOPMOST"))
                         else:
                             tag_ = tag
-                        strings = abjad.tag.tag([dereference], tag=tag_)
-                        dereference = strings[0]
-                        dereference = dereference + "\n"
-                        if bool(stack):
-                            items = list(stack.items())
-                            items[-1][-1].append(dereference)
+                        dereference = abjad.tag.tag([dereference], tag=tag_)[0] + "\n"
+                        if stack:
+                            stack[-1][1].append(dereference)
                         else:
-                            score_lines.append(dereference)
-                elif bool(stack):
-                    items = list(stack.items())
-                    items[-1][-1].append(line)
-                else:
-                    score_lines.append(line)
-        lines = []
-        if preamble_lines:
-            assert preamble_lines[-1].isspace(), repr(preamble_lines[-1])
-            preamble_lines.pop()
-        if include_path.parent == self.parent:
-            include_name = include_path.name
-        else:
-            include_name = str(include_path)
-        foo = f'\\include "{include_name}"'
-        foo = abjad.tag.tag([foo], tag=tag)[0]
-        if preamble_lines[-1].startswith(r"\paper"):
-            preamble_lines.insert(-2, foo + "\n")
-        else:
-            preamble_lines.append(foo + "\n")
-        if preamble_lines[-2] == "\n":
-            del preamble_lines[-2]
-        preamble_lines.append("\n")
-        preamble_lines.append("\n")
-        lines.extend(preamble_lines)
-        lines.extend(score_lines)
-        lines_ = []
-        for line in lines:
-            if realign is not None:
-                line_ = abjad.LilyPondFormatManager.align_tags(line, n=realign)
-            else:
-                line_ = line
-            lines_.append(line_)
-        text = "".join(lines_)
-        score_path.write_text(text)
-        lines = []
-        items = list(finished_variables.items())
-        total = len(items)
-        for i, item in enumerate(items):
-            name, variable_lines = item
-            first_line = variable_lines[0]
-            count = len(first_line) - len(first_line.lstrip())
-            first_line = first_line[count:]
-            first_line = f"{name} = {first_line}"
-            words = first_line.split()
-            site = words.index("%*%")
-            first_line = " ".join(words[:site])
-            first_line = abjad.tag.tag([first_line], tag=tag)[0]
-            first_line += "\n"
-            lines.append(first_line)
-            for variable_line in variable_lines[1:]:
-                assert variable_line[:count].isspace(), repr(line)
-                variable_line = variable_line[count:]
-                if variable_line == "":
-                    variable_line = "\n"
-                assert variable_line.endswith("\n"), repr(variable_line)
-                lines.append(variable_line)
-            last_line = lines[-1]
-            words = last_line.split()
-            site = words.index("%*%")
-            last_line = " ".join(words[:site])
-            last_line = abjad.tag.tag([last_line], tag=tag)[0]
-            last_line += "\n"
-            lines[-1] = last_line
-            if i < total - 1:
-                lines.append("\n")
-                lines.append("\n")
-        if realign is not None:
-            lines_ = []
-            for line in lines:
-                line_ = abjad.LilyPondFormatManager.align_tags(line, n=realign)
-                lines_.append(line_)
-            lines = lines_
-        text = "".join(lines)
-        include_path.write_text(text)
+                            self._write_extern_lines(score, [dereference], realign)
+                    if not found_score:
+                        lines = self._get_extern_preamble(preamble_lines, include_line)
+                        self._write_extern_lines(score, lines, realign)
+            os.replace(str(score_path_), str(score_path))
+            os.replace(str(include_path_), str(include_path))
+        except BaseException:
+            for path in temporary_paths:
+                path.remove()
+            raise
 
     def get_asset_type(self) -> str:
         """
@@ -825,22 +1263,14 @@ class Path(pathlib.PosixPath):
     def get_metadata(self, file_name="__metadata__.py") -> abjad.OrderedDict:
         """
         Gets __metadata__.py file in path.
+
+        Caches metadata on file path, modification time and size, except for
+        files modified within the last second; evaluates storage-format
+        metadata without executing the file when possible.
+        Includes pending writes when metadata transaction is open.
         """
-        metadata_py_path = self / file_name
-        metadata = None
-        if metadata_py_path.is_file():
-            file_contents_string = metadata_py_path.read_text()
-            try:
-                result = abjad.iox.execute_string(
-                    file_contents_string, attribute_names=("metadata",)
-                )
-            except NameError as e:
-                raise Exception(repr(metadata_py_path), e)
-            if result:
-                metadata = result[0]
-            else:
-                metadata = None
-        return abjad.OrderedDict(metadata)
+        metadata = self._get_metadata(file_name)
+        return abjad.OrderedDict(copy.deepcopy(metadata))
 
     def get_metadatum(
         self,
@@ -859,11 +1289,11 @@ class Path(pathlib.PosixPath):
             True
 
         """
-        metadata = self.get_metadata(file_name=file_name)
+        metadata = self._get_metadata(file_name) or {}
         metadatum = metadata.get(metadatum_name)
         if not metadatum:
-            metadatum = default
-        return metadatum
+            return default
+        return copy.deepcopy(metadatum)
 
     def get_name_predicate(self) -> typing.Optional[typing.Callable]:
         """
@@ -930,13 +1360,13 @@ class Path(pathlib.PosixPath):
         path: typing.Optional[Path] = None
         if self.is_segment():
             if self.segments is not None:
-                paths = self.segments.list_paths()
+                paths, positions = self.segments._get_listing()
             else:
-                paths = []
+                paths, positions = (), {}
             if self == paths[-1] and not cyclic:
                 path = None
             else:
-                index = paths.index(self)
+                index = positions[self.name]
                 cyclic_paths = abjad.CyclicTuple(paths)
                 path = cyclic_paths[index + 1]
         elif self.is_segments():
@@ -966,16 +1396,16 @@ class Path(pathlib.PosixPath):
             if wrappers:
                 return wrappers[0]
         if self.scores is not None:
-            wrappers = self.scores.list_paths()
+            wrappers, positions = self.scores._get_listing()
         else:
-            wrappers = []
+            wrappers, positions = (), {}
         if not wrappers:
             return None
         wrapper = self.wrapper
         if wrapper == wrappers[-1] and not cyclic:
             return None
         assert isinstance(wrapper, Path)
-        index = wrappers.index(wrapper)
+        index = positions[wrapper.name]
         cyclic_wrappers = abjad.CyclicTuple(wrappers)
         return cyclic_wrappers[index + 1]
 
@@ -994,9 +1424,9 @@ class Path(pathlib.PosixPath):
             return None
         if self.is_segment():
             if self.segments is not None:
-                paths = self.segments.list_paths()
+                paths, positions = self.segments._get_listing()
             else:
-                paths = []
+                paths, positions = (), {}
             if not paths:
                 print(type(self))
                 print(self)
@@ -1008,7 +1438,7 @@ class Path(pathlib.PosixPath):
             if self == paths[0] and not cyclic:
                 path = None
             else:
-                index = paths.index(self)
+                index = positions[self.name]
                 cyclic_paths = abjad.CyclicTuple(paths)
                 path = cyclic_paths[index - 1]
         elif self.is_segments():
@@ -1038,16 +1468,16 @@ class Path(pathlib.PosixPath):
             if wrappers:
                 return wrappers[-1]
         if self.scores is not None:
-            wrappers = self.scores.list_paths()
+            wrappers, positions = self.scores._get_listing()
         else:
-            wrappers = []
+            wrappers, positions = (), {}
         if not wrappers:
             return None
         wrapper = self.wrapper
         if wrapper == wrappers[0] and not cyclic:
             return None
         assert wrapper is not None
-        index = wrappers.index(wrapper)
+        index = positions[wrapper.name]
         cyclic_wrappers = abjad.CyclicTuple(wrappers)
         return cyclic_wrappers[index - 1]
 
@@ -1171,6 +1601,7 @@ class Path(pathlib.PosixPath):
             return True
         return False
 
+    @_memoize
     def is_contents(self) -> bool:
         """
         Is true when path is contents directory.
@@ -1223,6 +1654,7 @@ class Path(pathlib.PosixPath):
         """
         return self.name == "etc"
 
+    @_memoize
     def is_external(self) -> bool:
         """
         Is true when path is not a score package path.
@@ -1276,6 +1708,7 @@ class Path(pathlib.PosixPath):
             return True
         return False
 
+    @_memoize(metadata=True)
     def is_part(self) -> bool:
         """
         Is true when directory is part directory.
@@ -1294,6 +1727,7 @@ class Path(pathlib.PosixPath):
         """
         return self.parent.is_parts()
 
+    @_memoize(metadata=True)
     def is_parts(self) -> bool:
         """
         Is true when directory is parts directory.
@@ -1318,6 +1752,7 @@ class Path(pathlib.PosixPath):
         else:
             return False
 
+    @_memoize(metadata=True)
     def is_score_build(self) -> bool:
         """
         Is true when directory is score build directory.
@@ -1422,6 +1857,7 @@ class Path(pathlib.PosixPath):
             return True
         return False
 
+    @_memoize
     def is_scores(self) -> bool:
         """
         Is true when path is scores directory.
@@ -1485,6 +1921,7 @@ class Path(pathlib.PosixPath):
         """
         return self.name == "stylesheets"
 
+    @_memoize
     def is_wrapper(self) -> bool:
         """
         Is true when path is wrapper directory
@@ -1494,7 +1931,7 @@ class Path(pathlib.PosixPath):
         else:
             return False
 
-    def list_paths(self) -> typing.List["Path"]:
+    def list_paths(self) -> typing.Tuple["Path", ...]:
         """
         Lists paths.
 
@@ -1502,67 +1939,13 @@ class Path(pathlib.PosixPath):
 
             >>> path = ide.Path("/path/to/scores/my_score/my_score")
             >>> path.list_paths()
-            []
+            ()
 
+        Caches listing on directory inode and modification time.
         """
-        paths: typing.List["Path"] = []
         if not self.exists():
-            return paths
-        predicate = self.get_name_predicate()
-        is_external = self.is_external()
-        is_segments = self.is_segments()
-        names = []
-        for name in sorted([_.name for _ in self.iterdir()]):
-            name = abjad.String(name)
-            if name.startswith("_") and not (is_external or is_segments):
-                continue
-            if name in (".DS_Store", ".cache", ".git", ".gitmodules"):
-                continue
-            if name in ("__init__.py", "__pycache__"):
-                continue
-            if (
-                predicate is not None
-                and not predicate(name)
-                and name != "_assets"
-                and name != "_segments"
-            ):
-                continue
-            if name == "stylesheet.ily" and self.is_stylesheets():
-                pass
-            elif name in self._secondary_names:
-                continue
-            path = self / name
-            try:
-                path.relative_to(self)
-            except ValueError:
-                continue
-            names.append(name)
-        if is_segments:
-            names = [_ for _ in names if not _.endswith("backup")]
-            names = [_ for _ in names if not _.startswith(".")]
-            names = Path.sort_segment_names(names)
-        if self.is__segments():
-            prefix = "segment-"
-            names = [_ for _ in names if _.startswith(prefix)]
-            single_character_names, double_character_names = [], []
-            for name in names:
-                segment_name = name[len(prefix) :]
-                segment_name = segment_name.replace("-", "_")
-                if segment_name.endswith(".ly"):
-                    segment_name = segment_name[:-3]
-                elif segment_name.endswith(".ily"):
-                    segment_name = segment_name[:-4]
-                else:
-                    raise ValueError(segment_name)
-                if len(segment_name) == 1:
-                    single_character_names.append(name)
-                elif len(segment_name) == 2:
-                    double_character_names.append(name)
-                else:
-                    raise NotImplementedError(segment_name)
-            names = single_character_names + double_character_names
-        paths = [self / _ for _ in names]
-        return paths
+            return ()
+        return self._get_listing()[0]
 
     def list_secondary_paths(self) -> typing.List["Path"]:
         """
@@ -1583,6 +1966,35 @@ class Path(pathlib.PosixPath):
                 paths.append(type(self)(path))
         return paths
 
+    @contextlib.contextmanager
+    def metadata_transaction(self) -> typing.Iterator[None]:
+        """
+        Makes metadata transaction context manager.
+
+        Gathers metadata writes made inside the transaction and flushes each
+        metadata file once, on exit, by writing a temporary file and renaming
+        it. Discards gathered writes when the block raises. Nested transactions
+        join the outermost transaction. Each thread has its own transaction.
+        """
+        if Path._get_pending_metadata() is not None:
+            yield
+            return
+        Path._metadata_transaction.pending = {}
+        try:
+            yield
+            pending = Path._metadata_transaction.pending
+        finally:
+            Path._metadata_transaction.pending = None
+        for (
+            metadata_py_path,
+            metadata,
+            import_statements,
+            variable_name,
+        ) in pending.values():
+            self._write_metadata_py(
+                metadata_py_path, metadata, import_statements, variable_name
+            )
+
     def remove(self) -> None:
         """
         Removes path if it exists.
@@ -1609,6 +2021,9 @@ class Path(pathlib.PosixPath):
         """
         Sorts segment name ``strings``.
 
+        Underscore segments sort first; then segments sort by letter length,
+        letter and rank.
+
         ..  container:: example
 
             >>> strings = ['AA', 'Z', '_11', '_9']
@@ -1616,40 +2031,8 @@ class Path(pathlib.PosixPath):
             ['_9', '_11', 'Z', 'AA']
 
         """
-        names = []
-        for string in strings:
-            name = abjad.String(string)
-            names.append(name)
-
-        def _compare(name_1, name_2):
-            letter_1 = name_1.segment_letter()
-            letter_2 = name_2.segment_letter()
-            rank_1 = name_1.segment_rank()
-            rank_2 = name_2.segment_rank()
-            if letter_1 == letter_2:
-                if rank_1 < rank_2:
-                    return -1
-                if rank_1 == rank_2:
-                    return 0
-                if rank_1 > rank_2:
-                    return 1
-            if letter_1 == "_":
-                return -1
-            if letter_2 == "_":
-                return 1
-            if len(letter_1) == len(letter_2):
-                if letter_1 < letter_2:
-                    return -1
-                if letter_2 < letter_1:
-                    return 1
-            if len(letter_1) < len(letter_2):
-                return -1
-            assert len(letter_2) < len(letter_1)
-            return 1
-
-        names_ = abjad.TypedList(names)
-        names_.sort(cmp=_compare)
-        return list(names_)
+        strings = sorted(strings, key=Path._get_segment_sort_key)
+        return [abjad.String(_) for _ in strings]
 
     def segment_number_to_path(self, number) -> typing.Optional["Path"]:
         """
@@ -1662,9 +2045,9 @@ class Path(pathlib.PosixPath):
 
         """
         assert self.segments is not None
-        for path in sorted(self.segments.glob("*")):
-            if not path.is_dir():
-                continue
+        if not self.segments.is_dir():
+            return None
+        for path in self.segments._get_listing()[0]:
             if not path.name.startswith("segment_"):
                 continue
             body = path.name[8:]
@@ -1672,8 +2055,8 @@ class Path(pathlib.PosixPath):
                 number_ = int(body)
             except ValueError:
                 continue
-            if number_ == number:
-                return type(self)(path)
+            if number_ == number and path.is_dir():
+                return path
         return None
 
     def trim(self) -> str:
@@ -1710,30 +2093,33 @@ class Path(pathlib.PosixPath):
     def update_order_dependent_segment_metadata(self) -> None:
         """
         Updates order-dependent segment metadata.
+
+        Writes each segment metadata file once.
         """
         assert self.segments is not None
         paths = self.segments.list_paths()
         if not paths:
             return
         segment_count = len(paths)
-        for segment_index, path in enumerate(paths):
-            segment_number = segment_index + 1
-            path.add_metadatum("segment_number", segment_number)
-            path.add_metadatum("segment_count", segment_count)
-        path = paths[0]
-        first_bar_number = 1
-        path.add_metadatum("first_bar_number", first_bar_number)
-        measure_count = path.get_metadatum("measure_count")
-        if not measure_count:
-            return
-        next_bar_number = first_bar_number + measure_count
-        for path in paths[1:]:
-            first_bar_number = next_bar_number
-            path.add_metadatum("first_bar_number", next_bar_number)
+        with self.metadata_transaction():
+            for segment_index, path in enumerate(paths):
+                segment_number = segment_index + 1
+                path.add_metadatum("segment_number", segment_number)
+                path.add_metadatum("segment_count", segment_count)
+            path = paths[0]
+            first_bar_number = 1
+            path.add_metadatum("first_bar_number", first_bar_number)
             measure_count = path.get_metadatum("measure_count")
             if not measure_count:
                 return
             next_bar_number = first_bar_number + measure_count
+            for path in paths[1:]:
+                first_bar_number = next_bar_number
+                path.add_metadatum("first_bar_number", next_bar_number)
+                measure_count = path.get_metadatum("measure_count")
+                if not measure_count:
+                    return
+                next_bar_number = first_bar_number + measure_count
 
     def with_name(self, name) -> "Path":
         """
@@ -1763,6 +2149,41 @@ class Path(pathlib.PosixPath):
             path /= part
         return path
 
+    def write_tag_view(
+        self,
+        target,
+        operations: typing.Sequence[
+            typing.Tuple[typing.Union[abjad.Tag, typing.Callable], bool]
+        ],
+    ) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Writes copy of path to ``target`` with tag ``operations`` applied.
+
+        Operations are pairs of tag and deactivate flag, applied in order as by
+        ``activate_tags()``. Copies other files unchanged. Reads each LilyPond
+        file once and writes its copy once; leaves path untouched.
+
+        Returns count and skipped count of each operation.
+        """
+        for tag, _ in operations:
+            if isinstance(tag, str):
+                raise Exception(f"must be tag or callable: {tag!r}")
+        target = type(self)(target)
+        if self.is_dir():
+            paths = {str(_) for _ in self._list_activation_paths()}
+
+            def ignore(directory, names):
+                ignored = [TagIndex._file_name]
+                for name in names:
+                    if os.path.join(directory, name) in paths:
+                        ignored.append(name)
+                return ignored
+
+            shutil.copytree(str(self), str(target), ignore=ignore)
+        elif not self._list_activation_paths():
+            shutil.copyfile(str(self), str(target))
+        return self._apply_tag_operations(operations, target=target)
+
     def write_metadata_py(
         self,
         metadata,
@@ -1773,24 +2194,22 @@ class Path(pathlib.PosixPath):
     ) -> None:
         """
         Writes ``metadata`` to metadata file in current directory.
+
+        Formats with black in process; does not rewrite file when formatted
+        text matches file contents. Defers write to end of metadata transaction
+        when transaction is open.
         """
         metadata_py_path = self / file_name
-        lines = []
-        for line in import_statements:
-            lines.append(line)
-        lines.append("")
-        lines.append("")
-        dictionary = abjad.OrderedDict(metadata)
-        items = list(dictionary.items())
-        items.sort()
-        dictionary = abjad.OrderedDict(items)
-        if dictionary:
-            line = abjad.storage(dictionary)
-            line = f"{variable_name} = {line}"
-            lines.append(line)
-        else:
-            lines.append(f"{variable_name} = abjad.OrderedDict()")
-        lines.append("")
-        text = "\n".join(lines)
-        metadata_py_path.write_text(text)
-        os.system(f"black --target-version=py38 {metadata_py_path} > /dev/null 2>&1")
+        pending = Path._get_pending_metadata()
+        if pending is not None:
+            metadata = abjad.OrderedDict(copy.deepcopy(metadata))
+            pending[str(metadata_py_path)] = (
+                metadata_py_path,
+                metadata,
+                import_statements,
+                variable_name,
+            )
+            return
+        self._write_metadata_py(
+            metadata_py_path, metadata, import_statements, variable_name
+        )
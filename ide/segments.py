@@ -1,15 +1,31 @@
+import contextlib
+import datetime
+import hashlib
 import importlib
+import io
+import os
+import runpy
+import shutil
+import subprocess
+import sys
+import traceback
 import typing
 
 import abjad
 
 from . import pathx
+from .LilyPondLog import LilyPondLog
+from .Profiler import Profiler
+from .TagIndex import TagIndex
 
 token_type = typing.Union[None, int, abjad.typings.IntegerPair, typing.List[int]]
 
 callable_type = typing.Union[str, typing.Callable, None]
 activation_type = typing.Tuple[callable_type, str]
 
+# queue the maker worker streams stdout lines to (set in the worker only):
+_maker_output = None
+
 
 class Job:
     """
@@ -158,6 +174,27 @@ class Job:
         """
         return abjad.StorageFormatManager(self).get_repr_format()
 
+    ### PRIVATE METHODS ###
+
+    def _get_operations(self):
+        operations = []
+        if self.deactivate_first is True and self.deactivate is not None:
+            assert isinstance(self.deactivate, tuple)
+            match, name = self.deactivate
+            if match is not None:
+                operations.append((match, name, True))
+        if self.activate is not None:
+            assert isinstance(self.activate, tuple)
+            match, name = self.activate
+            if match is not None:
+                operations.append((match, name, False))
+        if self.deactivate_first is not True and self.deactivate is not None:
+            assert isinstance(self.deactivate, tuple)
+            match, name = self.deactivate
+            if match is not None:
+                operations.append((match, name, True))
+        return operations
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -2133,6 +2170,38 @@ class PersistentOverride:
         return self._value
 
 
+class _LineStream(io.StringIO):
+    """
+    String buffer that also puts each complete line on ``queue`` as it is
+    written.
+    """
+
+    def __init__(self, queue) -> None:
+        super().__init__()
+        self._queue = queue
+        self._partial = ""
+
+    def flush(self) -> None:
+        """
+        Puts partial last line on queue.
+        """
+        super().flush()
+        if self._partial:
+            self._queue.put(self._partial)
+            self._partial = ""
+
+    def write(self, string) -> int:
+        """
+        Writes ``string``; puts completed lines on queue.
+        """
+        count = super().write(string)
+        lines = (self._partial + string).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._queue.put(line)
+        return count
+
+
 ### FUNCTIONS ####
 
 
@@ -2209,6 +2278,22 @@ def _global_rest_identifiers(path) -> typing.List[abjad.String]:
     return identifiers
 
 
+def _hash_file(path) -> str:
+    if not path.is_file():
+        return "missing"
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def _import_maker_libraries(output=None) -> None:
+    global _maker_output
+    _maker_output = output
+    for name in ("abjad", "baca", "ide"):
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
 def _import_score_package(path):
     assert path.is_score_package_path()
     try:
@@ -2285,6 +2370,19 @@ def _part_name_to_default_clef(path, part_name):
     return clef
 
 
+def _read_segment_fingerprint(path) -> typing.Optional[abjad.OrderedDict]:
+    fingerprint_path = path / ".fingerprint"
+    if not fingerprint_path.is_file():
+        return None
+    fingerprint = abjad.OrderedDict()
+    for line in fingerprint_path.read_text().splitlines():
+        if not line.strip():
+            continue
+        digest, label = line.split(maxsplit=1)
+        fingerprint[label] = digest
+    return fingerprint
+
+
 def get_measure_profile_metadata(path) -> typing.Tuple[int, int, list]:
     """
     Gets measure profile metadata.
@@ -2412,6 +2510,75 @@ def get_preamble_time_signatures(path) -> typing.Optional[typing.List[str]]:
     return None
 
 
+def get_segment_fingerprint(path) -> abjad.OrderedDict:
+    """
+    Gets segment fingerprint.
+
+    Hashes the inputs of segment ``path``: ``definition.py``, ``layout.py``,
+    segment metadata and persist files, metadata and persist files of the
+    previous segment, Python modules in the score package, stylesheets and the
+    segment PDF maker boilerplate.
+
+    Returns dictionary of contents-relative labels to SHA-1 digests.
+    """
+    assert path.is_segment(), repr(path)
+    contents = path.contents
+    paths = []
+    for name in ("definition.py", "layout.py", "__metadata__.py", "__persist__.py"):
+        paths.append(path / name)
+    previous_segment = path.get_previous_package()
+    if previous_segment is not None:
+        paths.append(previous_segment / "__metadata__.py")
+        paths.append(previous_segment / "__persist__.py")
+    excluded = ("builds", "distribution", "etc", "segments", "test")
+    for path_ in sorted(contents.glob("**/*.py")):
+        if path_.relative_to(contents).parts[0] in excluded:
+            continue
+        paths.append(path_)
+    if contents.stylesheets.is_dir():
+        for path_ in sorted(contents.stylesheets.iterdir()):
+            if path_.is_file():
+                paths.append(path_)
+    fingerprint = abjad.OrderedDict()
+    for path_ in paths:
+        label = str(path_.relative_to(contents))
+        fingerprint[label] = _hash_file(path_)
+    boilerplate = pathx.Path(__file__).parent.parent / "boilerplate"
+    maker = boilerplate / "__make_segment_pdf__.py"
+    fingerprint[f"boilerplate/{maker.name}"] = _hash_file(maker)
+    return fingerprint
+
+
+def get_segment_rebuild_reason(path) -> typing.Optional[str]:
+    """
+    Gets reason segment ``path`` must be rebuilt.
+
+    Returns none when segment illustration is up to date.
+    """
+    assert path.is_segment(), repr(path)
+    for name in ("illustration.ly", "illustration.pdf"):
+        if not (path / name).is_file():
+            return f"missing {name}"
+    old_fingerprint = _read_segment_fingerprint(path)
+    if old_fingerprint is None:
+        return "no recorded fingerprint"
+    new_fingerprint = get_segment_fingerprint(path)
+    labels = []
+    for label, digest in new_fingerprint.items():
+        if old_fingerprint.get(label) != digest:
+            labels.append(label)
+    for label in old_fingerprint:
+        if label not in new_fingerprint:
+            labels.append(label)
+    if not labels:
+        return None
+    if len(labels) == 1:
+        return f"{labels[0]} changed"
+    if len(labels) <= 3:
+        return f"{', '.join(labels)} changed"
+    return f"{', '.join(labels[:3])} and {len(labels) - 3} more changed"
+
+
 def global_skip_identifiers(path) -> typing.List[abjad.String]:
     """
     Gets global skip identifiers.
@@ -2490,27 +2657,317 @@ def remove_lilypond_warnings(
 ) -> None:
     """
     Removes LilyPond warnings from ``.log``.
+
+    Streams ``.log`` through a LilyPond log filter to a temporary file.
     """
     assert path.name == ".log", repr(path)
-    lines = []
-    skip = 0
-    with open(path) as pointer:
-        for line in pointer.readlines():
-            if 0 < skip:
-                skip -= 1
-                continue
-            if crescendo_too_small and "crescendo too small" in line:
-                skip = 2
-                continue
-            if decrescendo_too_small and "decrescendo too small" in line:
-                skip = 2
-                continue
-            if overwriting_glissando and "overwriting glissando" in line:
-                skip = 1
+    suppress = []
+    if crescendo_too_small:
+        suppress.append("crescendo too small")
+    if decrescendo_too_small:
+        suppress.append("decrescendo too small")
+    if overwriting_glissando:
+        suppress.append("overwriting glissando")
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(str(path), errors="ignore") as source:
+        with open(temporary_path, "w") as target:
+            log = LilyPondLog(pointer=target, suppress=suppress)
+            for line in source:
+                log.feed(line)
+    os.replace(temporary_path, str(path))
+
+
+def run_jobs(jobs: typing.Sequence[Job]) -> typing.List[typing.List[abjad.String]]:
+    """
+    Runs ``jobs`` in a single read / transform / write pass per file.
+
+    Reads each LilyPond file touched by any job once; applies the activations
+    and deactivations of every job to the file text in job order; writes the
+    file once (and only when text changes). Uses tag index to skip files and
+    lines that do not match.
+
+    Returns one list of messages per job; messages are identical to those
+    returned by calling each job in turn.
+    """
+    operations = []
+    files: typing.Dict[pathx.Path, None] = {}
+    for job in jobs:
+        assert isinstance(job.path, pathx.Path), repr(job)
+        paths = job.path._list_activation_paths(skip_file_name=job.skip_file_name)
+        paths = set(paths)
+        for path in sorted(paths):
+            files[path] = None
+        operations_ = []
+        for match, name, undo in job._get_operations():
+            operations_.append([match, name, undo, paths, 0, 0])
+        operations.append(operations_)
+    indices: typing.Dict[str, TagIndex] = {}
+    for path in sorted(files):
+        index = TagIndex.for_directory(path.parent)
+        indices[index.directory] = index
+        lines: typing.Dict[int, str] = {}
+        changed = False
+        for job, operations_ in zip(jobs, operations):
+            for operation in operations_:
+                match, name, undo, paths = operation[:4]
+                if path not in paths:
+                    continue
+                numbers = [_[0] for _ in index.get_lines(path, match)]
+                if not numbers:
+                    continue
+                missing = [_ for _ in numbers if _ not in lines]
+                lines.update(index.read_lines(path, missing))
+                count, skipped = path._activate_lines(
+                    lines,
+                    numbers,
+                    match,
+                    prepend_empty_chord=job.prepend_empty_chord,
+                    undo=undo,
+                )
+                if count:
+                    changed = True
+                operation[4] += count
+                operation[5] += skipped
+        if changed:
+            index.write_lines(path, lines)
+    for index in indices.values():
+        index.write()
+    result = []
+    for job, operations_ in zip(jobs, operations):
+        messages = []
+        if job.title is not None:
+            messages.append(abjad.String(job.title).capitalize_start())
+        total_count = 0
+        for match, name, undo, paths, count, skipped in operations_:
+            messages_ = pathx.Path._get_activation_messages(
+                count, skipped, name, indent=1, message_zero=True, undo=undo
+            )
+            messages.extend(messages_)
+            total_count += count
+        if total_count == 0 and not job.message_zero:
+            messages = []
+        result.append(messages)
+    return result
+
+
+def run_lilypond(
+    path, log, suppress: typing.Sequence[str] = LilyPondLog.noisy_categories
+) -> typing.Tuple[bool, LilyPondLog]:
+    """
+    Runs LilyPond on ``path`` and streams output to ``log``.
+
+    Writes date to first line of ``log``. Then classifies LilyPond output
+    line by line as it arrives, dropping ``suppress`` categories; never
+    buffers whole output or rewrites ``log``.
+
+    Returns success and LilyPond log.
+    """
+    path = str(path)
+    lilypond = abjad.Configuration().get("lilypond_path")
+    if not lilypond:
+        executables = abjad.iox.find_executable("lilypond")
+        lilypond = executables[0] if executables else "lilypond"
+    base = os.path.splitext(path)[0]
+    command = [lilypond, "-dno-point-and-click", "-o", base, path]
+    with open(str(log), "w") as pointer:
+        pointer.write(datetime.datetime.now().strftime("%c") + "\n")
+        lilypond_log = LilyPondLog(pointer=pointer, suppress=suppress)
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+            errors="ignore",
+        )
+        assert process.stdout is not None
+        for line in process.stdout:
+            lilypond_log.feed(line)
+        process.wait()
+    try:
+        os.remove(base + ".ps")
+    except OSError:
+        pass
+    return process.returncode == 0, lilypond_log
+
+
+def run_part_lilypond(path, operations) -> typing.Tuple[bool, int]:
+    """
+    Runs LilyPond on part ``music.ly`` at ``path`` in a scratch copy of the
+    parts directory.
+
+    Copies the parts directory (without PDFs, other parts' directories or
+    anything but ``.ly`` and ``.ily`` files of this part) to a hidden sibling
+    directory, writing ``_segments`` as a tag view with ``operations`` (pairs
+    of tag and deactivate flag) applied in one pass. Runs LilyPond there and
+    moves PDF and log back to the part directory. Leaves the parts
+    directory's tags untouched, so any number of parts can run at once in
+    worker processes, while LaTeX writes and removes files in the part
+    directory.
+
+    Returns success and LilyPond runtime in seconds.
+    """
+    path = pathx.Path(path)
+    assert path.is_file(), repr(path)
+    part_directory = path.parent
+    parts_directory = part_directory.parent
+    scratch = f".{parts_directory.name}-{part_directory.name}"
+    scratch = pathx.Path(parts_directory.parent / scratch)
+
+    def ignore(directory, names):
+        if os.path.samefile(directory, str(part_directory)):
+            return [_ for _ in names if not _.endswith((".ily", ".ly"))]
+        ignored = [_ for _ in names if _.endswith(".pdf")]
+        if os.path.samefile(directory, str(parts_directory)):
+            for name in names:
+                if name == part_directory.name:
+                    continue
+                if os.path.isdir(os.path.join(directory, name)):
+                    ignored.append(name)
+        return ignored
+
+    if scratch.exists():
+        shutil.rmtree(str(scratch))
+    shutil.copytree(str(parts_directory), str(scratch), ignore=ignore)
+    success, seconds = False, 0.0
+    try:
+        operations = [(abjad.Tag(_), deactivate) for _, deactivate in operations]
+        source, target = parts_directory / "_segments", scratch / "_segments"
+        source.write_tag_view(target, operations)
+        ly = scratch / part_directory.name / path.name
+        log = ly.parent / ".log"
+        with abjad.TemporaryDirectoryChange(directory=ly.parent):
+            with abjad.Timer() as timer:
+                success, _ = run_lilypond(ly, log)
+            seconds = timer.elapsed_time
+        if log.is_file():
+            os.replace(str(log), str(part_directory / ".log"))
+        pdf = ly.with_suffix(".pdf")
+        if pdf.is_file():
+            os.replace(str(pdf), str(path.with_suffix(".pdf")))
+        else:
+            success = False
+    finally:
+        shutil.rmtree(str(scratch))
+    return success, int(seconds)
+
+
+def run_segment_lilypond(path) -> typing.Tuple[bool, float]:
+    """
+    Runs LilyPond on ``illustration.ly`` in segment ``path``.
+
+    Safe to call in a worker process: changes to segment directory for the
+    duration of the run and writes LilyPond output only to the segment's
+    ``.log``.
+
+    Returns success and LilyPond runtime in seconds.
+    """
+    path = pathx.Path(path)
+    assert path.is_segment(), repr(path)
+    illustration_ly = path / "illustration.ly"
+    assert illustration_ly.is_file(), repr(illustration_ly)
+    log = path / ".log"
+    with abjad.TemporaryDirectoryChange(directory=path):
+        with abjad.Timer() as timer:
+            success, _ = run_lilypond(illustration_ly, log)
+    return success, timer.elapsed_time
+
+
+def run_segment_maker(
+    path,
+) -> typing.Tuple[typing.List[str], typing.List[str], int, typing.Dict]:
+    """
+    Runs maker script ``path`` in the current interpreter.
+
+    Meant for the IDE's long-lived maker worker: runs ``path`` as
+    ``__main__`` from its own directory and then forgets every module
+    imported from the score (``definition``, ``__metadata__``,
+    ``__persist__``, score package modules) so that the next maker imports
+    them fresh. Libraries like abjad and baca stay imported.
+
+    Puts stdout lines on the worker's output queue as they are printed, then
+    none once the maker is done, when the worker was started with a queue.
+
+    Returns stdout lines, stderr lines, exit code and the CPU time the maker
+    and its subprocesses spent in this process (as keywords of
+    ``Profiler.add_maker_times()``).
+    """
+    path = pathx.Path(path)
+    directory = path.parent
+    start = Profiler.get_maker_times()
+    if directory.is_score_package_path() and directory.wrapper is not None:
+        root = os.path.realpath(str(directory.wrapper))
+    else:
+        root = os.path.realpath(str(directory))
+    argv, sys_path = sys.argv, list(sys.path)
+    sys.argv = [str(path)]
+    sys.path.insert(0, str(directory))
+    importlib.invalidate_caches()
+    if _maker_output is None:
+        stdout = io.StringIO()
+    else:
+        stdout = _LineStream(_maker_output)
+    stderr = io.StringIO()
+    try:
+        with abjad.TemporaryDirectoryChange(directory=directory):
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    runpy.run_path(str(path), run_name="__main__")
+                    exit_code = 0
+                except SystemExit as exception:
+                    if exception.code is None:
+                        exit_code = 0
+                    elif isinstance(exception.code, int):
+                        exit_code = exception.code
+                    else:
+                        print(exception.code, file=sys.stderr)
+                        exit_code = 1
+                except Exception:
+                    traceback.print_exc()
+                    exit_code = 1
+    finally:
+        sys.argv = argv
+        sys.path[:] = sys_path
+        for name, module in list(sys.modules.items()):
+            file_ = getattr(module, "__file__", None)
+            if not file_:
                 continue
-            lines.append(line)
-    text = "".join(lines)
-    path.write_text(text)
+            if os.path.realpath(file_).startswith(root + os.sep):
+                del sys.modules[name]
+        if _maker_output is not None:
+            stdout.flush()
+            _maker_output.put(None)
+    times = Profiler.get_maker_times()
+    for key, value in times.items():
+        if value is not None and start[key] is not None:
+            times[key] = value - start[key]
+        else:
+            times[key] = None
+    stdout_lines = stdout.getvalue().splitlines()
+    stderr_lines = stderr.getvalue().splitlines()
+    return stdout_lines, stderr_lines, exit_code, times
+
+
+def run_segment_midi_lilypond(path) -> typing.Tuple[bool, float]:
+    """
+    Runs LilyPond on the ``segment.ly`` a deferred MIDI maker wrote in
+    segment ``path``; removes ``segment.ly`` after.
+
+    Safe to call in a worker process, like ``run_segment_lilypond()``.
+
+    Returns success and LilyPond runtime in seconds.
+    """
+    path = pathx.Path(path)
+    assert path.is_segment(), repr(path)
+    ly = path / "segment.ly"
+    assert ly.is_file(), repr(ly)
+    log = path / ".log"
+    try:
+        with abjad.TemporaryDirectoryChange(directory=path):
+            with abjad.Timer() as timer:
+                success, _ = run_lilypond(ly, log)
+    finally:
+        ly.remove()
+    return success, timer.elapsed_time
 
 
 def score_skeleton(path) -> typing.Optional[abjad.Score]:
@@ -2580,3 +3037,15 @@ def score_skeleton(path) -> typing.Optional[abjad.Score]:
         literal = abjad.LilyPondLiteral(strings)
         abjad.attach(literal, staff_group)
     return skeleton
+
+
+def write_segment_fingerprint(path) -> None:
+    """
+    Writes fingerprint of segment ``path`` inputs to ``.fingerprint``.
+    """
+    assert path.is_segment(), repr(path)
+    fingerprint = get_segment_fingerprint(path)
+    lines = [f"{digest}  {label}" for label, digest in fingerprint.items()]
+    lines.append("")
+    fingerprint_path = path / ".fingerprint"
+    fingerprint_path.write_text("\n".join(lines))
@@ -0,0 +1,43 @@
+import ide
+
+abjad_ide = ide.AbjadIDE(test=True)
+scores = ide.configuration.test_scores_directory
+
+
+def test_AbjadIDE_build_part_pdfs_in_parallel_01():
+
+    with ide.Test():
+        parts = ide.Path(scores, "green_score", "green_score", "builds", "arch-a-parts")
+        assert not parts.exists()
+
+        abjad_ide("gre bb new parts arch-a-parts arch~a ARCH-A y q")
+        texts = {_: _.read_text() for _ in sorted(parts._segments.glob("*.ly"))}
+
+        abjad_ide("gre bb arch-a-parts ppp bass q")
+        lines = abjad_ide.io.transcript.lines
+        index = lines.index("Select files to build> bass")
+        lines = lines[index:]
+        for line in [
+            "Building"
+            " green_score/builds/arch-a-parts/bass-clarinet/bass-clarinet.pdf ...",
+            "Interpreting"
+            " green_score/builds/arch-a-parts/bass-clarinet/bass-clarinet-front-cover.tex ...",
+            "Interpreting"
+            " green_score/builds/arch-a-parts/bass-clarinet/bass-clarinet-preface.tex ...",
+            "Interpreting"
+            " green_score/builds/arch-a-parts/bass-clarinet/bass-clarinet-back-cover.tex ...",
+            "Running LilyPond on"
+            " green_score/builds/arch-a-parts/bass-clarinet/bass-clarinet-music.ly ...",
+            " Found"
+            " green_score/builds/arch-a-parts/bass-clarinet/bass-clarinet-music.pdf ...",
+            "Interpreting"
+            " green_score/builds/arch-a-parts/bass-clarinet/bass-clarinet-part.tex ...",
+            "Found"
+            " green_score/builds/arch-a-parts/bass-clarinet/bass-clarinet-part.pdf ...",
+        ]:
+            assert line in lines
+
+        for path, text in texts.items():
+            assert path.read_text() == text
+        scratch = parts.parent / ".arch-a-parts-bass-clarinet"
+        assert not scratch.exists()
@@ -4,6 +4,9 @@ abjad_ide = ide.AbjadIDE(test=True)
 
 
 def test_AbjadIDE_build_score_pdf_01():
+    """
+    Builds every stale artifact.
+    """
 
     scores = ide.configuration.test_scores_directory
     source = ide.Path(scores, "red_score", "red_score", "builds", "letter-score")
@@ -24,8 +27,6 @@ def test_AbjadIDE_build_score_pdf_01():
         index = lines.index("Building score ...")
         assert lines[index:] == [
             "Building score ...",
-            "Interpreting red_score/builds/letter-score music.ly files ...",
-            "Found red_score/builds/letter-score/music.ly ...",
             "Collecting segment lys ...",
             " Writing red_score/builds/letter-score/_segments/segment-01.ily ...",
             " Writing red_score/builds/letter-score/_segments/segment-01.ly ...",
@@ -73,6 +74,9 @@ def test_AbjadIDE_build_score_pdf_01():
             "  Found no METRIC_MODULATION_IS_STRIPPED tags ...",
             " Hiding METRIC_MODULATION_IS_SCALED tags ...",
             "  Found no METRIC_MODULATION_IS_SCALED tags ...",
+            "Interpreting red_score/builds/letter-score music.ly files ...",
+            "Found red_score/builds/letter-score/music.ly ...",
+            "Skipping segment ly collection ...",
             "Checking layout time signatures ...",
             " Found red_score/builds/letter-score/layout.ly ...",
             " Found time signature metadata ...",
@@ -102,3 +106,63 @@ def test_AbjadIDE_build_score_pdf_01():
             "> q",
             "",
         ]
+
+
+def test_AbjadIDE_build_score_pdf_02():
+    """
+    Skips up-to-date artifacts.
+    """
+
+    scores = ide.configuration.test_scores_directory
+    source = ide.Path(scores, "red_score", "red_score", "builds", "letter-score")
+
+    with ide.Test():
+        abjad_ide("red bb let spb q")
+        abjad_ide("red bb let spb q")
+        lines = abjad_ide.io.transcript.lines
+        index = lines.index("Building score ...")
+        assert lines[index:] == [
+            "Building score ...",
+            "Skipping _segments (up to date) ...",
+            "Skipping music.pdf (up to date) ...",
+            "Skipping front-cover.pdf (up to date) ...",
+            "Skipping preface.pdf (up to date) ...",
+            "Skipping back-cover.pdf (up to date) ...",
+            "Skipping score.pdf (up to date) ...",
+            "Opening red_score/builds/letter-score/score.pdf ...",
+            "",
+            "> q",
+            "",
+        ]
+
+        tex = source / "preface.tex"
+        tex.write_text(tex.read_text() + "\n")
+        abjad_ide("red bb let spb q")
+        transcript = abjad_ide.io.transcript
+        assert "Skipping music.pdf (up to date) ..." in transcript
+        assert (
+            "Interpreting red_score/builds/letter-score/preface.tex ..." in transcript
+        )
+        assert "Skipping front-cover.pdf (up to date) ..." in transcript
+        assert "Interpreting red_score/builds/letter-score/score.tex ..." in transcript
+
+
+def test_AbjadIDE_build_score_pdf_03():
+    """
+    Rebuilds score.pdf when score title changes.
+    """
+
+    scores = ide.configuration.test_scores_directory
+    contents = ide.Path(scores, "red_score", "red_score")
+
+    with ide.Test():
+        abjad_ide("red bb let spb q")
+        abjad_ide("red bb let spb q")
+        assert "Skipping score.pdf (up to date) ..." in abjad_ide.io.transcript
+
+        contents.add_metadatum("title", "Red Score Revised")
+        abjad_ide("red bb let spb q")
+        transcript = abjad_ide.io.transcript
+        assert "Skipping score.pdf (up to date) ..." not in transcript
+        assert "Skipping music.pdf (up to date) ..." in transcript
+        assert "Interpreting red_score/builds/letter-score/score.tex ..." in transcript
@@ -0,0 +1,23 @@
+import ide
+
+abjad_ide = ide.AbjadIDE(test=True)
+
+
+def test_AbjadIDE_handle_build_tags_01():
+    """
+    In build directory.
+    """
+
+    with ide.Test():
+
+        abjad_ide("red bb let ggc btags q")
+        lines = abjad_ide.io.transcript.lines
+        for line in [
+            "Handling build tags ...",
+            " Handling edition tags ...",
+            " Handling fermata bar lines ...",
+            " Handling shifted clefs ...",
+            " Handling MOL tags ...",
+        ]:
+            assert line in lines, repr(line)
+        assert lines.count(" Handling edition tags ...") == 2
@@ -0,0 +1,30 @@
+import ide
+
+abjad_ide = ide.AbjadIDE(test=True)
+scores = ide.configuration.test_scores_directory
+
+
+def test_AbjadIDE_make_illustration_pdfs_in_parallel_01():
+    """
+    In segments directory.
+    """
+
+    with ide.Test():
+        directory = ide.Path(scores, "red_score", "red_score", "segments")
+        names = ["01", "02", "03"]
+        for name in names:
+            pdf = directory / name / "illustration.pdf"
+            pdf.remove()
+
+        abjad_ide("red gg ipp q")
+        transcript = abjad_ide.io.transcript
+        for name in names:
+            ly = directory / name / "illustration.ly"
+            pdf = directory / name / "illustration.pdf"
+            maker = directory / name / "__make_segment_pdf__.py"
+            assert f"Making segment {name} PDF ..." in transcript
+            assert f"Running LilyPond on {ly.trim()} ..." in transcript
+            assert f"Found {pdf.trim()} ..." in transcript
+            assert "Opening" not in transcript
+            assert pdf.is_file()
+            assert not maker.exists()
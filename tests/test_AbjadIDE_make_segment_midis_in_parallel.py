@@ -0,0 +1,30 @@
+import ide
+
+abjad_ide = ide.AbjadIDE(test=True)
+scores = ide.configuration.test_scores_directory
+
+
+def test_AbjadIDE_make_segment_midis_in_parallel_01():
+    """
+    In segments directory.
+    """
+
+    with ide.Test():
+        directory = ide.Path(scores, "red_score", "red_score", "segments")
+        names = ["01", "02", "03"]
+        for name in names:
+            midi = directory / name / "segment.midi"
+            midi.remove()
+
+        abjad_ide("red gg midp q")
+        transcript = abjad_ide.io.transcript
+        for name in names:
+            ly = directory / name / "segment.ly"
+            midi = directory / name / "segment.midi"
+            maker = directory / name / "__make_segment_midi__.py"
+            assert f"Running LilyPond on {ly.trim()} ..." in transcript
+            assert f"Found {midi.trim()} ..." in transcript
+            assert "Opening" not in transcript
+            assert midi.is_file()
+            assert not ly.exists()
+            assert not maker.exists()
@@ -354,6 +354,7 @@ def test_AbjadIDE_show_help_09():
         "    illustration.ly - make (ilm)",
         "    illustration.pdf - make (ipm)",
         "    illustration.pdf - nake (ipn)",
+        "    illustration.pdf - update (ipu)",
         "",
         "    hide (hide)",
         "    show (show)",
@@ -403,6 +404,8 @@ def test_AbjadIDE_show_help_10():
         "    illustration.ly - make (ilm)",
         "    illustration.pdf - make (ipm)",
         "    illustration.pdf - nake (ipn)",
+        "    illustration.pdf - parallel (ipp)",
+        "    illustration.pdf - update (ipu)",
         "",
         "    hide (hide)",
         "    show (show)",
@@ -414,6 +417,7 @@ def test_AbjadIDE_show_help_10():
         "",
         "    clicktrack - make (ctm)",
         "    segment.midi - make (midm)",
+        "    segment.midi - parallel (midp)",
         "",
         "    show - column (;)",
         "    show - help (?)",
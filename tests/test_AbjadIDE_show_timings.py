@@ -0,0 +1,38 @@
+import ide
+
+abjad_ide = ide.AbjadIDE(test=True)
+scores = ide.configuration.test_scores_directory
+
+
+def test_AbjadIDE_show_timings_01():
+
+    with ide.Test():
+        etc = ide.Path(scores, "red_score", "red_score", "etc")
+        store = ide.TimingStore(etc)
+        for build, seconds in (("20170101-000000-1", 2), ("20170102-000000-1", 5)):
+            store.record("01", {"maker": 1, "lilypond": 1}, build=build)
+            store.record("02", {"maker": 1, "lilypond": seconds}, build=build)
+        assert len(store.read()) == 4
+
+        abjad_ide("red ee tms q")
+        transcript = abjad_ide.io.transcript
+        assert "Builds ..." in transcript
+        assert "Slowest segments ..." in transcript
+        assert " 02 6.0 s" in transcript
+        assert " 01 2.0 s" in transcript
+        assert "Regressions ..." in transcript
+        lines = [_ for _ in transcript.lines if _.startswith(" 02 6.0 s (median")]
+        assert len(lines) == 1
+        assert "in 20170102-000000-1" in lines[0]
+
+
+def test_AbjadIDE_show_timings_02():
+
+    with ide.Test():
+        etc = ide.Path(scores, "red_score", "red_score", "etc")
+        store = ide.TimingStore(etc)
+        assert not store.read()
+
+        abjad_ide("red ee tms q")
+        transcript = abjad_ide.io.transcript
+        assert f"No timings in {etc.trim()} ..." in transcript
@@ -0,0 +1,34 @@
+import ide
+
+abjad_ide = ide.AbjadIDE(test=True)
+scores = ide.configuration.test_scores_directory
+
+
+def test_AbjadIDE_update_illustration_pdf_01():
+    """
+    In segment directory.
+    """
+
+    with ide.Test():
+        directory = ide.Path(scores, "red_score", "red_score", "segments", "02")
+        fingerprint = directory / ".fingerprint"
+        fingerprint.remove()
+
+        abjad_ide("red gg 02 ipu q")
+        transcript = abjad_ide.io.transcript
+        assert "Rebuilding segment 02 (no recorded fingerprint) ..." in transcript
+        assert "Making segment 02 PDF ..." in transcript
+        assert fingerprint.is_file()
+
+        abjad_ide("red gg 02 ipu q")
+        transcript = abjad_ide.io.transcript
+        assert "Skipping segment 02 (inputs unchanged) ..." in transcript
+        assert "Making segment 02 PDF ..." not in transcript
+
+        definition = directory / "definition.py"
+        definition.write_text(definition.read_text() + "\n")
+        abjad_ide("red gg 02 ipu q")
+        transcript = abjad_ide.io.transcript
+        line = "Rebuilding segment 02 (segments/02/definition.py changed) ..."
+        assert line in transcript
+        assert "Making segment 02 PDF ..." in transcript
@@ -0,0 +1,53 @@
+import os
+import signal
+
+import ide
+
+
+def test_IO_01(capsys):
+    """
+    Buffers displayed lines until buffer fills or context exits.
+    """
+
+    io = ide.IO()
+    with io.buffered():
+        for i in range(63):
+            io.display(f"line {i}", raw=True)
+        assert capsys.readouterr().out == ""
+        io.display("line 63", raw=True)
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == [f"line {i}" for i in range(64)]
+        io.display("line 64", raw=True)
+        assert capsys.readouterr().out == ""
+    assert capsys.readouterr().out == "line 64\n"
+
+
+def test_IO_02(capsys):
+    """
+    Writes buffered lines before prompting.
+    """
+
+    io = ide.IO()
+    io.pending_input("q")
+    with io.buffered():
+        io.display("line", raw=True)
+        assert capsys.readouterr().out == ""
+        assert io.get() == "q"
+        assert capsys.readouterr().out == "line\n> q\n"
+
+
+def test_IO_03(monkeypatch):
+    """
+    Gets terminal width again after terminal resizes.
+    """
+
+    previous = signal.getsignal(signal.SIGWINCH)
+    monkeypatch.setattr(ide.IO, "_watching_terminal", False)
+    monkeypatch.setattr(ide.IO, "_terminal_width_known", False)
+    try:
+        ide.IO._get_terminal_width()
+        assert ide.IO._terminal_width_known
+        os.kill(os.getpid(), signal.SIGWINCH)
+        assert not ide.IO._terminal_width_known
+    finally:
+        signal.signal(signal.SIGWINCH, previous)
@@ -0,0 +1,18 @@
+import ide
+
+
+def test_LilyPondLog_01():
+    """
+    Counts unclassified lines that mention failure.
+    """
+
+    log = ide.LilyPondLog()
+    log.feed("GNU LilyPond 2.19.84\n")
+    log.feed("music.ly:3:1: warning: barcheck failed at: 1/4\n")
+    log.feed("GUILE signaled an error for the expression beginning here\n")
+    log.feed("fatal: could not open stylesheet.ily\n")
+    log.feed("programming error: overwriting glissando\n")
+    log.feed("Layout output to `music.ps' failed\n")
+    assert log.error_count == 0
+    assert log.failure_count == 3
+    assert log.counts == {"warning": 1, "programming error": 1}
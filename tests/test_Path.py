@@ -0,0 +1,102 @@
+import os
+import time
+
+import ide
+
+
+def _age(directory, seconds):
+    stamp = time.time_ns() - seconds * 1_000_000_000
+    os.utime(directory, ns=(stamp, stamp))
+
+
+def test_Path_01(tmp_path):
+    """
+    Lists added and renamed entries of cached directory.
+    """
+
+    directory = ide.Path(tmp_path)
+    (directory / "alpha.txt").write_text("")
+    _age(directory, 10)
+    assert [_.name for _ in directory.list_paths()] == ["alpha.txt"]
+    key = (str(directory), ide.Path._mock_scores)
+    assert key in ide.Path._listing_cache
+
+    (directory / "beta.txt").write_text("")
+    assert [_.name for _ in directory.list_paths()] == ["alpha.txt", "beta.txt"]
+
+    _age(directory, 10)
+    assert [_.name for _ in directory.list_paths()] == ["alpha.txt", "beta.txt"]
+    assert key in ide.Path._listing_cache
+    os.rename(directory / "beta.txt", directory / "gamma.txt")
+    assert [_.name for _ in directory.list_paths()] == ["alpha.txt", "gamma.txt"]
+
+
+def test_Path_02(tmp_path):
+    """
+    Does not cache listing of directory modified within listing margin.
+    """
+
+    directory = ide.Path(tmp_path)
+    (directory / "alpha.txt").write_text("")
+    key = (str(directory), ide.Path._mock_scores)
+    assert [_.name for _ in directory.list_paths()] == ["alpha.txt"]
+    assert key not in ide.Path._listing_cache
+
+    _age(directory, 10)
+    assert [_.name for _ in directory.list_paths()] == ["alpha.txt"]
+    assert key in ide.Path._listing_cache
+
+
+def test_Path_03(tmp_path):
+    """
+    Does not cache metadata of file modified within listing margin.
+    """
+
+    directory = ide.Path(tmp_path)
+    metadata_py = directory / "__metadata__.py"
+    text = 'import abjad\n\nmetadata = abjad.OrderedDict([("title", "{}")])\n'
+    metadata_py.write_text(text.format("A"))
+    assert directory.get_metadatum("title") == "A"
+    assert str(metadata_py) not in ide.Path._metadata_cache
+
+    metadata_py.write_text(text.format("B"))
+    assert directory.get_metadatum("title") == "B"
+
+    _age(metadata_py, 10)
+    assert directory.get_metadatum("title") == "B"
+    assert str(metadata_py) in ide.Path._metadata_cache
+
+
+def test_Path_04(tmp_path):
+    """
+    Adds metadatum to file named by file_name only.
+    """
+
+    directory = ide.Path(tmp_path)
+    directory.add_metadatum("title", "A")
+    directory.add_metadatum("title", "B", file_name="__other__.py")
+    assert directory.get_metadatum("title") == "A"
+    assert directory.get_metadatum("title", file_name="__other__.py") == "B"
+
+
+def test_Path_05(tmp_path):
+    """
+    Reclassifies parts directory when its metadata changes.
+    """
+
+    build = ide.Path(tmp_path) / "builds" / "letter"
+    build.mkdir(parents=True)
+    part = build / "oboe"
+    assert not build.is_parts() and not part.is_part()
+    assert build._segments == build / "_segments"
+
+    build.add_metadatum("parts_directory", True)
+    assert build.is_parts() and part.is_part()
+
+    _age(build / "__metadata__.py", 10)
+    assert build.is_parts() and part.is_part()
+    assert part._segments == build / "_segments"
+
+    build.add_metadatum("parts_directory", False)
+    _age(build / "__metadata__.py", 5)
+    assert not build.is_parts() and not part.is_part()
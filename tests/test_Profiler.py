@@ -0,0 +1,70 @@
+import pstats
+
+import ide
+
+abjad_ide = ide.AbjadIDE(test=True)
+
+
+def test_Profiler_01(monkeypatch, tmp_path):
+    """
+    Profiles outermost command.
+    """
+
+    monkeypatch.setattr(
+        ide.Configuration, "profiles_directory", property(lambda self: tmp_path)
+    )
+    monkeypatch.setenv("IDE_PROFILE", "times")
+    abjad_ide("red ee q")
+    lines = abjad_ide.io.transcript.lines
+    assert any(_.startswith("Profiled ee: wall ") for _ in lines)
+    assert (tmp_path / "profiles.jsonl").is_file()
+
+    monkeypatch.setenv("IDE_PROFILE", "off")
+    abjad_ide("red ee q")
+    lines = abjad_ide.io.transcript.lines
+    assert not any(_.startswith("Profiled ") for _ in lines)
+
+
+def test_Profiler_02(monkeypatch):
+    """
+    Modes.
+    """
+
+    monkeypatch.setenv("IDE_PROFILE", "off")
+    assert ide.Profiler.get_modes() == ()
+
+    monkeypatch.setenv("IDE_PROFILE", "1")
+    assert ide.Profiler.get_modes() == ("times",)
+
+    monkeypatch.setenv("IDE_PROFILE", "stacks, cprofile")
+    assert ide.Profiler.get_modes() == ("times", "stacks", "cprofile")
+
+
+def test_Profiler_03(tmp_path):
+    """
+    Writes summary, pstats and collapsed stacks.
+    """
+
+    profiler = ide.Profiler("mli", modes=("times", "cprofile", "stacks"))
+    with profiler:
+        sum(range(10**6))
+    summary = profiler.summary
+    assert summary["command"] == "mli"
+    assert 0 <= summary["wall"]
+    paths = profiler.write(tmp_path)
+    assert [_.rsplit(".", 1)[-1] for _ in paths] == ["jsonl", "pstats", "stacks"]
+    assert pstats.Stats(paths[1]).total_calls
+
+
+def test_Profiler_04():
+    """
+    Counts CPU time of makers run in maker worker.
+    """
+
+    profiler = ide.Profiler("ipm")
+    with profiler:
+        ide.Profiler.add_maker_times(1.5, subprocess=0.5)
+    summary = profiler.summary
+    assert summary["makers"] == 1.5
+    if summary["subprocess"] is not None:
+        assert 0.5 <= summary["subprocess"]
@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+
+import ide
+
+
+def _git(directory, *arguments):
+    command = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    result = subprocess.run(
+        command + list(arguments),
+        cwd=str(directory),
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    return result.stdout.strip()
+
+
+def test_TimingStore_01(tmp_path):
+    """
+    Records timings under current git revision after HEAD changes.
+    """
+
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "notes.txt").write_text("1\n")
+    _git(tmp_path, "add", "notes.txt")
+    _git(tmp_path, "commit", "-q", "-m", "first")
+    first = _git(tmp_path, "rev-parse", "--short", "HEAD")
+    etc = tmp_path / "etc"
+    store = ide.TimingStore(etc)
+    store.record("01", {"maker": 1})
+
+    (tmp_path / "notes.txt").write_text("2\n")
+    _git(tmp_path, "commit", "-q", "-a", "-m", "second")
+    second = _git(tmp_path, "rev-parse", "--short", "HEAD")
+    assert first != second
+    store.record("01", {"maker": 1})
+
+    with open(store.path) as pointer:
+        revisions = [json.loads(_)["revision"] for _ in pointer]
+    assert revisions == [first, second]
+
+
+def test_TimingStore_02(tmp_path):
+    """
+    Reuses cached revision only while HEAD and its ref keep their mtimes.
+    """
+
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "notes.txt").write_text("1\n")
+    _git(tmp_path, "add", "notes.txt")
+    _git(tmp_path, "commit", "-q", "-m", "first")
+    head = tmp_path / ".git" / "HEAD"
+    ref = tmp_path / ".git" / head.read_text().split()[1]
+    for path in (head, ref):
+        os.utime(path, ns=(0, 0))
+    first = ide.TimingStore._get_revision(tmp_path)
+    assert ide.TimingStore._revisions[str(tmp_path)][1] is not None
+
+    (tmp_path / "notes.txt").write_text("2\n")
+    _git(tmp_path, "commit", "-q", "-a", "-m", "second")
+    second = ide.TimingStore._get_revision(tmp_path)
+    assert second == _git(tmp_path, "rev-parse", "--short", "HEAD")
+    assert first != second